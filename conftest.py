@@ -0,0 +1,23 @@
+import pytest
+
+from unittest.mock import patch
+
+from unit_converter.data_manager import BASE_DIR, DATA_FILES, flush_log
+
+
+# Setup a copy of the unit catalog for every test, so that no test reads or writes files in 'data/'
+# (such as 'catalog.cache' or conversion history), nor depends on files left there by other tests
+@pytest.fixture(autouse=True)
+def catalog_dir(tmp_path_factory):
+    base_dir = tmp_path_factory.mktemp("catalog")
+    path = base_dir / "data"
+    path.mkdir()
+    for file_name in DATA_FILES:
+        (path / f"{file_name}.json").write_text((BASE_DIR / "data" / f"{file_name}.json").read_text())
+    # Entries queued before this test are written before the history is moved
+    flush_log()
+    with patch("unit_converter.data_manager.BASE_DIR", base_dir):
+        with patch("unit_converter.data_manager.LOG_DIR", path / "history"):
+            with patch("unit_converter.data_manager.DATABASE_PATH", path / "history.sqlite3"):
+                yield path
+                flush_log()
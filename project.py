@@ -1,46 +1,150 @@
 import argparse
+import contextlib
+import io
 import json
+import shlex
 import sys
 
 from datetime import datetime, timedelta
 from math import fabs
-from typing import Optional
+from typing import Optional, TextIO
 
-from unit_converter.data_manager import load_data, add_to_log, refactor_value, save_data, zero_division_checker
-from unit_converter.data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, validate_for_history
+from unit_converter.resident import SOCKET_PATH, ResidentServer, forward
+
+# Forwards CLI commands to the resident process, when it's running, before loading anything else
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] != "resident":
+    exit_code: Optional[int] = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+from unit_converter.data_manager import CatalogLoader, batch_changes, load_data, add_to_log, flush_log, get_history, refactor_value, save_data, zero_division_checker, migrate_to_snapshot, export_snapshot
+from unit_converter.data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, HistoryData, validate_for_history
+from unit_converter.result_cache import ResultCache
+from unit_converter.streaming import convert_file, convert_file_parallel, convert_binary_file
 from unit_converter.utils import print_introductory_messages, print_time_instructions, get_users_input, get_unit_group, validate_unit_group, get_converter_units, get_amount, resolve_aliases, parse_time_input, parse_date_input, get_seconds, format_value, calculate_leap_years, validate_date, get_days_from_month, get_index_from_month, gets_days_from_index, print_divider, resolve_month_aliases
 
 
+# Commands that change the unit catalog, which can also be applied from a file
+CATALOG_COMMANDS = ["manage-group", "mg", "manage-type", "mt", "aliases", "a", "change-base", "cb"]
+# Everything a time conversion sets on its 'ConversionData' object, which is restored from cached results
+TIME_RESULT_FIELDS = ["from_time", "to_time", "factor_time", "new_time", "time_format", "time_parts"]
+
+
 def main() -> None:
+    # Handles command-line arguments
+    if len(sys.argv) > 1:
+        # Each dataset is only loaded (and validated) the first time the command uses it
+        data: DataStore = DataStore(loader=CatalogLoader())
+        sys.exit(run_cli(data, sys.argv))  # Exits program after command-line execution
+
     # Handles data loading and validation
     try:
         # Initiates a 'DataStore' object
-        data: DataStore = DataStore(*load_data())
+        data = DataStore(*load_data())
     except (ValueError, FileNotFoundError, json.JSONDecodeError, KeyError) as e:
         print(f"Error: {str(e)}")
         sys.exit(1)  # Exits the program if any error happens
 
-    # Handles command-line arguments
-    try:
-        if len(sys.argv) > 1:
-            handle_cli(data, sys.argv)
-            sys.exit(0)  # Exits program after command-line execution
-    except (ValueError, KeyError, ZeroDivisionError, TypeError) as e:
-        print(f"Error: {e.args[0] if e.args else str(e)}")
-        sys.exit(1)  # Exits the program if any error happens
-
     # Handles interactive approach
     print_introductory_messages()
     get_action(data)
 
 
+def run_cli(data: DataStore, args: list[str]) -> int:
+    """Runs a command-line command, returning its exit code"""
+    try:
+        handle_cli(data, args)
+        return 0
+    except (FileNotFoundError, json.JSONDecodeError, ImportError, OSError) as e:
+        print(f"Error: {str(e)}")
+        return 1  # Exits the program if any error happens
+    except (ValueError, KeyError, ZeroDivisionError, TypeError) as e:
+        print(f"Error: {e.args[0] if e.args else str(e)}")
+        return 1  # Exits the program if any error happens
+
+
 def handle_cli(data: DataStore, args: list[str]) -> None:
     """Handles command-line interface (CLI)"""
     # Creates a copy of all command-line arguments
     formatted_args: list[str] = args[:]
+    parser: argparse.ArgumentParser = build_parser()
+
+    # Parses arguments and calls its respective function
+    parsed_args: argparse.Namespace = parser.parse_args(formatted_args[1:])  # Skips first argument (program's name)
+    # Pipe mode, which keeps answering 'convert' requests until stdin is closed
+    if parsed_args.serve_stdin:
+        serve_stdin(data)
+        return
+    # 'groups' command
+    if parsed_args.command in ["groups", "g"]:
+        message = print_groups(data)
+        print(message)
+    # 'history command
+    elif parsed_args.command in ["history", "h"]:
+        limit: int = parsed_args.limit
+        validate_for_history(data, limit)
+        history_data: HistoryData = HistoryData(
+            unit_group = parsed_args.group.lower() if parsed_args.group else None,
+            since = parsed_args.since,
+            until = parsed_args.until,
+            unit_type = parsed_args.type.lower() if parsed_args.type else None
+        )
+        message = print_history(data, limit, history_data)
+        print(message)
+    # 'types' command
+    elif parsed_args.command in ["types", "t"]:
+        unit_group = parsed_args.unit_group.lower()
+        validate_unit_group(unit_group, data)
+        message = print_types(data, unit_group)
+        print(message)
+    # 'convert' command
+    elif parsed_args.command in ["convert", "c"]:
+        conversion_data: ConversionData = build_conversion_data(data, parsed_args.unit_group, parsed_args.args)
+        message = conversion_logic(data, conversion_data)
+        print(message)
+    # 'manage-group', 'manage-type', 'aliases' and 'change-base' commands
+    elif parsed_args.command in CATALOG_COMMANDS:
+        message = run_catalog_command(data, parsed_args)
+        print(message)
+    # 'snapshot' command
+    elif parsed_args.command == "snapshot":
+        message = manage_snapshot(parsed_args.action.lower(), parsed_args.remove_sources)
+        print(message)
+    # 'convert-file' command
+    elif parsed_args.command == "convert-file":
+        if parsed_args.workers == 1:
+            rows, errors = convert_file(data, parsed_args.input, parsed_args.output, parsed_args.format, parsed_args.group, parsed_args.from_type, parsed_args.to_type, parsed_args.column)
+        else:
+            rows, errors = convert_file_parallel(parsed_args.input, parsed_args.output, parsed_args.workers, parsed_args.format, parsed_args.group, parsed_args.from_type, parsed_args.to_type, parsed_args.column)
+        message = f"{rows} rows converted ({errors} errors)"
+        # Keeps stdout only for converted rows
+        print(message, file=sys.stderr if parsed_args.output in [None, "-"] else sys.stdout)
+    # 'convert-binary' command
+    elif parsed_args.command == "convert-binary":
+        values = convert_binary_file(data, parsed_args.input, parsed_args.group, parsed_args.from_type, parsed_args.to_type, parsed_args.output, parsed_args.dtype)
+        message = f"{values} values converted"
+        print(message)
+    # 'serve' command
+    elif parsed_args.command == "serve":
+        # Imported here, as 'Converter' class imports this file
+        from unit_converter.server import serve
+        print(f"Serving on {parsed_args.socket or f'{parsed_args.host}:{parsed_args.port}'} (Ctrl+C to stop)", file=sys.stderr)
+        serve(parsed_args.host, parsed_args.port, parsed_args.socket, parsed_args.cache_size)
+    # 'resident' command
+    elif parsed_args.command == "resident":
+        print(f"Resident process listening on '{SOCKET_PATH}' (Ctrl+C to stop)", file=sys.stderr)
+        ResidentServer(run_cli).serve_forever()
+    # 'apply' command
+    elif parsed_args.command == "apply":
+        message = apply_operations(data, parsed_args.file)
+        print(message)
+
 
+def build_parser() -> argparse.ArgumentParser:
+    """Defines all commands and arguments available on CLI"""
     # Adds description to program
     parser = argparse.ArgumentParser(prog="Unit Converter", description="Convert multiple types of units")
+    parser.add_argument("--serve-stdin", action="store_true", help="Read one 'convert' request per line from stdin, writing one result line per request to stdout")
 
     # Defines subparser to handle multiple commands
     subparser = parser.add_subparsers(dest="command", help="Available commands")
@@ -49,6 +153,10 @@ def handle_cli(data: DataStore, args: list[str]) -> None:
     # 'history' command
     history_parser = subparser.add_parser("history", aliases=["h"], help="List conversion history (default=10)")
     history_parser.add_argument("--limit", "-l", type=int, default=10, help="Number entries to be printed")
+    history_parser.add_argument("--group", help="Only entries from that unit group")
+    history_parser.add_argument("--since", help="Only entries from that date on (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)")
+    history_parser.add_argument("--until", help="Only entries up to that date (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)")
+    history_parser.add_argument("--type", help="Only entries converted from or to that unit type")
     # 'types' command
     types_parser = subparser.add_parser("types", aliases=["t"], help="List all unit types in a group")
     types_parser.add_argument("unit_group", help="Unit group")
@@ -79,48 +187,99 @@ def handle_cli(data: DataStore, args: list[str]) -> None:
     change_base_parser = subparser.add_parser("change-base", aliases=["cb"], help="Change unit base for a group")
     change_base_parser.add_argument("unit_group", help="Unit group")
     change_base_parser.add_argument("new_base_unit", help="New base unit")
-
-    # Parses arguments and calls its respective function
-    parsed_args: argparse.Namespace = parser.parse_args(formatted_args[1:])  # Skips first argument (program's name)
-    # 'groups' command
-    if parsed_args.command in ["groups", "g"]:
-        message = print_groups(data)
-        print(message)
-    # 'history command
-    elif parsed_args.command in ["history", "h"]:
-        limit: int = parsed_args.limit
-        validate_for_history(data, limit)
-        message = print_history(data, limit)
-        print(message)
-    # 'types' command
-    elif parsed_args.command in ["types", "t"]:
-        unit_group = parsed_args.unit_group.lower()
-        validate_unit_group(unit_group, data)
-        message = print_types(data, unit_group)
-        print(message)
-    # 'convert' command
-    elif parsed_args.command in ["convert", "c"]:
-        validate_unit_group(parsed_args.unit_group.lower(), data)
-        conversion_data: ConversionData = ConversionData(unit_group=parsed_args.unit_group.lower())
-        if conversion_data.unit_group == "time":
-            conversion_data.time_input = " ".join(arg.lower() for arg in parsed_args.args)
-        else:
-            if len(parsed_args.args) not in [2, 3]:
-                raise ValueError("Invalid format for non-time conversion! Usage: <from_type> <to_type> [amount]")
-            conversion_data.from_type = parsed_args.args[0].lower()
-            conversion_data.to_type = parsed_args.args[1].lower()
-            conversion_data.amount = float(parsed_args.args[2]) if len(parsed_args.args) == 3 else 1.0
-        message = conversion_logic(data, conversion_data)
-        print(message)
+    # 'snapshot' command
+    snapshot_parser = subparser.add_parser("snapshot", help="Migrate unit catalog to a single snapshot file, or export it back")
+    snapshot_parser.add_argument("action", help="Action to perform ('migrate' or 'export')")
+    snapshot_parser.add_argument("--remove-sources", action="store_true", help="Delete all '.json' files after migrating them")
+    # 'convert-file' command
+    convert_file_parser = subparser.add_parser("convert-file", help="Convert all rows from a CSV or JSONL file")
+    convert_file_parser.add_argument("input", help="Input file ('-' for stdin)")
+    convert_file_parser.add_argument("output", nargs="?", help="Output file (default: stdout)")
+    convert_file_parser.add_argument("--format", help="File format ('csv' or 'jsonl'), when it's not the file's extension")
+    convert_file_parser.add_argument("--group", help="Unit group for all rows, instead of 'group' column")
+    convert_file_parser.add_argument("--from", dest="from_type", help="Source unit type for all rows, instead of 'from' column")
+    convert_file_parser.add_argument("--to", dest="to_type", help="Target unit type for all rows, instead of 'to' column")
+    convert_file_parser.add_argument("--column", default="amount", help="Column with the amounts to be converted (default: 'amount')")
+    convert_file_parser.add_argument("--workers", "-w", type=int, default=1, help="Number of worker processes converting the file in chunks (default: 1)")
+    # 'convert-binary' command
+    convert_binary_parser = subparser.add_parser("convert-binary", help="Convert a raw float file or '.npy' array, in place or into another file")
+    convert_binary_parser.add_argument("input", help="Input file (raw values or '.npy' array)")
+    convert_binary_parser.add_argument("output", nargs="?", help="Output file (default: converts input file in place)")
+    convert_binary_parser.add_argument("--group", required=True, help="Unit group")
+    convert_binary_parser.add_argument("--from", dest="from_type", required=True, help="Source unit type")
+    convert_binary_parser.add_argument("--to", dest="to_type", required=True, help="Target unit type")
+    convert_binary_parser.add_argument("--dtype", default="float64", help="Type of raw values ('float64' or 'float32', ignored for '.npy' arrays)")
+    # 'serve' command
+    serve_parser = subparser.add_parser("serve", help="Run a conversion server, answering JSON requests on a local TCP port or Unix socket")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", "-p", type=int, default=8765, help="TCP port to listen on (default: 8765)")
+    serve_parser.add_argument("--socket", help="Unix socket path, listened on instead of a TCP port")
+    serve_parser.add_argument("--cache-size", type=int, default=0, help="Number of conversion results kept in memory (default: 0, no cache)")
+    # 'resident' command
+    subparser.add_parser("resident", help="Keep a resident process with the unit catalog loaded, which runs all other commands much faster")
+    # 'apply' command
+    apply_parser = subparser.add_parser("apply", help="Apply all 'manage-group', 'manage-type', 'aliases' and 'change-base' operations from a file at once")
+    apply_parser.add_argument("file", help="File with one operation per line")
+    return parser
+
+
+def build_conversion_data(data: DataStore, unit_group: str, args: list[str]) -> ConversionData:
+    """Builds a 'ConversionData' object from the arguments of 'convert' command"""
+    # Without a unit group (e.g. 'km mi 5'), it's inferred from both unit types
+    if unit_group.lower() not in data.units and unit_group.lower() in data.unit_index and len(args) in [1, 2]:
+        args = [unit_group, *args]
+        unit_group = data.unit_index.infer_group(args[0].lower(), args[1].lower())
+        if unit_group == "time":
+            args = [*args, "1"] if len(args) == 2 else args
+    validate_unit_group(unit_group.lower(), data)
+    conversion_data: ConversionData = ConversionData(unit_group=unit_group.lower())
+    if conversion_data.unit_group == "time":
+        conversion_data.time_input = " ".join(arg.lower() for arg in args)
+    else:
+        if len(args) not in [2, 3]:
+            raise ValueError("Invalid format for non-time conversion! Usage: <from_type> <to_type> [amount]")
+        conversion_data.from_type = args[0].lower()
+        conversion_data.to_type = args[1].lower()
+        conversion_data.amount = float(args[2]) if len(args) == 3 else 1.0
+    return conversion_data
+
+
+def serve_stdin(data: DataStore, input_stream: Optional[TextIO]=None, output_stream: Optional[TextIO]=None) -> int:
+    """Answers one 'convert' request per input line with exactly one output line, until input is closed"""
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+    requests: int = 0
+    # Reads line by line (instead of iterating over the stream), so that no request waits in a read-ahead buffer
+    for line in iter(input_stream.readline, ""):
+        # Same syntax as 'convert' command, optionally preceded by the command's name
+        args: list[str] = line.split()
+        if args and args[0].lower() in ["convert", "c"]:
+            args = args[1:]
+        try:
+            if len(args) < 2:
+                raise ValueError("Invalid request! Usage: [unit_group] <from_type> <to_type> [amount]")
+            conversion_data: ConversionData = build_conversion_data(data, args[0], args[1:])
+            message: str = conversion_logic(data, conversion_data)
+        except (ValueError, KeyError, ZeroDivisionError, TypeError, AttributeError) as e:
+            message = f"Error: {e.args[0] if e.args else str(e)}"
+        # Flushes every answer, so that a co-process reading it never blocks
+        output_stream.write(message + "\n")
+        output_stream.flush()
+        requests += 1
+    return requests
+
+
+def run_catalog_command(data: DataStore, parsed_args: argparse.Namespace) -> str:
+    """Runs a command that changes the unit catalog, returning its output message"""
     # 'manage-group' command
-    elif parsed_args.command in ["manage-group", "mg"]:
+    if parsed_args.command in ["manage-group", "mg"]:
         manage_group_data: ManageGroupData = ManageGroupData(
             unit_group = parsed_args.unit_group.lower(),
             action = parsed_args.action.lower(),
             new_base_unit = parsed_args.new_base_unit.lower() if parsed_args.new_base_unit else None
         )
         message = manage_group(data, manage_group_data)
-        print(message)
+        return message
     # 'manage-type' command
     elif parsed_args.command in ["manage-type", "mt"]:
         validate_unit_group(parsed_args.unit_group.lower(), data)
@@ -133,7 +292,7 @@ def handle_cli(data: DataStore, args: list[str]) -> None:
             offset = parsed_args.offset
         )
         message = manage_type(data, manage_type_data)
-        print(message)
+        return message
     # 'aliases' command
     elif parsed_args.command in ["aliases", "a"]:
         validate_unit_group(parsed_args.unit_group.lower(), data)
@@ -144,7 +303,7 @@ def handle_cli(data: DataStore, args: list[str]) -> None:
             alias = parsed_args.alias.lower()
         )
         message = manage_aliases(data, aliases_data)
-        print(message)
+        return message
     # 'change-base' command
     elif parsed_args.command in ["change-base", "cb"]:
         validate_unit_group(parsed_args.unit_group.lower(), data)
@@ -153,7 +312,39 @@ def handle_cli(data: DataStore, args: list[str]) -> None:
             new_base_unit = parsed_args.new_base_unit.lower()
         )
         message = change_base_unit(data, change_base_data)
-        print(message)
+        return message
+    raise ValueError(f"'{parsed_args.command}' doesn't change the unit catalog!")
+
+
+def apply_operations(data: DataStore, file_path: str) -> str:
+    """Applies all operations from a file at once, validating and saving them once (or none of them, on error)"""
+    parser: argparse.ArgumentParser = build_parser()
+    with open(file_path, "r") as file:
+        lines: list[str] = file.readlines()
+    operations: int = 0
+    with batch_changes(data):
+        for line_number, line in enumerate(lines, start=1):
+            # Skips empty lines and comments
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                # Usage errors are reported with their line number, instead of exiting with argparse's usage message
+                with contextlib.redirect_stderr(io.StringIO()) as errors:
+                    parsed_args: argparse.Namespace = parser.parse_args(shlex.split(line))
+            except SystemExit:
+                usage: list[str] = errors.getvalue().strip().splitlines()
+                raise ValueError(f"Line {line_number}: {usage[-1].split('error: ', 1)[-1] if usage else 'Invalid operation!'}")
+            except ValueError as e:
+                # Unbalanced quotes
+                raise ValueError(f"Line {line_number}: {e.args[0] if e.args else str(e)}") from e
+            if parsed_args.command not in CATALOG_COMMANDS:
+                raise ValueError(f"Line {line_number}: '{parsed_args.command}' can't be applied! Only 'manage-group', 'manage-type', 'aliases' and 'change-base' operations are allowed")
+            try:
+                run_catalog_command(data, parsed_args)
+            except (ValueError, KeyError, ZeroDivisionError) as e:
+                raise ValueError(f"Line {line_number}: {e.args[0] if e.args else str(e)}") from e
+            operations += 1
+    return f"{operations} operations applied!"
 
 
 # Interactive mode
@@ -199,6 +390,8 @@ def get_action(data: DataStore) -> None:
             else:
                 raise ValueError(f"'{action}' is not a valid action!")
         except (EOFError, KeyboardInterrupt):
+            # Writes conversion entries still queued in memory before leaving
+            flush_log()
             sys.exit("\nBye!")
         except (KeyError, ValueError, ZeroDivisionError, AttributeError) as e:
             print(f"Error: {e.args[0] if e.args else str(e)}")
@@ -210,13 +403,19 @@ def print_groups(data: DataStore) -> str:
     return "Groups: " + ", ".join(data.units.keys())
 
 
-def print_history(data: DataStore, limit: int = 10) -> str:
+def print_history(data: DataStore, limit: int = 10, history_data: Optional[HistoryData]=None) -> str:
     """Prints the last 10 conversion entries"""
     try:
         validate_for_history(data, limit)
-        # Used to construct the sequence of entries in 'conversion_log.json' dictionary
+        if history_data is not None:
+            history_data.validate_for_history(data)
+        # Only reads the last entries, instead of the whole history
+        history: list[dict] = get_history(data, int(limit), history_data)
+        if not history:
+            raise ValueError("Conversion history is empty!")
+        # Used to construct the sequence of entries in conversion history
         entries: list[str] = []
-        for entry in data.conversion_log[-int(limit):]:  # Gets the last 10 entries
+        for entry in history:  # Gets the last 10 entries
             # Generates specific messages based on 'unit_group'
             if entry["unit_group"] == "time":
                 if entry["from_time"] in data.units["time"]:
@@ -243,7 +442,7 @@ def print_types(data: DataStore, unit_group: Optional[str]=None) -> str:
         # Iterates over the outter keys of 'units.json' dictionary
         for unit_type in data.units[unit_group]:
             # Gets all aliases for a specific unit_type
-            aliases: list[str] = [alias for alias, unit in data.unit_aliases.get(unit_group, {}).items() if unit == unit_type]
+            aliases: list[str] = data.unit_index.aliases_of(unit_group, unit_type)
             if aliases:
                 formatted_output.append(f"{unit_type} ({', '.join(f'\'{alias}\'' for alias in aliases)})")
             else:
@@ -264,77 +463,130 @@ def conversion_logic(data: DataStore, conversion_data: Optional[ConversionData]=
             else:
                 conversion_data.from_type, conversion_data.to_type = get_converter_units(data, conversion_data)
                 conversion_data.amount = get_amount(conversion_data)
-        # Validates all variables and values
-        conversion_data.validate_for_conversion(data)
-        # Specific logic for time conversions
-        if conversion_data.unit_group == "time":
-            return converter_time(data, conversion_data)
-        conversion_data.new_value = converter(data, conversion_data)
-        return f"{format_value(conversion_data.amount)} {conversion_data.from_type} = {format_value(conversion_data.new_value)} {conversion_data.to_type}"
+        # Pure conversion, followed by logging and message formatting layers
+        convert_value(data, conversion_data)
+        log_conversion(data, conversion_data)
+        return format_conversion(conversion_data)
     except (ValueError, KeyError, ZeroDivisionError, AttributeError) as e:
         raise
 
 
+def convert_value(data: DataStore, conversion_data: ConversionData) -> float:
+    """Validates and converts a value, without logging nor building any message"""
+    cache: ResultCache = data.result_cache
+    # Time conversions are cached by their whole expression, skipping both validation and parsing
+    if cache.max_size and conversion_data.unit_group == "time" and conversion_data.time_input:
+        key: tuple = ("time", " ".join(conversion_data.time_input.lower().split()))
+        cached: Optional[dict] = cache.get(key)
+        if cached is not None:
+            for field, value in cached.items():
+                setattr(conversion_data, field, value)
+            return conversion_data.new_time
+        conversion_data.validate_for_conversion(data)
+        new_time: float = time_value(data, conversion_data)
+        cache.put(key, {field: getattr(conversion_data, field) for field in TIME_RESULT_FIELDS})
+        return new_time
+    # Validates all variables and values
+    conversion_data.validate_for_conversion(data)
+    # Specific logic for time conversions
+    if conversion_data.unit_group == "time":
+        return time_value(data, conversion_data)
+    if cache.max_size:
+        # Other conversions are cached with their canonical unit types, after validation
+        key = (conversion_data.unit_group, conversion_data.from_type, conversion_data.to_type, conversion_data.amount)
+        cached_value: Optional[float] = cache.get(key)
+        if cached_value is not None:
+            conversion_data.new_value = cached_value
+            return cached_value
+        new_value: float = converter(data, conversion_data)
+        cache.put(key, new_value)
+        return new_value
+    return converter(data, conversion_data)
+
+
+def log_conversion(data: DataStore, conversion_data: ConversionData) -> None:
+    """Adds an already converted value to log file"""
+    if conversion_data.unit_group == "time":
+        # Time sums are stored with their formatted amounts (e.g. '1.0 years 2.0 months')
+        if conversion_data.time_parts:
+            conversion_data.from_time = format_time_parts(conversion_data.time_parts)
+        add_to_log(data, conversion_data, is_time_convertion=True)
+    else:
+        add_to_log(data, conversion_data)
+
+
+def format_conversion(conversion_data: ConversionData) -> str:
+    """Builds the output message of an already converted value"""
+    if conversion_data.unit_group == "time":
+        return format_time_conversion(conversion_data)
+    return f"{format_value(conversion_data.amount)} {conversion_data.from_type} = {format_value(conversion_data.new_value)} {conversion_data.to_type}"
+
+
 def converter(data: DataStore, conversion_data:ConversionData) -> float:
     """Hangles conversions for non-time units"""
-    # Specific logic com temperature conversions
-    if conversion_data.unit_group == "temperature":
-        conversion_data.new_value = converter_temp(data, conversion_data)
-    else:
-        zero_division_checker(float(data.units[conversion_data.unit_group][conversion_data.to_type]))
-        conversion_data.new_value = conversion_data.amount * (data.units[conversion_data.unit_group][conversion_data.from_type]/data.units[conversion_data.unit_group][conversion_data.to_type])
-    # Adds to log file
-    add_to_log(data, conversion_data)
+    # Uses scale factors (or factor and offset, for temperature) from the conversion engine
+    conversion_data.new_value = data.engine.convert(conversion_data.unit_group, conversion_data.from_type, conversion_data.to_type, conversion_data.amount)  # type: ignore[arg-type]
     return conversion_data.new_value
 
 
 def converter_temp(data: DataStore, conversion_data: ConversionData) -> float:
     """Handles conversion for temperature units"""
-    # Gets factor and offset values for temperature conversions
-    factor_from, offset_from = data.units[conversion_data.unit_group][conversion_data.from_type]
-    factor_to, offset_to = data.units[conversion_data.unit_group][conversion_data.to_type]
-    zero_division_checker(factor_from)
-    if conversion_data.from_type == "celsius":
-        return (conversion_data.amount * factor_to) + offset_to    
-    temp_in_celsius: float = (conversion_data.amount - offset_from) / factor_from
-    if conversion_data.to_type == "celsius":
-        return temp_in_celsius
-    return (temp_in_celsius * factor_to) + offset_to
+    # Factor and offset of each pair are precomputed by the conversion engine
+    return data.engine.convert(conversion_data.unit_group, conversion_data.from_type, conversion_data.to_type, conversion_data.amount)  # type: ignore[arg-type]
 
 
 def converter_time(data: DataStore, conversion_data: ConversionData) -> str:
     """Handles conversion for time units"""
+    time_value(data, conversion_data)
+    log_conversion(data, conversion_data)
+    return format_time_conversion(conversion_data)
+
+
+def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> str:
+    """User's input is consisted of exactly 3 arguments"""
+    time_3args_value(data, conversion_data)
+    log_conversion(data, conversion_data)
+    return format_time_conversion(conversion_data)
+
+
+def converter_time_2args(data: DataStore, conversion_data: ConversionData) -> str:
+    """User's input is consisted of exactly 2 arguments"""
+    time_2args_value(data, conversion_data)
+    log_conversion(data, conversion_data)
+    return format_time_conversion(conversion_data)
+
+
+def time_value(data: DataStore, conversion_data: ConversionData) -> float:
+    """Converts time units, without logging nor building any message"""
     # Segregates user's input
     args: list[str] = conversion_data.time_input.split()
     # Specific logic based on user's input
     if len(args) == 2:
-        return converter_time_2args(data, conversion_data)
+        return time_2args_value(data, conversion_data)
     elif len(args) == 3:
-        return converter_time_3args(data, conversion_data)
+        return time_3args_value(data, conversion_data)
     # E.g. 5 years 10 months 10 days 8 hours 56 minutes seconds
     elif len(args) % 2 != 0 and len(args) > 3:
         conversion_data.to_time = args[-1]
         zero_division_checker(data.units[conversion_data.unit_group][conversion_data.to_time])
         # Keeps track of every block of (value, unit_type)
-        formatted_value: list[tuple[str, str]] = []
-        total_seconds: int = 0
+        time_parts: list[tuple[float, str]] = []
+        total_seconds: float = 0
         for number, unit in zip(args[0::2], args[1::2]):
-            number = float(number) # type: ignore[assignment]
             unit = resolve_aliases(data, conversion_data.unit_group, unit)
-            total_seconds =  total_seconds + (number * data.units[conversion_data.unit_group][unit])
-            formatted_value.append((format_value(number), unit))
+            total_seconds = total_seconds + (float(number) * data.units[conversion_data.unit_group][unit])
+            time_parts.append((float(number), unit))
 
-        conversion_data.from_time = " ".join(f"{num} {unit}" for num, unit in formatted_value)
+        conversion_data.time_parts = time_parts
+        conversion_data.time_format = "sum"
         conversion_data.new_time = total_seconds / data.units[conversion_data.unit_group][conversion_data.to_time]
-
-        add_to_log(data, conversion_data, is_time_convertion=True)
-        return f"{' '.join(f'{num} {unit}' for num, unit in formatted_value)} = {format_value(conversion_data.new_time)} {conversion_data.to_time}"
+        return conversion_data.new_time
     else:
         raise ValueError("Invalid format for date and time conversion!")
 
 
-def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> str:
-    """User's input is consisted of exactly 3 arguments"""
+def time_3args_value(data: DataStore, conversion_data: ConversionData) -> float:
+    """Converts a time input consisted of exactly 3 arguments"""
     # Declare variables to reduce code's verbosity
     unit_group = conversion_data.unit_group
     from_time = conversion_data.from_time
@@ -348,7 +600,7 @@ def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> st
         total_seconds: float = factor_time * data.units[unit_group][from_time]
         zero_division_checker(data.units[unit_group][to_time])
         conversion_data.new_time = total_seconds / data.units[unit_group][to_time]
-        message = f"{format_value(factor_time)} {from_time} = {format_value(conversion_data.new_time)} {to_time}"
+        conversion_data.time_format = "units"
 
     else:
         conversion_data.validate_factor_time(data)
@@ -360,7 +612,7 @@ def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> st
             if new_from_time < 24 * 3600 and new_to_time < new_from_time:
                 new_to_time += 24 * 3600
             conversion_data.new_time = fabs((new_from_time - new_to_time) / data.units[unit_group][factor_time])
-            message = f"There are {format_value(conversion_data.new_time)} {factor_time} between {from_time} and {to_time}"
+            conversion_data.time_format = "clock_range"
 
         # E.g. JAN DEC days
         elif from_time in data.month_aliases and to_time in data.month_aliases:
@@ -380,7 +632,7 @@ def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> st
                 total_seconds = (timedelta(seconds=days * data.units[unit_group]["days"])).total_seconds()
                 zero_division_checker(data.units[unit_group][factor_time])
                 conversion_data.new_time = total_seconds / data.units[unit_group][factor_time]
-            message = f"Between {from_time} and {to_time} there are {format_value(conversion_data.new_time)} {factor_time}"
+            conversion_data.time_format = "range"
 
         # E.g. 2019-11-04 2056-04-28 days
         elif "-" in from_time and "-" in to_time:
@@ -405,7 +657,10 @@ def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> st
             total_days: int = abs((from_total_days - to_total_days)) + 1 + leap_years
             total_seconds = total_days * data.units[unit_group]["days"]
             conversion_data.new_time = total_seconds / data.units[unit_group][factor_time]        
-            message = f"Between {from_time} and {to_time} there are {format_value(conversion_data.new_time)} {factor_time}"
+            conversion_data.time_format = "range"
+
+        else:
+            raise ValueError("Invalid format for date and time conversion!")
 
     # Assigns modified values back to its class object
     conversion_data.unit_group = unit_group
@@ -413,12 +668,11 @@ def converter_time_3args(data: DataStore, conversion_data: ConversionData) -> st
     conversion_data.to_time=to_time
     conversion_data.factor_time=factor_time
 
-    add_to_log(data, conversion_data, is_time_convertion=True)
-    return message
+    return conversion_data.new_time
 
 
-def converter_time_2args(data: DataStore, conversion_data: ConversionData) -> str:
-    """User's input is consisted of exactly 2 arguments"""
+def time_2args_value(data: DataStore, conversion_data: ConversionData) -> float:
+    """Converts a time input consisted of exactly 2 arguments"""
     # Declare variables to reduce code's verbosity
     unit_group = conversion_data.unit_group
     from_time = conversion_data.from_time
@@ -429,7 +683,7 @@ def converter_time_2args(data: DataStore, conversion_data: ConversionData) -> st
     if any(char in from_time for char in (":", "h", "m", "s")):
         total_seconds: float = parse_time_input(from_time)
         conversion_data.new_time = (total_seconds / data.units[unit_group][factor_time])
-        message = f"There are {format_value(conversion_data.new_time)} {factor_time} in {from_time}"
+        conversion_data.time_format = "duration"
 
     # E.g. JAN minutes
     elif from_time in data.month_aliases:
@@ -437,22 +691,48 @@ def converter_time_2args(data: DataStore, conversion_data: ConversionData) -> st
         days: int = get_days_from_month(data, from_time)
         total_seconds = days * data.units[unit_group]["days"]
         conversion_data.new_time = total_seconds / data.units[unit_group][factor_time]
-        message = f"There are {format_value(conversion_data.new_time)} {factor_time} in {from_time}"
+        conversion_data.time_format = "duration"
 
     # E.g. 2019-11-04 days
     elif "-" in from_time:
         years, months, days = parse_date_input(from_time)
         total_seconds = get_seconds(data, unit_group, years, months, days)        
         conversion_data.new_time = total_seconds / data.units[unit_group][factor_time]
-        message = f"There are {format_value(conversion_data.new_time)} {factor_time} in {years} years, {months} months, {days} days"
+        conversion_data.time_format = "date"
 
     # Assigns modified values back to its class object
     conversion_data.unit_group = unit_group
     conversion_data.from_time=from_time
     conversion_data.factor_time=factor_time
 
-    add_to_log(data, conversion_data, is_time_convertion=True)
-    return message
+    return conversion_data.new_time
+
+
+def format_time_conversion(conversion_data: ConversionData) -> str:
+    """Builds the output message of an already converted time value"""
+    new_time: str = format_value(conversion_data.new_time)
+    from_time = conversion_data.from_time
+    to_time = conversion_data.to_time
+    factor_time = conversion_data.factor_time
+    if conversion_data.time_format == "sum" and conversion_data.time_parts is not None:
+        return f"{format_time_parts(conversion_data.time_parts)} = {new_time} {to_time}"
+    elif conversion_data.time_format == "units":
+        return f"{format_value(factor_time)} {from_time} = {new_time} {to_time}"
+    elif conversion_data.time_format == "clock_range":
+        return f"There are {new_time} {factor_time} between {from_time} and {to_time}"
+    elif conversion_data.time_format == "range":
+        return f"Between {from_time} and {to_time} there are {new_time} {factor_time}"
+    elif conversion_data.time_format == "duration":
+        return f"There are {new_time} {factor_time} in {from_time}"
+    elif conversion_data.time_format == "date":
+        years, months, days = parse_date_input(from_time)
+        return f"There are {new_time} {factor_time} in {years} years, {months} months, {days} days"
+    raise ValueError("Invalid format for date and time conversion!")
+
+
+def format_time_parts(time_parts: list[tuple[float, str]]) -> str:
+    """Formats every block of (value, unit_type) of a time sum"""
+    return " ".join(f"{format_value(number)} {unit}" for number, unit in time_parts)
 
 
 def manage_group(data: DataStore, manage_group_data: Optional[ManageGroupData]=None) -> str:
@@ -479,19 +759,21 @@ def manage_group(data: DataStore, manage_group_data: Optional[ManageGroupData]=N
             data.original_units[manage_group_data.unit_group][manage_group_data.new_base_unit] = 1.0
             data.base_units[manage_group_data.unit_group] = manage_group_data.new_base_unit
             data.unit_aliases[manage_group_data.unit_group] = {}
+            data.refresh_engine(manage_group_data.unit_group)  # type: ignore[arg-type]
+            data.unit_index.build_group(manage_group_data.unit_group)  # type: ignore[arg-type]
             message = f"You've just created a '{manage_group_data.unit_group}' group, with '{manage_group_data.new_base_unit}' as its base unit!"
         elif manage_group_data.action == "remove":
             data.units.pop(manage_group_data.unit_group)
             data.original_units.pop(manage_group_data.unit_group)
             data.base_units.pop(manage_group_data.unit_group)
             data.unit_aliases.pop(manage_group_data.unit_group)
+            data.refresh_engine(manage_group_data.unit_group)  # type: ignore[arg-type]
+            data.unit_index.remove_group(manage_group_data.unit_group)  # type: ignore[arg-type]
             message = f"Group '{manage_group_data.unit_group}' successfully removed!"
 
         # Save changes, making them permanent throughout sessions
-        save_data(data.units, "units")
-        save_data(data.original_units, "original_units")
-        save_data(data.base_units, "base_units")
-        save_data(data.unit_aliases, "unit_aliases")
+        data.mark_dirty("units", "original_units", "base_units", "unit_aliases")
+        save_data(data)
 
         return message
     except (ValueError, KeyError) as e:
@@ -529,19 +811,25 @@ def manage_type(data: DataStore, manage_type_data: Optional[ManageTypeData]=None
                 return add_temp_type(data, manage_type_data)
             data.units[manage_type_data.unit_group][manage_type_data.unit_type] = manage_type_data.value
             data.original_units[manage_type_data.unit_group][manage_type_data.unit_type] = manage_type_data.value
+            # Only the new unit type is added to the conversion engine
+            data.refresh_engine(manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
+            data.unit_index.add(manage_type_data.unit_type, manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
             message = f"A new unit type was added on '{manage_type_data.unit_group}' group: {manage_type_data.unit_type} = {manage_type_data.value}"
         elif manage_type_data.action == "remove":
             data.units[manage_type_data.unit_group].pop(manage_type_data.unit_type)
             data.original_units[manage_type_data.unit_group].pop(manage_type_data.unit_type)
-            aliases_to_remove = [alias for alias, unit in data.unit_aliases[manage_type_data.unit_group].items() if unit == manage_type_data.unit_type]
+            data.refresh_engine(manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
+            # Drops the unit type and all its aliases from the global index
+            aliases_to_remove: list[str] = data.unit_index.remove_type(manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
             for alias in aliases_to_remove:
                 data.unit_aliases[manage_type_data.unit_group].pop(alias)
             message = f"'{manage_type_data.unit_type}' was removed from '{manage_type_data.unit_group}'"
+            if aliases_to_remove:
+                data.mark_dirty("unit_aliases")
 
         # Save changes, making them permanent throughout sessions
-        save_data(data.units, "units")
-        save_data(data.original_units, "original_units")
-        save_data(data.unit_aliases, "unit_aliases")
+        data.mark_dirty("units", "original_units")
+        save_data(data)
 
         return message
     except (ValueError, KeyError) as e:
@@ -560,10 +848,12 @@ def add_temp_type(data: DataStore, manage_type_data: ManageTypeData) -> str:
     # Changes respective '.json' files
     data.units[manage_type_data.unit_group][manage_type_data.unit_type] = [manage_type_data.factor, manage_type_data.offset]
     data.original_units[manage_type_data.unit_group][manage_type_data.unit_type] = [manage_type_data.factor, manage_type_data.offset]
+    data.refresh_engine(manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
+    data.unit_index.add(manage_type_data.unit_type, manage_type_data.unit_group, manage_type_data.unit_type)  # type: ignore[arg-type]
 
     # Save changes, making them permanent throughout sessions
-    save_data(data.units, "units")
-    save_data(data.original_units, "original_units")
+    data.mark_dirty("units", "original_units")
+    save_data(data)
 
     return f"A new unit type was added on 'temperature' group: {manage_type_data.unit_type} = [{manage_type_data.factor}, {manage_type_data.offset}]"
 
@@ -575,7 +865,7 @@ def manage_aliases(data: DataStore, aliases_data: Optional[AliasesData]=None) ->
             aliases_data = AliasesData(unit_group = get_unit_group(data))
             aliases_data.unit_type = get_users_input(f"Enter unit type for '{aliases_data.unit_group}' group: ").strip().lower()
             aliases_data.validate_unit_type(data)
-            all_aliases = [alias for alias in data.unit_aliases[aliases_data.unit_group] if aliases_data.unit_type == data.unit_aliases[aliases_data.unit_group].get(alias)]
+            all_aliases: list[str] = data.unit_index.aliases_of(aliases_data.unit_group, aliases_data.unit_type)
             if not all_aliases:
                 aliases_data.action = "add"
                 aliases_data.alias = get_users_input(f"'{aliases_data.unit_type}' has no alias. Enter new alias: ").strip().lower()
@@ -589,13 +879,16 @@ def manage_aliases(data: DataStore, aliases_data: Optional[AliasesData]=None) ->
         # Changes respective '.json' files
         if aliases_data.action == "add":
             data.unit_aliases[aliases_data.unit_group][aliases_data.alias] = aliases_data.unit_type
+            data.unit_index.add_alias(aliases_data.alias, aliases_data.unit_group, aliases_data.unit_type)  # type: ignore[arg-type]
             message = f"Alias successfully added! New alias for '{aliases_data.unit_type}': '{aliases_data.alias}'"
         elif aliases_data.action == "remove":
             data.unit_aliases[aliases_data.unit_group].pop(aliases_data.alias) 
+            data.unit_index.remove_alias(aliases_data.alias, aliases_data.unit_group, aliases_data.unit_type)  # type: ignore[arg-type]
             message = f"'{aliases_data.alias}' successfully removed from '{aliases_data.unit_type}'!"
 
         # Save changes, making them permanent throughout sessions
-        save_data(data.unit_aliases, "unit_aliases")
+        data.mark_dirty("unit_aliases")
+        save_data(data)
         
         return message
     except (ValueError, KeyError) as e:
@@ -616,16 +909,28 @@ def change_base_unit(data: DataStore, change_base_data: Optional[ChangeBaseData]
         refactor_value(data, change_base_data.unit_group, change_base_data.new_base_unit)
         # Update 'base_units.json' with new base unit
         data.base_units[change_base_data.unit_group] = change_base_data.new_base_unit
+        # Every value of the modified group changed, so its whole table is rebuilt
+        data.refresh_engine(change_base_data.unit_group)
 
-        # Save changes, making them permanent throughout sessions
-        save_data(data.units, "units")
-        save_data(data.original_units, "original_units")
-        save_data(data.base_units, "base_units")
+        # Save changes, making them permanent throughout sessions ('original_units' never changes here)
+        data.mark_dirty("units", "base_units")
+        save_data(data)
 
         return f"You've just changed the base unit from '{change_base_data.unit_group}' group, to '{change_base_data.new_base_unit}'!"
     except (ValueError, KeyError) as e:
         raise
 
 
+def manage_snapshot(action: str, remove_sources: bool=False) -> str:
+    """Migrates unit catalog into a single snapshot file, or exports it back to all '.json' files"""
+    if action == "migrate":
+        migrate_to_snapshot(remove_sources)
+        return "Unit catalog migrated to 'data/catalog.json'!"
+    elif action == "export":
+        export_snapshot()
+        return "Unit catalog exported back to all '.json' files!"
+    raise ValueError(f"Invalid action: '{action}'! Usage: snapshot <migrate|export>")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,9 +1,10 @@
+import io
 import pytest
 
 from unittest.mock import patch
 
-from project import get_action, print_groups, print_history, print_types, conversion_logic, converter, converter_temp, converter_time, converter_time_2args, converter_time_3args, manage_group, manage_type, add_temp_type, manage_aliases, change_base_unit
-from unit_converter.data_manager import load_data
+from project import get_action, print_groups, print_history, print_types, conversion_logic, convert_value, log_conversion, format_conversion, converter, converter_temp, converter_time, converter_time_2args, converter_time_3args, manage_group, manage_type, add_temp_type, manage_aliases, change_base_unit, manage_snapshot, apply_operations, build_conversion_data, serve_stdin, run_cli
+from unit_converter.data_manager import CatalogLoader, load_data
 from unit_converter.data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData
 
 
@@ -288,6 +289,78 @@ def test_conversion_logic_get_input_time(data_store):
             assert conversion_logic(data_store) == "1.0 minutes = 60.0 seconds"
 
 
+# Test 'convert_value' function
+def test_convert_value(data_store):
+    conversion_data = ConversionData(unit_group="length", from_type="m", to_type="yd", amount="10")
+    with patch("project.add_to_log") as mocked_add_to_log:
+        with patch("project.format_value") as mocked_format_value:
+            assert convert_value(data_store, conversion_data) == 10.936132983377078
+            mocked_add_to_log.assert_not_called()
+            mocked_format_value.assert_not_called()
+
+def test_convert_value_time(data_store):
+    conversion_data = ConversionData(unit_group="time", time_input="1 years 1 month 1 days days")
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert convert_value(data_store, conversion_data) == 396.25
+        mocked_add_to_log.assert_not_called()
+
+
+def test_convert_value_cached(data_store):
+    data_store.result_cache.configure(max_size=10)
+    conversion_data = ConversionData(unit_group="length", from_type="km", to_type="mi", amount=5)
+    assert convert_value(data_store, conversion_data) == 3.1068559611866697
+    with patch("project.converter") as mocked_converter:
+        conversion_data = ConversionData(unit_group="length", from_type="kilometers", to_type="miles", amount="5")
+        assert convert_value(data_store, conversion_data) == 3.1068559611866697
+        mocked_converter.assert_not_called()
+    assert conversion_data.new_value == 3.1068559611866697
+    assert data_store.result_cache.stats()["hits"] == 1
+
+def test_convert_value_time_cached(data_store):
+    data_store.result_cache.configure(max_size=10)
+    convert_value(data_store, ConversionData(unit_group="time", time_input="2019-11-04 2056-04-28 days"))
+    with patch("project.time_value") as mocked_time_value:
+        conversion_data = ConversionData(unit_group="time", time_input="2019-11-04  2056-04-28 DAYS")
+        assert convert_value(data_store, conversion_data) == 13326.0
+        mocked_time_value.assert_not_called()
+    assert format_conversion(conversion_data) == "Between 2019-11-04 and 2056-04-28 there are 13,326.0 days"
+
+def test_convert_value_cache_invalidated(data_store):
+    data_store.result_cache.configure(max_size=10)
+    convert_value(data_store, ConversionData(unit_group="length", from_type="km", to_type="m", amount=1))
+    data_store.units["length"]["kilometers"] = 2000.0
+    data_store.engine.build_group("length")
+    data_store.mark_dirty("units")
+    assert convert_value(data_store, ConversionData(unit_group="length", from_type="km", to_type="m", amount=1)) == 2000.0
+
+
+# Test 'log_conversion' function
+def test_log_conversion(data_store):
+    conversion_data = ConversionData(unit_group="length", from_type="meters", to_type="yards", amount=10.0, new_value=10.936132983377078)
+    with patch("project.add_to_log") as mocked_add_to_log:
+        log_conversion(data_store, conversion_data)
+        mocked_add_to_log.assert_called_once_with(data_store, conversion_data)
+
+def test_log_conversion_time_sum(data_store):
+    conversion_data = ConversionData(unit_group="time", time_input="1 years 1 month 1 days days")
+    convert_value(data_store, conversion_data)
+    with patch("project.add_to_log") as mocked_add_to_log:
+        log_conversion(data_store, conversion_data)
+        mocked_add_to_log.assert_called_once_with(data_store, conversion_data, is_time_convertion=True)
+    assert conversion_data.from_time == "1.0 years 1.0 months 1.0 days"
+
+
+# Test 'format_conversion' function
+def test_format_conversion(data_store):
+    conversion_data = ConversionData(unit_group="length", from_type="meters", to_type="yards", amount=10.0, new_value=10.936132983377078)
+    assert format_conversion(conversion_data) == "10.0 meters = 10.93613 yards"
+
+def test_format_conversion_time(data_store):
+    conversion_data = ConversionData(unit_group="time", time_input="jan dec days")
+    convert_value(data_store, conversion_data)
+    assert format_conversion(conversion_data) == "Between January and December there are 365.0 days"
+
+
 # Test 'converter' function
 def test_converter(data_store, conversion_data):
     conversion_data.from_type = "meters"
@@ -304,6 +377,7 @@ def test_converter_temperature(data_store, conversion_data):
 
 def test_converter_zero_division(data_store, conversion_data):
     data_store.units["length"]["yards"] = 0
+    data_store.engine.build_group("length")
     conversion_data.from_type = "meters"
     conversion_data.to_type = "yards"
     conversion_data.amount = 10.0    
@@ -321,6 +395,7 @@ def test_converter_temp(data_store, conversion_data):
 
 def test_converter_temp_zero_division(data_store, conversion_data):
     data_store.units["temperature"]["celsius"] = [0.0, 273.15]
+    data_store.engine.build_group("temperature")
     conversion_data.unit_group = "temperature"
     conversion_data.from_type = "celsius"
     conversion_data.to_type = "kelvin"
@@ -404,6 +479,13 @@ def test_manage_group_remove(data_store, manage_group_data):
     manage_group_data.action = "remove"
     assert manage_group(data_store, manage_group_data) == "Group 'length' successfully removed!"
 
+def test_manage_group_updates_unit_index(data_store, manage_group_data):
+    data_store.unit_index
+    manage_group_data.unit_group = "length"
+    manage_group_data.action = "remove"
+    manage_group(data_store, manage_group_data)
+    assert "km" not in data_store.unit_index
+
 def test_manage_group_empty_action(data_store, manage_group_data):
     manage_group_data.unit_group = "new_group"
     with pytest.raises(ValueError, match="'action' cannot be empty!"):
@@ -478,6 +560,34 @@ def test_manage_type_remove(data_store, manage_type_data):
     manage_type_data.action = "remove"
     assert manage_type(data_store, manage_type_data) == "'miles' was removed from 'length'"
 
+def test_manage_type_updates_unit_index(data_store, manage_type_data):
+    manage_type_data.unit_type = "new_type"
+    manage_type_data.action = "add"
+    manage_type_data.value = "10"
+    manage_type(data_store, manage_type_data)
+    assert data_store.unit_index.infer_group("new_type", "km") == "length"
+    data_store.unit_aliases["length"]["nt"] = "new_type"
+    data_store.unit_index.add_alias("nt", "length", "new_type")
+    manage_type_data.action = "remove"
+    manage_type_data.value = None
+    manage_type(data_store, manage_type_data)
+    assert "new_type" not in data_store.unit_index
+    assert "nt" not in data_store.unit_index
+    assert "nt" not in data_store.unit_aliases["length"]
+
+def test_manage_type_add_marks_dirty(data_store, manage_type_data):
+    manage_type_data.unit_type = "new_type"
+    manage_type_data.action = "add"
+    manage_type_data.value = "10"
+    manage_type(data_store, manage_type_data)
+    assert data_store.dirty == {"units", "original_units"}
+
+def test_manage_type_remove_marks_dirty(data_store, manage_type_data):
+    manage_type_data.unit_type = "miles"
+    manage_type_data.action = "remove"
+    manage_type(data_store, manage_type_data)
+    assert data_store.dirty == {"units", "original_units", "unit_aliases"}
+
 def test_manage_type_add_invalid_group(data_store, manage_type_data):
     manage_type_data.unit_group = "invalid"
     manage_type_data.unit_type = "new_type"
@@ -637,6 +747,18 @@ def test_manage_aliases_remove(data_store, aliases_data):
     aliases_data.action = "remove"
     aliases_data.alias = "m"
     assert manage_aliases(data_store, aliases_data) == "'m' successfully removed from 'meters'!"
+
+def test_manage_aliases_updates_unit_index(data_store, aliases_data):
+    aliases_data.unit_type = "meters"
+    aliases_data.action = "add"
+    aliases_data.alias = "mtr"
+    manage_aliases(data_store, aliases_data)
+    assert data_store.unit_index.infer_group("mtr", "km") == "length"
+    assert data_store.unit_index.aliases_of("length", "meters")[-1] == "mtr"
+    aliases_data.action = "remove"
+    manage_aliases(data_store, aliases_data)
+    assert "mtr" not in data_store.unit_index
+    assert "mtr" not in data_store.unit_index.aliases_of("length", "meters")
     
 def test_manage_alias_invalid_group(data_store, aliases_data):
     aliases_data.unit_group = "invalid"
@@ -702,6 +824,13 @@ def test_manage_alias_get_input_add(data_store):
             with patch("project.get_users_input", side_effect=["meters", "add", "mtr"]):
                 assert manage_aliases(data_store) == "Alias successfully added! New alias for 'meters': 'mtr'"
 
+def test_manage_alias_marks_dirty(data_store, aliases_data):
+    aliases_data.unit_type = "meters"
+    aliases_data.action = "add"
+    aliases_data.alias = "mtr"
+    manage_aliases(data_store, aliases_data)
+    assert data_store.dirty == {"unit_aliases"}
+
 def test_manage_alias_get_input_remove(data_store):
     data_store.unit_aliases["length"]["mtr"] = "meters"
     with patch("project.save_data"):
@@ -715,6 +844,11 @@ def test_change_base(data_store, change_base_data):
     change_base_data.new_base_unit = "mile"
     assert change_base_unit(data_store, change_base_data) == "You've just changed the base unit from 'length' group, to 'miles'!"
 
+def test_change_base_marks_dirty(data_store, change_base_data):
+    change_base_data.new_base_unit = "mile"
+    change_base_unit(data_store, change_base_data)
+    assert data_store.dirty == {"units", "base_units"}
+
 def test_change_base_invalid_group(data_store, change_base_data):
     change_base_data.unit_group = "invalid"
     with pytest.raises(KeyError, match="'invalid' is not a valid group!"):
@@ -739,4 +873,139 @@ def test_change_base_get_input(data_store):
     with patch("project.save_data"):
         with patch("project.get_unit_group", return_value="length"):
             with patch("project.get_users_input", return_value="miles"):
-                assert change_base_unit(data_store) == "You've just changed the base unit from 'length' group, to 'miles'!"
\ No newline at end of file
+                assert change_base_unit(data_store) == "You've just changed the base unit from 'length' group, to 'miles'!"
+
+# Test 'manage_snapshot' function
+def test_manage_snapshot_migrate():
+    with patch("project.migrate_to_snapshot") as mock_migrate:
+        assert manage_snapshot("migrate") == "Unit catalog migrated to 'data/catalog.json'!"
+        mock_migrate.assert_called_once_with(False)
+
+def test_manage_snapshot_migrate_remove_sources():
+    with patch("project.migrate_to_snapshot") as mock_migrate:
+        assert manage_snapshot("migrate", remove_sources=True) == "Unit catalog migrated to 'data/catalog.json'!"
+        mock_migrate.assert_called_once_with(True)
+
+def test_manage_snapshot_export():
+    with patch("project.export_snapshot") as mock_export:
+        assert manage_snapshot("export") == "Unit catalog exported back to all '.json' files!"
+        mock_export.assert_called_once()
+
+def test_manage_snapshot_invalid_action():
+    with pytest.raises(ValueError, match="Invalid action: 'invalid'!"):
+        manage_snapshot("invalid")
+
+
+# Test 'apply_operations' function
+def test_apply_operations(data_store, tmp_path):
+    operations = tmp_path / "operations.txt"
+    operations.write_text("# New group\nmanage-group add fuel liters\n\nmt fuel add gallons 3.785\naliases fuel gallons add gal\n")
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        assert apply_operations(data_store, str(operations)) == "3 operations applied!"
+        mock_save.assert_called_once_with(data_store)
+    assert data_store.units["fuel"] == {"liters": 1.0, "gallons": 3.785}
+    assert data_store.unit_aliases["fuel"] == {"gal": "gallons"}
+    assert data_store.dirty == {"units", "original_units", "base_units", "unit_aliases"}
+
+def test_apply_operations_rollback(data_store, tmp_path):
+    operations = tmp_path / "operations.txt"
+    operations.write_text("manage-group add fuel liters\nmt fuel add gallons invalid\n")
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        with pytest.raises(ValueError, match="Line 2: "):
+            apply_operations(data_store, str(operations))
+        mock_save.assert_not_called()
+    assert "fuel" not in data_store.units
+    assert "fuel" not in data_store.base_units
+    assert data_store.dirty == set()
+
+def test_apply_operations_invalid_command(data_store, tmp_path):
+    operations = tmp_path / "operations.txt"
+    operations.write_text("groups\n")
+    with pytest.raises(ValueError, match="Line 1: 'groups' can't be applied!"):
+        apply_operations(data_store, str(operations))
+
+@pytest.mark.parametrize("line, message", [
+    ("mt length bogus", "Line 2: the following arguments are required: unit_type"),
+    ("invalid", "Line 2: argument command: invalid choice: 'invalid'"),
+    ("mt length add 'new_type", "Line 2: No closing quotation")
+])
+def test_apply_operations_invalid_usage(data_store, tmp_path, capsys, line, message):
+    operations = tmp_path / "operations.txt"
+    operations.write_text(f"manage-group add fuel liters\n{line}\n")
+    with pytest.raises(ValueError) as e:
+        apply_operations(data_store, str(operations))
+    assert e.value.args[0].startswith(message)
+    assert "fuel" not in data_store.units
+    assert capsys.readouterr().err == ""
+
+
+# Test 'build_conversion_data' function
+def test_build_conversion_data(data_store):
+    conversion_data = build_conversion_data(data_store, "Length", ["KM", "m", "5"])
+    assert (conversion_data.unit_group, conversion_data.from_type, conversion_data.to_type, conversion_data.amount) == ("length", "km", "m", 5.0)
+
+def test_build_conversion_data_default_amount(data_store):
+    assert build_conversion_data(data_store, "length", ["km", "m"]).amount == 1.0
+
+def test_build_conversion_data_time(data_store):
+    assert build_conversion_data(data_store, "time", ["Minutes", "seconds", "1"]).time_input == "minutes seconds 1"
+
+def test_build_conversion_data_invalid_format(data_store):
+    with pytest.raises(ValueError, match="Invalid format for non-time conversion!"):
+        build_conversion_data(data_store, "length", ["km"])
+
+def test_build_conversion_data_infer_group(data_store):
+    conversion_data = build_conversion_data(data_store, "KM", ["mi", "5"])
+    assert (conversion_data.unit_group, conversion_data.from_type, conversion_data.to_type, conversion_data.amount) == ("length", "km", "mi", 5.0)
+
+def test_build_conversion_data_infer_group_time(data_store):
+    conversion_data = build_conversion_data(data_store, "minutes", ["seconds"])
+    assert (conversion_data.unit_group, conversion_data.time_input) == ("time", "minutes seconds 1")
+
+def test_build_conversion_data_infer_group_different_groups(data_store):
+    with pytest.raises(ValueError, match="'km' and 'kg' don't belong to the same unit group!"):
+        build_conversion_data(data_store, "km", ["kg"])
+
+
+# Test 'serve_stdin' function
+def test_serve_stdin(data_store):
+    input_stream = io.StringIO("length km m 5\nconvert temperature c f 100\ntime minutes seconds 1\n")
+    output_stream = io.StringIO()
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert serve_stdin(data_store, input_stream, output_stream) == 3
+        assert mocked_add_to_log.call_count == 3
+    assert output_stream.getvalue().splitlines() == ["5.0 kilometers = 5,000.0 meters", "100.0 celsius = 212.0 fahrenheit", "1.0 minutes = 60.0 seconds"]
+
+def test_serve_stdin_errors(data_store):
+    input_stream = io.StringIO("\nlength km\nlength invalid m\nlength km m abc\nlength km m 1\n")
+    output_stream = io.StringIO()
+    with patch("project.add_to_log"):
+        assert serve_stdin(data_store, input_stream, output_stream) == 5
+    assert output_stream.getvalue().splitlines() == [
+        "Error: Invalid request! Usage: [unit_group] <from_type> <to_type> [amount]",
+        "Error: Invalid format for non-time conversion! Usage: <from_type> <to_type> [amount]",
+        "Error: Invalid unit type!",
+        "Error: could not convert string to float: 'abc'",
+        "1.0 kilometers = 1,000.0 meters"
+    ]
+
+
+# Test 'run_cli' function
+def test_run_cli(data_store, capsys):
+    assert run_cli(data_store, ["project.py", "groups"]) == 0
+    assert capsys.readouterr().out == "Groups: length, time, mass, temperature, volume, area, speed\n"
+
+def test_run_cli_error(data_store, capsys):
+    assert run_cli(data_store, ["project.py", "types", "invalid"]) == 1
+    assert capsys.readouterr().out == "Error: 'invalid' is not a valid group!\n"
+
+@pytest.mark.parametrize("args, message", [
+    (["mg", "add", "energy", "joule"], "You've just created a 'energy' group, with 'joule' as its base unit!"),
+    (["mt", "length", "remove", "miles"], "'miles' was removed from 'length'"),
+    (["mg", "remove", "volume"], "Group 'volume' successfully removed!")
+])
+def test_run_cli_lazy_catalog(catalog_dir, capsys, args, message):
+    # Starts without 'catalog.cache', so each dataset is read and validated when the command first uses it
+    assert not (catalog_dir / "catalog.cache").exists()
+    assert run_cli(DataStore(loader=CatalogLoader()), ["project.py", *args]) == 0
+    assert capsys.readouterr().out == message + "\n"
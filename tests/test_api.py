@@ -9,8 +9,9 @@ from unit_converter.api import Converter
 @pytest.fixture
 def converter():
     with patch("project.save_data") as mocked_save_data:
-        mocked_save_data.return_value = None
-        yield Converter()
+        with patch("unit_converter.data_manager.save_data"):
+            mocked_save_data.return_value = None
+            yield Converter()
 
 
 # Test 'groups' action
@@ -51,6 +52,30 @@ def test_history_alias(converter):
     assert "50,000.12306 meters = 54,680.7995 yards (Group: length)" in result
 
 
+def test_history_filters(converter):
+    converter.conversion_log = [
+        {
+            "date": "2025-09-20T18:39:27.743896",
+            "unit_group": "length",
+            "from_type": "meters",
+            "to_type": "yards",
+            "amount": 50000.123059,
+            "result": 54680.799495844265
+        },
+        {
+            "date": "2025-09-23T09:39:56.914011",
+            "unit_group": "time",
+            "from_time": "minutes",
+            "to_time": "seconds",
+            "factor_time": 1.0,
+            "result": 60.0
+        }
+    ]
+    assert converter.history(unit_group="length") == "50,000.12306 meters = 54,680.7995 yards (Group: length)"
+    assert converter.history(since="2025-09-21") == "1.0 minutes = 60.0 seconds (Group: time)"
+    assert converter.history(unit_group="length", unit_type="yd") == "50,000.12306 meters = 54,680.7995 yards (Group: length)"
+    assert converter.history(until="invalid") == "Error: Invalid date: 'invalid'! Usage: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS"
+
 def test_history_empty(converter):
     converter.conversion_log = []
     assert converter.history() == "Error: Conversion history is empty!"
@@ -158,6 +183,11 @@ def test_convert_alias(converter):
 def test_convert_print_message(converter):
     assert converter.convert("length", "m yd 10", print_message=True) == "10.0 meters = 10.93613 yards"
 
+def test_convert_no_log(converter):
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert converter.convert("length", "m yd 10", log=False) == 10.936132983377078
+        mocked_add_to_log.assert_not_called()
+
 def test_convert_time(converter):
     assert converter.convert("time", "JAN DEC days") == 365.0
 
@@ -183,6 +213,57 @@ def test_convert_extra_kwargs(converter):
     assert converter.convert(unit_group="length", user_input="m yd 10", extra="extra") == "Error: Unexpected keyword argument for 'convert' command!"
 
 
+# Test 'convert_amount' action
+def test_convert_amount(converter):
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert converter.convert_amount("Length", "m", "YD", 10) == converter.convert("length", "m yd 10", log=False)
+        conversion_data = mocked_add_to_log.call_args.args[1]
+        assert (conversion_data.from_type, conversion_data.to_type, conversion_data.amount, conversion_data.new_value) == ("meters", "yards", 10.0, 10.936132983377078)
+
+def test_convert_amount_time(converter):
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert converter.convert_amount("time", "years", "days", 1) == 365.25
+        conversion_data = mocked_add_to_log.call_args.args[1]
+        assert (conversion_data.from_time, conversion_data.to_time, conversion_data.factor_time, conversion_data.new_time) == ("years", "days", 1.0, 365.25)
+        assert mocked_add_to_log.call_args.kwargs == {"is_time_convertion": True}
+
+def test_convert_amount_no_log(converter):
+    with patch("project.add_to_log") as mocked_add_to_log:
+        assert converter.convert_amount("temperature", "c", "f", 100, log=False) == 212.0
+        mocked_add_to_log.assert_not_called()
+
+def test_convert_amount_negative_kelvin(converter):
+    assert converter.convert_amount("temperature", "kelvin", "celsius", -1) == "Error: Kelvin temperature cannot be negative!"
+
+def test_convert_amount_invalid_amount(converter):
+    assert converter.convert_amount("length", "m", "yd", "invalid") == "Error: Invalid amount!"
+
+def test_convert_amount_invalid_type(converter):
+    assert converter.convert_amount("length", "invalid", "yd", 1) == "Error: Unit type 'invalid' not found in 'length' group neither its aliases!"
+
+
+# Test 'convert_many' action
+def test_convert_many(converter):
+    np = pytest.importorskip("numpy")
+    result = converter.convert_many("length", "m", "yd", np.array([10.0, 20.0]))
+    assert result.tolist() == [10.936132983377078, 21.872265966754156]
+
+def test_convert_many_temperature(converter):
+    np = pytest.importorskip("numpy")
+    result = converter.convert_many("temperature", "celsius", "kelvin", np.array([10.0, 0.0]))
+    assert result.tolist() == [283.15, 273.15]
+
+def test_convert_many_negative_kelvin(converter):
+    np = pytest.importorskip("numpy")
+    assert converter.convert_many("temperature", "kelvin", "celsius", np.array([10.0, -1.0])) == "Error: Kelvin temperature cannot be negative!"
+
+def test_convert_many_invalid_group(converter):
+    assert converter.convert_many("invalid", "m", "yd", [10.0]) == "Error: 'invalid' is not a valid group!"
+
+def test_convert_many_invalid_type(converter):
+    assert converter.convert_many("length", "m", "invalid", [10.0]) == "Error: Unit type 'invalid' not found in 'length' group neither its aliases!"
+
+
 # Test 'manage-group' action
 def test_manage_group_add(converter):
     assert converter.manage_group("new_group", "add new_base_unit") == "You've just created a 'new_group' group, with 'new_base_unit' as its base unit!"
@@ -196,6 +277,13 @@ def test_manage_group_alias_add(converter):
 def test_manage_group_alias_remove(converter):
     assert converter.mg("length", "remove") == "Group 'length' successfully removed!"
 
+def test_manage_group_lazy_catalog(catalog_dir):
+    # Starts without 'catalog.cache', so each dataset is read and validated when it's first used
+    assert not (catalog_dir / "catalog.cache").exists()
+    converter = Converter()
+    assert converter.manage_group("energy", "add joule") == "You've just created a 'energy' group, with 'joule' as its base unit!"
+    assert converter.base_units["energy"] == "joule"
+
 def test_manage_group_add_print_message(converter):
     message = converter.manage_group("new_group", "add new_base_unit", print_message=True)
     assert message == "You've just created a 'new_group' group, with 'new_base_unit' as its base unit!"
@@ -415,4 +503,90 @@ def test_change_base_extra_args(converter):
 
 def test_change_base_extra_kwargs(converter):
     converter.base_units["length"] = "meters"
-    assert converter.change_base(unit_group="length", user_input="yards", extra="extra") == "Error: Unexpected keyword argument for 'change-base' command!"
\ No newline at end of file
+    assert converter.change_base(unit_group="length", user_input="yards", extra="extra") == "Error: Unexpected keyword argument for 'change-base' command!"
+
+# Test 'convert_stream' method
+def test_convert_stream(converter):
+    rows = converter.convert_stream([{"group": "length", "from": "m", "to": "ft", "amount": 5}, {"group": "mass", "from": "kg", "to": "g", "amount": 2}])
+    assert [row["result"] for row in rows] == [pytest.approx(16.4041994), 2000.0]
+
+def test_convert_stream_amounts(converter):
+    rows = converter.convert_stream(iter([1, 2]), unit_group="length", from_type="km", to_type="m")
+    assert list(rows) == [{"amount": 1, "result": 1000.0}, {"amount": 2, "result": 2000.0}]
+
+def test_convert_stream_error(converter):
+    assert next(converter.convert_stream([5], unit_group="length", from_type="km", to_type="invalid"))["error"] == "Unit type 'invalid' not found in 'length' group neither its aliases!"
+
+
+# Test 'converter_for' method
+def test_converter_for(converter):
+    km_to_mi = converter.converter_for("Length", "km", "mi")
+    assert km_to_mi(5) == converter.convert("length", "km mi 5", log=False)
+
+def test_converter_for_temperature(converter):
+    assert converter.converter_for("temperature", "c", "f")(100) == 212.0
+
+def test_converter_for_error(converter):
+    assert converter.converter_for("length", "invalid", "m") == "Error: Unit type 'invalid' not found in 'length' group neither its aliases!"
+
+
+# Test 'configure_cache' and 'cache_stats' methods
+def test_configure_cache(converter):
+    converter.configure_cache(max_size=10)
+    for _ in range(3):
+        assert converter.convert("time", "jan dec days", log=False) == 365.0
+    assert converter.cache_stats() == {"size": 1, "max_size": 10, "hits": 2, "misses": 1, "evictions": 0}
+
+def test_cache_disabled(converter):
+    converter.convert("length", "km m 1", log=False)
+    assert converter.cache_stats() == {"size": 0, "max_size": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+
+# Test 'infer_group' method
+def test_infer_group(converter):
+    assert converter.infer_group("KM", "mi") == "length"
+
+def test_infer_group_error(converter):
+    assert converter.infer_group("km", "invalid") == "Error: Unit type 'invalid' not found in any group!"
+
+
+# Test 'submit' method
+def test_submit(converter):
+    futures = [converter.submit("length", "km", "m", amount) for amount in [1, 2, 3]]
+    assert [future.result(timeout=5) for future in futures] == [1000.0, 2000.0, 3000.0]
+
+def test_submit_error(converter):
+    with pytest.raises(KeyError, match="'invalid' is not a valid group!"):
+        converter.submit("invalid", "km", "m", 1).result(timeout=5)
+
+def test_configure_batcher(converter):
+    converter.configure_batcher(batch_size=8, batch_window=0.01)
+    assert (converter.batcher.batch_size, converter.batcher.batch_window) == (8, 0.01)
+
+
+# Test 'convert_binary' method
+def test_convert_binary(converter, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.array([1.0, 2.0]).tofile(tmp_path / "input.f64")
+    assert converter.convert_binary(str(tmp_path / "input.f64"), "length", "km", "m") == 2
+    assert np.fromfile(tmp_path / "input.f64").tolist() == [1000.0, 2000.0]
+
+def test_convert_binary_error(converter, tmp_path):
+    assert converter.convert_binary(str(tmp_path / "input.f64"), "invalid", "km", "m") == "Error: 'invalid' is not a valid group!"
+
+
+# Test 'batch' method
+def test_batch(converter):
+    with converter.batch():
+        converter.manage_group("fuel", "add liters")
+        converter.manage_type("fuel", "add gallons 3.785")
+        converter.aliases("fuel", "add gallons gal")
+    assert converter.convert("fuel", "gal liters 2", log=False) == 7.57
+
+def test_batch_rollback(converter):
+    with pytest.raises(ValueError):
+        with converter.batch():
+            converter.manage_group("fuel", "add liters")
+            converter.manage_type("fuel", "add gallons invalid")
+    assert "fuel" not in converter.units
+    assert converter.manage_type("fuel", "add gallons 3.785") == "Error: 'fuel' is not a valid group!"
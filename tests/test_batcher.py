@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from unit_converter.batcher import ConversionBatcher, validate_amount
+from unit_converter.data_manager import load_data
+from unit_converter.data_models import DataStore
+
+
+# Setup ConversionBatcher to be used on all tests
+@pytest.fixture
+def batcher():
+    return ConversionBatcher(DataStore(*load_data()), batch_size=4, batch_window=0.01)
+
+
+# Test 'ConversionBatcher' class methods
+def test_submit(batcher):
+    assert batcher.submit("length", "km", "m", 5).result(timeout=5) == 5000.0
+
+def test_submit_awaitable(batcher):
+    async def run() -> list[float]:
+        return await asyncio.gather(*(asyncio.wrap_future(batcher.submit("Temperature", "C", "f", amount)) for amount in [0, "100"]))
+    assert asyncio.run(run()) == [32.0, 212.0]
+
+def test_submit_invalid_pair(batcher):
+    with pytest.raises(KeyError, match="Unit type 'invalid' not found in 'length' group neither its aliases!"):
+        batcher.submit("length", "invalid", "m", 1).result(timeout=5)
+
+def test_submit_invalid_amount(batcher):
+    with pytest.raises(ValueError, match="Invalid amount!"):
+        batcher.submit("length", "km", "m", "invalid").result(timeout=5)
+
+def test_convert_batch(batcher):
+    requests = [(unit_group, from_type, to_type, amount, Future()) for unit_group, from_type, to_type, amount in [("length", "km", "m", 1), ("temperature", "kelvin", "celsius", -1), ("length", "kilometers", "m", 2), ("invalid", "km", "m", 1), ("length", "km", "m", 3)]]
+    with patch.object(batcher.data.engine, "convert_many", wraps=batcher.data.engine.convert_many) as mocked_convert_many:
+        batcher.convert_batch(requests)
+        # Both 'km' requests are converted at once
+        assert mocked_convert_many.call_count == 2
+    assert [requests[index][4].result() for index in [0, 2, 4]] == [1000.0, 2000.0, 3000.0]
+    assert str(requests[1][4].exception()) == "Kelvin temperature cannot be negative!"
+    assert requests[3][4].exception().args[0] == "'invalid' is not a valid group!"
+
+def test_convert_batch_cancelled(batcher):
+    future = Future()
+    future.cancel()
+    batcher.convert_batch([("length", "km", "m", 1, future)])
+    assert future.cancelled()
+
+def test_convert_batch_without_numpy(batcher):
+    requests = [("length", "km", "m", amount, Future()) for amount in [1, 2]]
+    with patch("unit_converter.batcher.np", None):
+        batcher.convert_batch(requests)
+    assert [future.result() for *_, future in requests] == [1000.0, 2000.0]
+
+def test_flush(batcher):
+    # Dispatcher thread isn't started, so requests wait until they are flushed
+    with patch.object(batcher, "start"):
+        future = batcher.submit("mass", "kg", "g", 2)
+        assert not future.done()
+        batcher.flush()
+    assert future.result() == 2000.0
+
+def test_run_batch_size(batcher):
+    with patch.object(batcher, "start"), patch.object(batcher, "convert_batch", side_effect=[None, StopIteration]) as mocked_convert_batch:
+        for amount in range(6):
+            batcher.submit("length", "km", "m", amount)
+        with pytest.raises(StopIteration):
+            batcher._run()
+    assert [len(call.args[0]) for call in mocked_convert_batch.call_args_list] == [4, 2]
+
+def test_configure(batcher):
+    batcher.configure(batch_size=10, batch_window=0.5)
+    assert (batcher.batch_size, batcher.batch_window) == (10, 0.5)
+
+def test_configure_invalid_batch_size(batcher):
+    with pytest.raises(ValueError, match="'batch_size' must be a positive number!"):
+        batcher.configure(batch_size=0)
+
+def test_configure_invalid_batch_window(batcher):
+    with pytest.raises(ValueError, match="'batch_window' can't be a negative number!"):
+        batcher.configure(batch_window=-1)
+
+
+# Test 'validate_amount' function
+def test_validate_amount():
+    assert validate_amount("length", "meters", "2.5") == 2.5
+
+def test_validate_amount_negative_kelvin():
+    with pytest.raises(ValueError, match="Kelvin temperature cannot be negative!"):
+        validate_amount("temperature", "kelvin", -1)
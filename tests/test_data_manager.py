@@ -1,9 +1,11 @@
+import json
 import pytest
 
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
-from unit_converter.data_manager import load_data, validate_data, add_to_log, clean_history, save_data, refactor_value, zero_division_checker
-from unit_converter.data_models import DataStore
+from unit_converter.data_manager import BASE_DIR, CatalogLoader, load_data, validate_data, add_to_log, get_history, configure_history, load_log, read_last_lines, append_to_log, flush_log, clean_history, save_data, batch_changes, migrate_to_snapshot, export_snapshot, refactor_value, zero_division_checker
+from unit_converter.data_models import DataStore, ConversionData, HistoryData
 
 
 # Setup DataStore to be used on all tests that require DataStore
@@ -16,11 +18,382 @@ def data_store():
 
 # TODO: Test 'vlaidate_data' function
 
-# TODO: Test 'add_to_log' function
+# Setup an empty history directory, so that tests never touch the real history
+@pytest.fixture
+def log_dir(tmp_path):
+    path = tmp_path / "data" / "history"
+    # Entries queued by other tests are written to the real history first
+    flush_log()
+    with patch("unit_converter.data_manager.BASE_DIR", tmp_path):
+        with patch("unit_converter.data_manager.LOG_DIR", path):
+            with patch("unit_converter.data_manager.DATABASE_PATH", tmp_path / "history.sqlite3"):
+                # Expired entries are only deleted when tests call 'clean_history'
+                with patch("unit_converter.data_manager.HISTORY_CLEANED", True):
+                    yield path
+                flush_log()
+
+
+# Test 'add_to_log' function
+def test_add_to_log(data_store, log_dir):
+    data_store.conversion_log = []
+    conversion_data = ConversionData(unit_group="length", from_type="meters", to_type="yards", amount=10.0, new_value=10.936132983377078)
+    add_to_log(data_store, conversion_data)
+    add_to_log(data_store, conversion_data)
+    flush_log()
+    lines = (log_dir / f"{datetime.now().date().isoformat()}.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[-1])["result"] == 10.936132983377078
+    # Dates always have microseconds, so that they can be compared as strings
+    assert len(json.loads(lines[-1])["date"]) == len("2025-09-20T18:39:27.743896")
+    assert len(data_store.conversion_log) == 2
+
+def test_add_to_log_missing_args(data_store, log_dir):
+    with pytest.raises(ValueError, match="Missing required arguments!"):
+        add_to_log(data_store, ConversionData(unit_group="length"))
+
+
+# Test 'get_history' function
+def test_get_history_in_memory(data_store):
+    data_store.conversion_log = [{"result": 1.0}, {"result": 2.0}]
+    assert get_history(data_store, 1) == [{"result": 2.0}]
+
+def test_get_history_from_disk(data_store, log_dir):
+    data_store.conversion_log = None
+    append_to_log([{"date": "2025-09-20T18:39:27.743896"}, {"date": "2025-09-21T08:00:00.000000"}])
+    assert get_history(data_store, 1) == [{"date": "2025-09-21T08:00:00.000000"}]
+
+def test_get_history_filters_from_disk(data_store, log_dir):
+    data_store.conversion_log = None
+    append_to_log([{"date": "2025-09-20T18:39:27.743896", "unit_group": "length"}, {"date": "2025-09-21T08:00:00.000000", "unit_group": "time"}, {"date": "2025-09-22T08:00:00.000000", "unit_group": "time"}])
+    history_data = HistoryData(unit_group="length")
+    assert get_history(data_store, 10, history_data) == [{"date": "2025-09-20T18:39:27.743896", "unit_group": "length"}]
+    history_data = HistoryData(since="2025-09-21", until="2025-09-21")
+    history_data.validate_for_history(data_store)
+    assert get_history(data_store, 10, history_data) == [{"date": "2025-09-21T08:00:00.000000", "unit_group": "time"}]
+
+def test_get_history_sqlite(data_store, log_dir):
+    data_store.conversion_log = None
+    configure_history("sqlite")
+    try:
+        conversion_data = ConversionData(unit_group="length", from_type="meters", to_type="yards", amount=10.0, new_value=10.936132983377078)
+        add_to_log(data_store, conversion_data)
+        assert get_history(data_store, 10, HistoryData(unit_group="length", unit_type="yards"))[0]["result"] == 10.936132983377078
+        assert get_history(data_store, 10, HistoryData(unit_group="time")) == []
+        assert not log_dir.exists()
+    finally:
+        configure_history("files")
+
+def test_configure_history_invalid():
+    with pytest.raises(ValueError, match="Invalid history backend: 'invalid'"):
+        configure_history("invalid")
+
+
+# Test 'read_last_lines' function
+def test_read_last_lines(tmp_path):
+    path = tmp_path / "segment.jsonl"
+    path.write_text("".join(f"line {number}\n" for number in range(1000)))
+    with patch("unit_converter.data_manager.BLOCK_SIZE", 16):
+        assert read_last_lines(path, 3) == ["line 997", "line 998", "line 999"]
+
+def test_read_last_lines_short_file(tmp_path):
+    path = tmp_path / "segment.jsonl"
+    path.write_text("line 0\nline 1\n")
+    assert read_last_lines(path, 10) == ["line 0", "line 1"]
+
+def test_read_last_lines_zero(tmp_path):
+    path = tmp_path / "segment.jsonl"
+    path.write_text("line 0\n")
+    assert read_last_lines(path, 0) == []
+
+
+# Test 'append_to_log' function
+def test_append_to_log_segments(log_dir):
+    append_to_log([{"date": "2025-09-20T18:39:27.743896"}, {"date": "2025-09-21T08:00:00.000000"}])
+    assert sorted(path.name for path in log_dir.iterdir()) == ["2025-09-20.jsonl", "2025-09-21.jsonl"]
+
+
+# Test 'load_log' function
+def test_load_log(log_dir):
+    append_to_log([{"date": "2025-09-20T18:39:27.743896", "unit_group": "length"}])
+    assert load_log() == [{"date": "2025-09-20T18:39:27.743896", "unit_group": "length"}]
+
+def test_load_log_missing_directory(log_dir):
+    assert load_log() == []
+
+def test_load_log_limit(log_dir):
+    append_to_log([{"date": "2025-09-20T18:39:27.743896"}, {"date": "2025-09-21T08:00:00.000000"}, {"date": "2025-09-22T08:00:00.000000"}])
+    # Oldest segment is not even opened
+    (log_dir / "2025-09-20.jsonl").write_text("corrupted")
+    assert load_log(limit=2) == [{"date": "2025-09-21T08:00:00.000000"}, {"date": "2025-09-22T08:00:00.000000"}]
+
+def test_load_log_limit_across_segments(log_dir):
+    append_to_log([{"date": "2025-09-20T18:39:27.743896"}, {"date": "2025-09-21T08:00:00.000000"}, {"date": "2025-09-21T09:00:00.000000"}])
+    assert load_log(limit=2) == [{"date": "2025-09-21T08:00:00.000000"}, {"date": "2025-09-21T09:00:00.000000"}]
+    assert load_log(limit=3)[0] == {"date": "2025-09-20T18:39:27.743896"}
+
+def test_load_log_legacy_file(tmp_path, log_dir):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "conversion_log.json").write_text(json.dumps([{"date": "2025-09-20T18:39:27.743896"}]))
+    assert load_log() == [{"date": "2025-09-20T18:39:27.743896"}]
+    assert not (tmp_path / "data" / "conversion_log.json").exists()
+    assert (log_dir / "2025-09-20.jsonl").exists()
+
+
+# Test 'clean_history' function
+def test_clean_history(log_dir):
+    old_entry = {"date": (datetime.now() - timedelta(days=4)).isoformat()}
+    new_entry = {"date": datetime.now().isoformat()}
+    append_to_log([old_entry, new_entry])
+    clean_history()
+    assert load_log() == [new_entry]
+
+def test_clean_history_retention(log_dir):
+    old_entry = {"date": (datetime.now() - timedelta(days=60)).isoformat()}
+    append_to_log([old_entry])
+    clean_history(retention_days=90)
+    assert load_log() == [old_entry]
+
+def test_clean_history_sqlite(data_store, log_dir):
+    configure_history("sqlite")
+    try:
+        add_to_log(data_store, ConversionData(unit_group="length", from_type="meters", to_type="yards", amount=10.0, new_value=10.936132983377078))
+        flush_log()
+        clean_history(retention_days=-1)
+        data_store.conversion_log = None
+        assert get_history(data_store, 10) == []
+    finally:
+        configure_history("files")
+
+def test_clean_history_empty(log_dir):
+    clean_history()
+    assert not log_dir.exists()
+
+
+# Test 'batch_changes' function
+def test_batch_changes_commit(data_store):
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        with batch_changes(data_store):
+            data_store.unit_aliases["length"]["mtr"] = "meters"
+            data_store.mark_dirty("unit_aliases")
+            save_data(data_store)
+            assert data_store.batching
+        mock_save.assert_called_once_with(data_store)
+    assert not data_store.batching
+    assert data_store.unit_aliases["length"]["mtr"] == "meters"
+
+def test_batch_changes_rollback(data_store):
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        with pytest.raises(KeyError, match="invalid"):
+            with batch_changes(data_store):
+                data_store.units["length"]["new_type"] = 2.0
+                data_store.engine.build_group("length")
+                data_store.mark_dirty("units")
+                raise KeyError("invalid")
+        mock_save.assert_not_called()
+    assert "new_type" not in data_store.units["length"]
+    assert "new_type" not in data_store.engine.factors["length"]
+    assert data_store.dirty == set()
+    assert not data_store.batching
+
+def test_batch_changes_rebuilds_groups_once(data_store):
+    data_store.engine
+    with patch("unit_converter.data_manager.save_data"):
+        with patch.object(data_store.engine, "build_group", wraps=data_store.engine.build_group) as mock_build:
+            with batch_changes(data_store):
+                for index in range(3):
+                    data_store.units["length"][f"new_type_{index}"] = index + 2.0
+                    data_store.original_units["length"][f"new_type_{index}"] = index + 2.0
+                    data_store.refresh_engine("length", f"new_type_{index}")
+                mock_build.assert_not_called()
+            mock_build.assert_called_once_with("length")
+    assert data_store.engine.convert("length", "new_type_2", "meters", 1.0) == 4.0
+
+def test_batch_changes_validation_error(data_store):
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        with pytest.raises(KeyError, match="The base unit 'invalid' for length group is not present on 'units.json'!"):
+            with batch_changes(data_store):
+                data_store.base_units["length"] = "invalid"
+        mock_save.assert_not_called()
+    assert data_store.base_units["length"] == "meters"
+
+def test_batch_changes_nested(data_store):
+    with patch("unit_converter.data_manager.save_data") as mock_save:
+        with batch_changes(data_store):
+            with batch_changes(data_store):
+                data_store.mark_dirty("units")
+            assert data_store.batching
+        mock_save.assert_called_once()
+
+
+# Setup the copy of the unit catalog used by each test (see 'conftest.py')
+@pytest.fixture
+def data_dir(catalog_dir):
+    return catalog_dir
+
+
+# Test 'save_data' function
+def test_save_data_only_dirty(data_dir):
+    data = DataStore(*load_data())
+    modified = {file_name: (data_dir / f"{file_name}.json").stat().st_mtime_ns for file_name in ["units", "base_units", "unit_aliases"]}
+    data.units["length"]["new_type"] = 2.0
+    data.mark_dirty("units")
+    save_data(data)
+    assert json.loads((data_dir / "units.json").read_text())["length"]["new_type"] == 2.0
+    assert (data_dir / "base_units.json").stat().st_mtime_ns == modified["base_units"]
+    assert (data_dir / "unit_aliases.json").stat().st_mtime_ns == modified["unit_aliases"]
+    assert data.dirty == set()
+    assert not list(data_dir.glob(".*.tmp"))
+
+def test_save_data_nothing_dirty(data_dir):
+    load_data()
+    save_data(DataStore(*load_data()))
+    assert (data_dir / "catalog.cache").exists()
+
+def test_save_data_interrupted(data_dir):
+    data = DataStore(*load_data())
+    data.units["length"]["new_type"] = 2.0
+    data.original_units["length"]["new_type"] = 2.0
+    data.mark_dirty("units", "original_units")
+    # Nothing is replaced when any file can't be fully written
+    with patch("unit_converter.data_manager.write_temp_file", side_effect=[data_dir / ".original_units.json.tmp", PermissionError]):
+        save_data(data)
+    assert "new_type" not in json.loads((data_dir / "units.json").read_text())["length"]
+    assert "new_type" not in json.loads((data_dir / "original_units.json").read_text())["length"]
+    assert data.dirty == {"units", "original_units"}
+
+
+# Test 'migrate_to_snapshot' and 'export_snapshot' functions
+def test_migrate_to_snapshot(data_dir):
+    expected = load_data()
+    sources = {path.name: path.read_text() for path in data_dir.glob("*.json")}
+    migrate_to_snapshot()
+    assert {path.name: path.read_text() for path in data_dir.glob("*.json") if path.name != "catalog.json"} == sources
+    assert json.loads((data_dir / "catalog.json").read_text())["version"] == 1
+    assert load_data() == expected
+
+def test_migrate_to_snapshot_remove_sources(data_dir):
+    expected = load_data()
+    migrate_to_snapshot(remove_sources=True)
+    assert [path.name for path in data_dir.glob("*.json")] == ["catalog.json"]
+    assert load_data() == expected
+
+def test_migrate_to_snapshot_twice(data_dir):
+    migrate_to_snapshot()
+    with pytest.raises(ValueError, match="Unit catalog is already stored in a snapshot file!"):
+        migrate_to_snapshot()
+
+def test_save_data_snapshot(data_dir):
+    migrate_to_snapshot()
+    data = DataStore(base_units={"length": "feet"})
+    data.mark_dirty("base_units")
+    save_data(data)
+    assert json.loads((data_dir / "catalog.json").read_text())["base_units"] == {"length": "feet"}
+    assert json.loads((data_dir / "base_units.json").read_text()) != {"length": "feet"}
+
+def test_export_snapshot(data_dir):
+    expected = load_data()
+    migrate_to_snapshot(remove_sources=True)
+    export_snapshot()
+    assert not (data_dir / "catalog.json").exists()
+    assert not list(data_dir.glob(".*.tmp"))
+    assert load_data() == expected
+
+def test_export_snapshot_replaces_sources(data_dir):
+    migrate_to_snapshot()
+    data = DataStore(base_units={"length": "feet"})
+    data.mark_dirty("base_units")
+    save_data(data)
+    export_snapshot()
+    assert json.loads((data_dir / "base_units.json").read_text()) == {"length": "feet"}
+
+def test_export_snapshot_missing(data_dir):
+    with pytest.raises(ValueError, match="There's no snapshot file to export!"):
+        export_snapshot()
+
+def test_load_data_snapshot_version(data_dir):
+    migrate_to_snapshot()
+    (data_dir / "catalog.json").write_text(json.dumps({"version": 99}))
+    with pytest.raises(ValueError, match="'catalog.json' version is not supported!"):
+        load_data()
+
+
+# Test unit catalog cache
+def test_load_data_writes_cache(data_dir):
+    expected = load_data()
+    assert (data_dir / "catalog.cache").exists()
+    with patch("unit_converter.data_manager.validate_data") as mock_validate:
+        assert load_data() == expected
+        mock_validate.assert_not_called()
+
+def test_load_data_cache_invalidated(data_dir):
+    load_data()
+    (data_dir / "base_units.json").write_text(json.dumps({**json.loads((data_dir / "base_units.json").read_text()), "length": "feet"}, indent=4))
+    with patch("unit_converter.data_manager.validate_data") as mock_validate:
+        assert load_data()[1]["length"] == "feet"
+        mock_validate.assert_called_once()
+
+def test_load_data_corrupted_cache(data_dir):
+    expected = load_data()
+    (data_dir / "catalog.cache").write_bytes(b"corrupted")
+    assert load_data() == expected
+
+def test_save_data_clears_cache(data_dir):
+    data = DataStore(*load_data())
+    data.mark_dirty("units")
+    save_data(data)
+    assert not (data_dir / "catalog.cache").exists()
+
+def test_load_data_cache_snapshot(data_dir):
+    expected = load_data()
+    migrate_to_snapshot()
+    load_data()
+    with patch("unit_converter.data_manager.validate_data") as mock_validate:
+        assert load_data() == expected
+        mock_validate.assert_not_called()
+
+
+# Test 'CatalogLoader' class
+def test_catalog_loader_only_used_datasets(data_dir):
+    loader = CatalogLoader()
+    data = DataStore(loader=loader)
+    assert "meters" in data.units["length"]
+    assert list(loader.datasets) == ["units"]
+    assert not (data_dir / "catalog.cache").exists()
+
+def test_catalog_loader_validates_relationships(data_dir):
+    (data_dir / "base_units.json").write_text(json.dumps({"length": "meters"}))
+    loader = CatalogLoader()
+    loader("units")
+    with pytest.raises(KeyError, match="'time' should also be a key in 'base_units.json'!"):
+        loader("base_units")
+
+def test_catalog_loader_writes_cache(data_dir):
+    expected = load_data()
+    (data_dir / "catalog.cache").unlink()
+    loader = CatalogLoader()
+    for file_name in ["month_aliases", "units", "original_units", "base_units", "month_days", "unit_aliases"]:
+        loader(file_name)
+    assert (data_dir / "catalog.cache").exists()
+    loader = CatalogLoader()
+    assert loader("units") == expected[0]
+    assert loader.catalog is not None and not loader.datasets
 
-# TODO: Test 'clean_history' function
+def test_catalog_loader_snapshot(data_dir):
+    expected = load_data()
+    migrate_to_snapshot()
+    loader = CatalogLoader()
+    assert loader("month_days") == expected[4]
 
-# TODO: Test 'save_data' function
+def test_catalog_loader_validates_as_read(data_dir):
+    loader = CatalogLoader()
+    data = DataStore(loader=loader)
+    # Changes made before the other datasets are loaded don't break their validation
+    data.units["energy"] = {"joule": 1.0}
+    data.units["length"].pop("miles")
+    assert data.base_units["length"] == "meters"
+    for file_name in ["unit_aliases", "original_units", "month_days", "month_aliases"]:
+        getattr(data, file_name)
+    assert "energy" not in load_data()[0]
 
 
 # Test 'refactor_value' function
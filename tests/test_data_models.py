@@ -4,7 +4,7 @@ import re
 from unittest.mock import patch
 
 from unit_converter.data_manager import load_data
-from unit_converter.data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, validate_for_history, validate_args_number
+from unit_converter.data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, HistoryData, validate_for_history, validate_args_number
 
 
 # Setup DataStore to be used on all tests that require DataStore
@@ -34,6 +34,55 @@ def change_base_data():
     return ChangeBaseData(unit_group="length", new_base_unit=None)
 
 
+# Test 'DataStore' class
+def test_data_store_lazy_datasets():
+    loaded = []
+    def loader(name):
+        loaded.append(name)
+        return {"length": {"meters": 1.0, "feet": 0.3048}}
+    data = DataStore(loader=loader)
+    assert loaded == []
+    assert data.units["length"]["meters"] == 1.0
+    assert data.units["length"]["feet"] == 0.3048
+    assert loaded == ["units"]
+
+def test_data_store_lazy_engine():
+    data = DataStore(loader=lambda name: {"length": {"meters": 1.0, "feet": 0.3048}})
+    assert data.engine.convert("length", "feet", "meters", 10.0) == pytest.approx(3.048)
+
+def test_data_store_refresh_engine(data_store):
+    data_store.engine
+    data_store.units["length"]["new_type"] = 2.0
+    data_store.refresh_engine("length", "new_type")
+    assert data_store.engine.convert("length", "new_type", "meters", 5.0) == 10.0
+    data_store.units["length"].pop("new_type")
+    data_store.refresh_engine("length", "new_type")
+    assert "new_type" not in data_store.engine.factors["length"]
+    data_store.units.pop("length")
+    data_store.refresh_engine("length")
+    assert "length" not in data_store.engine.factors
+
+def test_data_store_refresh_engine_not_built(data_store):
+    data_store.refresh_engine("length")
+    assert data_store._engine is None
+
+def test_data_store_refresh_engine_batching(data_store):
+    data_store.engine
+    data_store.batching = True
+    data_store.units["length"]["new_type"] = 2.0
+    data_store.refresh_engine("length", "new_type")
+    assert "new_type" not in data_store.engine.factors["length"]
+    assert data_store.stale_groups == {"length"}
+    data_store.batching = False
+    data_store.rebuild_stale_groups()
+    assert data_store.engine.factors["length"]["new_type"] == 2.0
+    assert data_store.stale_groups == set()
+
+def test_data_store_not_loaded():
+    with pytest.raises(AttributeError, match="'units' was not loaded!"):
+        DataStore().units
+
+
 # Test 'ConversionData' class methods
 def test_validate_from_type(data_store, conversion_data):
     conversion_data.from_type = "meters"
@@ -590,6 +639,61 @@ def test_validate_for_change_base_already_base(data_store, change_base_data, new
         change_base_data.validate_for_change_base(data_store)
 
 
+# Test 'HistoryData' class methods
+def test_history_data_validate_dates(data_store):
+    history_data = HistoryData(since="2025-09-20", until="2025-09-21")
+    history_data.validate_for_history(data_store)
+    assert history_data.since == "2025-09-20T00:00:00.000000"
+    assert history_data.until == "2025-09-22T00:00:00.000000"
+
+def test_history_data_validate_until_time(data_store):
+    history_data = HistoryData(until="2025-09-21T10:00:00")
+    history_data.validate_for_history(data_store)
+    assert history_data.until == "2025-09-21T10:00:00.000001"
+
+def test_history_data_invalid_date(data_store):
+    with pytest.raises(ValueError, match="Invalid date: 'invalid'!"):
+        HistoryData(since="invalid").validate_for_history(data_store)
+
+def test_history_data_timezone(data_store):
+    with pytest.raises(ValueError, match="Time zones aren't supported"):
+        HistoryData(since="2025-09-20T10:00:00+02:00").validate_for_history(data_store)
+
+def test_history_data_since_after_until(data_store):
+    with pytest.raises(ValueError, match="'since' must be before 'until'!"):
+        HistoryData(since="2025-09-22", until="2025-09-21").validate_for_history(data_store)
+
+def test_history_data_resolve_alias(data_store):
+    history_data = HistoryData(unit_group="length", unit_type="m")
+    history_data.validate_for_history(data_store)
+    assert history_data.unit_type == "meters"
+
+def test_history_data_resolve_alias_without_group(data_store):
+    history_data = HistoryData(unit_type="km")
+    history_data.validate_for_history(data_store)
+    assert history_data.unit_type == "kilometers"
+
+def test_history_data_ambiguous_alias(data_store):
+    with pytest.raises(ValueError, match="'m' is an alias of many unit types \\(mach, meters, months\\)! Use '--group' to choose one"):
+        HistoryData(unit_type="m").validate_for_history(data_store)
+
+def test_history_data_unknown_type(data_store):
+    history_data = HistoryData(unit_type="invalid")
+    history_data.validate_for_history(data_store)
+    assert history_data.unit_type == "invalid"
+
+def test_history_data_matches():
+    entry = {"date": "2025-09-20T18:39:27.743896", "unit_group": "time", "from_time": "minutes", "to_time": "seconds"}
+    assert HistoryData(unit_group="time", unit_type="seconds").matches(entry)
+    assert not HistoryData(unit_group="length").matches(entry)
+    assert not HistoryData(since="2025-09-21T00:00:00.000000").matches(entry)
+
+def test_history_data_matches_exact_since(data_store):
+    history_data = HistoryData(since="2025-09-20T18:39:27")
+    history_data.validate_for_history(data_store)
+    assert history_data.matches({"date": "2025-09-20T18:39:27.000000", "unit_group": "length"})
+
+
 # Test 'validate_for_history' function
 def test_validate_for_history_empty(data_store):
     data_store.conversion_log = []
@@ -0,0 +1,124 @@
+import pytest
+
+from unit_converter.data_manager import load_data
+from unit_converter.data_models import DataStore
+from unit_converter.engine import ConversionEngine, temperature_pair
+
+
+# Setup DataStore to be used on all tests that require DataStore
+@pytest.fixture
+def data_store():
+    return DataStore(*load_data())
+
+
+# Test 'ConversionEngine' class methods
+def test_engine_convert(data_store):
+    assert data_store.engine.convert("length", "meters", "yards", 10.0) == 10.936132983377078
+
+def test_engine_convert_temperature(data_store):
+    assert data_store.engine.convert("temperature", "celsius", "kelvin", 10.0) == 283.15
+
+def test_engine_convert_temperature_to_celsius(data_store):
+    assert data_store.engine.convert("temperature", "fahrenheit", "celsius", 212.0) == pytest.approx(100.0)
+
+def test_engine_convert_invalid_type(data_store):
+    with pytest.raises(KeyError):
+        data_store.engine.convert("length", "meters", "invalid", 10.0)
+
+def test_engine_convert_zero_division():
+    engine = ConversionEngine({"length": {"meters": 1.0, "broken": 0}})
+    assert engine.convert("length", "broken", "meters", 10.0) == 0.0
+    with pytest.raises(ZeroDivisionError, match="Can't Divide by zero"):
+        engine.convert("length", "meters", "broken", 10.0)
+
+def test_engine_build_group(data_store):
+    data_store.units["length"]["new_type"] = 2.0
+    data_store.engine.build_group("length")
+    assert data_store.engine.convert("length", "new_type", "meters", 5.0) == 10.0
+
+def test_engine_build_group_only_affected(data_store):
+    mass_table = data_store.engine.factors["mass"]
+    data_store.engine.build_group("length")
+    assert data_store.engine.factors["mass"] is mass_table
+
+def test_engine_build_group_never_missing(data_store):
+    # Fails if the group is dropped (even briefly) while its table is rebuilt
+    class Tables(dict):
+        def pop(self, *args):
+            raise AssertionError("Table was dropped while rebuilding it")
+    data_store.engine.factors = Tables(data_store.engine.factors)
+    data_store.engine.affine = Tables(data_store.engine.affine)
+    data_store.engine.build_group("length")
+    data_store.engine.build_group("temperature")
+    assert data_store.engine.convert("length", "kilometers", "meters", 1.0) == 1000.0
+
+def test_engine_remove_group(data_store):
+    data_store.engine.remove_group("length")
+    assert "length" not in data_store.engine.factors
+
+def test_engine_add_type(data_store):
+    length_table = data_store.engine.factors["length"]
+    data_store.units["length"]["new_type"] = 2.0
+    data_store.engine.add_type("length", "new_type")
+    assert data_store.engine.factors["length"] is length_table
+    assert data_store.engine.convert("length", "new_type", "meters", 5.0) == 10.0
+
+def test_engine_add_type_temperature(data_store):
+    data_store.units["temperature"]["new_type"] = [2.0, 10.0]
+    data_store.engine.add_type("temperature", "new_type")
+    assert data_store.engine.convert("temperature", "celsius", "new_type", 5.0) == 20.0
+
+def test_engine_remove_type(data_store):
+    data_store.engine.remove_type("length", "miles")
+    with pytest.raises(KeyError):
+        data_store.engine.convert("length", "miles", "meters", 1.0)
+    assert data_store.engine.convert("length", "kilometers", "meters", 1.0) == 1000.0
+
+def test_engine_linear_size():
+    # One value per unit type, instead of one ratio per pair of unit types
+    engine = ConversionEngine({"length": {f"unit_{index}": float(index + 1) for index in range(3000)}})
+    assert len(engine.factors["length"]) == 3000
+    assert engine.convert("length", "unit_2999", "unit_0", 1.0) == 3000.0
+
+def test_engine_convert_many(data_store):
+    np = pytest.importorskip("numpy")
+    result = data_store.engine.convert_many("mass", "tonne", "kilograms", np.arange(3))
+    assert result.tolist() == [0.0, 1000.0, 2000.0]
+
+def test_engine_convert_many_buffer(data_store):
+    pytest.importorskip("numpy")
+    from array import array
+    result = data_store.engine.convert_many("temperature", "fahrenheit", "celsius", array("d", [32.0, 212.0]))
+    assert result.tolist() == pytest.approx([0.0, 100.0])
+
+def test_engine_convert_many_zero_division():
+    np = pytest.importorskip("numpy")
+    engine = ConversionEngine({"length": {"meters": 1.0, "broken": 0}})
+    with pytest.raises(ZeroDivisionError, match="Can't Divide by zero"):
+        engine.convert_many("length", "meters", "broken", np.ones(2))
+
+
+# Test 'temperature_pair' function
+def test_temperature_pair_from_celsius():
+    assert temperature_pair("celsius", [1.0, 0.0], "fahrenheit", [1.8, 32.0]) == (1.8, 32.0)
+
+def test_temperature_pair_zero_factor():
+    assert temperature_pair("kelvin", [0.0, 273.15], "celsius", [1.0, 0.0]) is None
+
+def test_engine_coefficients(data_store):
+    assert data_store.engine.coefficients("length", "kilometers", "meters") == (1000.0, 0.0)
+    assert data_store.engine.coefficients("temperature", "celsius", "fahrenheit") == (1.8, 32.0)
+
+def test_engine_compile_pair(data_store):
+    convert = data_store.engine.compile_pair("length", "kilometers", "meters")
+    assert [convert(amount) for amount in [1.0, 2.5]] == [1000.0, 2500.0]
+
+def test_engine_compile_pair_temperature(data_store):
+    convert = data_store.engine.compile_pair("temperature", "fahrenheit", "celsius")
+    assert convert(212.0) == data_store.engine.convert("temperature", "fahrenheit", "celsius", 212.0)
+
+def test_engine_compile_pair_negative_kelvin(data_store):
+    convert = data_store.engine.compile_pair("temperature", "kelvin", "celsius")
+    assert convert(0.0) == -273.15
+    with pytest.raises(ValueError, match="Kelvin temperature cannot be negative!"):
+        convert(-1.0)
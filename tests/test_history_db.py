@@ -0,0 +1,42 @@
+import pytest
+
+from unit_converter.history_db import HistoryDatabase
+
+
+# Setup HistoryDatabase with a few entries
+@pytest.fixture
+def history_database(tmp_path):
+    database = HistoryDatabase(tmp_path / "history.sqlite3")
+    database.append([
+        {"date": "2025-09-20T18:39:27.743896", "unit_group": "length", "from_type": "meters", "to_type": "yards", "amount": 10.0, "result": 10.936132983377078},
+        {"date": "2025-09-21T09:39:56.914011", "unit_group": "time", "from_time": "minutes", "to_time": "seconds", "factor_time": 1.0, "result": 60.0},
+        {"date": "2025-09-22T10:00:00.000000", "unit_group": "length", "from_type": "feet", "to_type": "meters", "amount": 1.0, "result": 0.3048}
+    ])
+    yield database
+    database.close()
+
+
+# Test 'HistoryDatabase' class methods
+def test_query(history_database):
+    assert [entry["result"] for entry in history_database.query(10)] == [10.936132983377078, 60.0, 0.3048]
+
+def test_query_limit(history_database):
+    assert [entry["result"] for entry in history_database.query(2)] == [60.0, 0.3048]
+
+def test_query_group(history_database):
+    assert [entry["result"] for entry in history_database.query(10, unit_group="length")] == [10.936132983377078, 0.3048]
+
+def test_query_dates(history_database):
+    assert [entry["result"] for entry in history_database.query(10, since="2025-09-21T00:00:00.000000", until="2025-09-22T00:00:00.000000")] == [60.0]
+
+def test_query_type(history_database):
+    assert [entry["result"] for entry in history_database.query(10, unit_type="meters")] == [10.936132983377078, 0.3048]
+    assert [entry["result"] for entry in history_database.query(10, unit_type="minutes")] == [60.0]
+
+def test_query_uses_index(history_database):
+    plan = history_database.connection.execute("EXPLAIN QUERY PLAN SELECT entry FROM conversion_log WHERE unit_group = ? ORDER BY date DESC LIMIT 1", ("length",)).fetchall()
+    assert "conversion_log_group" in str(plan)
+
+def test_clean(history_database):
+    history_database.clean("2025-09-21")
+    assert [entry["result"] for entry in history_database.query(10)] == [60.0, 0.3048]
@@ -0,0 +1,58 @@
+import pytest
+import time
+
+from unit_converter.log_writer import LogWriter
+
+
+# Setup LogWriter that stores every written batch
+@pytest.fixture
+def batches():
+    return []
+
+@pytest.fixture
+def log_writer(batches):
+    return LogWriter(batches.append, batch_size=2, flush_interval=60)
+
+
+# Test 'LogWriter' class methods
+def test_write_queues_entry(log_writer, batches):
+    log_writer.write({"result": 1.0})
+    assert batches == []
+    log_writer.flush()
+    assert batches == [[{"result": 1.0}]]
+
+def test_write_full_batch(log_writer, batches):
+    log_writer.write({"result": 1.0})
+    log_writer.write({"result": 2.0})
+    for _ in range(100):
+        if batches:
+            break
+        time.sleep(0.01)
+    assert batches == [[{"result": 1.0}, {"result": 2.0}]]
+
+def test_write_flush_interval(batches):
+    log_writer = LogWriter(batches.append, batch_size=100, flush_interval=0.01)
+    log_writer.write({"result": 1.0})
+    for _ in range(100):
+        if batches:
+            break
+        time.sleep(0.01)
+    assert batches == [[{"result": 1.0}]]
+
+def test_write_sync(batches):
+    log_writer = LogWriter(batches.append, sync=True)
+    log_writer.write({"result": 1.0})
+    assert batches == [[{"result": 1.0}]]
+    assert log_writer.thread is None
+
+def test_flush_empty(log_writer, batches):
+    log_writer.flush()
+    assert batches == []
+
+def test_configure_invalid_batch_size(log_writer):
+    with pytest.raises(ValueError, match="'batch_size' must be a positive number!"):
+        log_writer.configure(batch_size=0)
+
+def test_configure_invalid_flush_interval(log_writer):
+    with pytest.raises(ValueError, match="'flush_interval' must be a positive number!"):
+        log_writer.configure(flush_interval=0)
@@ -0,0 +1,135 @@
+import json
+import os
+import pytest
+import socket
+
+from unittest.mock import patch
+
+from project import run_cli
+from unit_converter import data_manager
+from unit_converter.data_manager import BASE_DIR, CatalogLoader, configure_history
+from unit_converter.data_models import DataStore
+from unit_converter.resident import ResidentServer, HEADER_SIZE, forward, forward_ready, receive_exactly
+
+
+# Setup ResidentServer, with a command that prints its arguments and working directory
+def print_command(data, args: list[str]) -> int:
+    print(" ".join(args[1:]), os.getcwd(), os.environ.get("UNIT_CONVERTER_TEST"))
+    if args[1] == "exit":
+        raise SystemExit(2)
+    return 3
+
+@pytest.fixture
+def resident(tmp_path):
+    return ResidentServer(print_command, path=tmp_path / "resident.sock")
+
+
+def send_request(connection: socket.socket, request: dict) -> None:
+    """Sends a request just like 'forward' function does"""
+    payload: bytes = json.dumps(request).encode()
+    socket.send_fds(connection, [len(payload).to_bytes(HEADER_SIZE, "big")], [0, 1, 2])
+    connection.sendall(payload)
+
+
+# Test 'forward' function
+def test_forward_not_running(tmp_path):
+    assert forward(["groups"], tmp_path / "resident.sock") is None
+
+def test_forward_stale_socket(tmp_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(tmp_path / "resident.sock"))
+    assert forward(["groups"], tmp_path / "resident.sock") is None
+
+
+# Test 'forward_ready' function
+def test_forward_ready(tmp_path):
+    assert not forward_ready(tmp_path / "resident.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(tmp_path / "resident.sock"))
+        server.listen()
+        assert forward_ready(tmp_path / "resident.sock")
+
+
+# Test 'receive_exactly' function
+def test_receive_exactly():
+    first, second = socket.socketpair()
+    with first, second:
+        first.sendall(b"abc")
+        first.shutdown(socket.SHUT_WR)
+        assert receive_exactly(second, 2) == b"ab"
+        assert receive_exactly(second, 5) == b"c"
+
+
+# Test 'ResidentServer' class methods
+def test_reload(resident):
+    data = resident.data
+    resident.reload()
+    assert resident.data is data
+    with patch("unit_converter.data_manager.get_source_stats", return_value=[("units.json", 0, 0)]):
+        resident.reload()
+    assert resident.data is not data
+    assert resident.data.units["length"]["meters"] == 1.0
+
+def test_reload_invalid_catalog(resident, catalog_dir):
+    (catalog_dir / "units.json").write_text("{")
+    resident.reload()
+    assert resident.data is None
+    # Catalog is loaded again once it's fixed
+    (catalog_dir / "units.json").write_text((BASE_DIR / "data" / "units.json").read_text())
+    resident.reload()
+    assert resident.data.units["length"]["meters"] == 1.0
+
+def test_reload_closes_history_database(resident):
+    configure_history("sqlite")
+    try:
+        with patch("unit_converter.data_manager.get_source_stats", return_value=[("units.json", 0, 0)]):
+            resident.reload()
+        assert data_manager.HISTORY_DATABASE is None
+    finally:
+        configure_history("files")
+
+def test_serve_forever_already_running(resident):
+    with patch("unit_converter.resident.forward_ready", return_value=True):
+        with pytest.raises(OSError, match="Resident process is already running"):
+            resident.serve_forever()
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("args, exit_code", [(["groups"], 3), (["exit"], 2)])
+def test_handle_connection(resident, tmp_path, capfd, args, exit_code):
+    client, connection = socket.socketpair()
+    with client, connection:
+        send_request(client, {"args": args, "cwd": str(tmp_path), "environ": {"UNIT_CONVERTER_TEST": "client"}})
+        resident.handle_connection(client, connection)
+        connection.close()
+        assert int.from_bytes(receive_exactly(client, 4), "big", signed=True) == exit_code
+    os.wait()
+    assert capfd.readouterr().out == f"{args[0]} {tmp_path} client\n"
+    # Forked process doesn't change server's directory
+    assert os.getcwd() != str(tmp_path)
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_handle_connection_invalid_catalog(catalog_dir, tmp_path, capfd):
+    resident = ResidentServer(run_cli, path=tmp_path / "resident.sock")
+    (catalog_dir / "units.json").write_text("{")
+    client, connection = socket.socketpair()
+    with client, connection:
+        send_request(client, {"args": ["groups"], "cwd": str(tmp_path), "environ": {}})
+        resident.handle_connection(client, connection)
+        connection.close()
+        assert int.from_bytes(receive_exactly(client, 4), "big", signed=True) == 1
+    os.wait()
+    output = capfd.readouterr().out
+    assert output.startswith("Error: ")
+    # Same output of a command that runs without the resident process
+    assert run_cli(DataStore(loader=CatalogLoader()), ["project.py", "groups"]) == 1
+    assert capfd.readouterr().out == output
+
+@pytest.mark.parametrize("payload", [b"invalid", b"[]", b'{"args": ["groups"]}'])
+def test_handle_connection_malformed_request(resident, payload):
+    client, connection = socket.socketpair()
+    with client, connection:
+        socket.send_fds(client, [len(payload).to_bytes(HEADER_SIZE, "big")], [0, 1, 2])
+        client.sendall(payload)
+        with patch("os.fork") as mock_fork:
+            resident.handle_connection(client, connection)
+        mock_fork.assert_not_called()
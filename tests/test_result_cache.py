@@ -0,0 +1,50 @@
+import pytest
+
+from unit_converter.result_cache import ResultCache
+
+
+# Setup ResultCache to be used on all tests
+@pytest.fixture
+def result_cache():
+    return ResultCache(max_size=2)
+
+
+# Test 'ResultCache' class methods
+def test_get_miss(result_cache):
+    assert result_cache.get("key") is None
+    assert result_cache.stats() == {"size": 0, "max_size": 2, "hits": 0, "misses": 1, "evictions": 0}
+
+def test_get_hit(result_cache):
+    result_cache.put("key", 1.0)
+    assert result_cache.get("key") == 1.0
+    assert result_cache.stats() == {"size": 1, "max_size": 2, "hits": 1, "misses": 0, "evictions": 0}
+
+def test_put_evicts_least_recently_used(result_cache):
+    result_cache.put("first", 1.0)
+    result_cache.put("second", 2.0)
+    result_cache.get("first")
+    result_cache.put("third", 3.0)
+    assert list(result_cache.entries) == ["first", "third"]
+    assert result_cache.evictions == 1
+
+def test_put_disabled():
+    result_cache = ResultCache()
+    result_cache.put("key", 1.0)
+    assert result_cache.entries == {}
+
+def test_clear(result_cache):
+    result_cache.put("key", 1.0)
+    result_cache.get("key")
+    result_cache.clear()
+    assert result_cache.stats() == {"size": 0, "max_size": 2, "hits": 1, "misses": 0, "evictions": 0}
+
+def test_configure_shrinks(result_cache):
+    result_cache.put("first", 1.0)
+    result_cache.put("second", 2.0)
+    result_cache.configure(max_size=1)
+    assert list(result_cache.entries) == ["second"]
+    assert result_cache.evictions == 1
+
+def test_configure_invalid_max_size(result_cache):
+    with pytest.raises(ValueError, match="'max_size' can't be a negative number!"):
+        result_cache.configure(max_size=-1)
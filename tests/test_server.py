@@ -0,0 +1,117 @@
+import asyncio
+import json
+import pytest
+
+from unittest.mock import patch
+
+from unit_converter.api import Converter
+from unit_converter.server import ConversionServer
+
+
+# Setup server to be used on all tests, without touching conversion history
+@pytest.fixture
+def server():
+    with patch("unit_converter.api.log_conversion") as mocked_log_conversion:
+        mocked_log_conversion.return_value = None
+        yield ConversionServer(Converter())
+
+
+async def send_requests(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, requests: list) -> list[dict]:
+    """Sends all requests at once, then reads one response line for each of them"""
+    for request in requests:
+        writer.write((request if isinstance(request, bytes) else json.dumps(request).encode()) + b"\n")
+    await writer.drain()
+    return [json.loads(await reader.readline()) for _ in requests]
+
+
+# Test 'handle_request' method
+def test_handle_request_convert(server):
+    assert asyncio.run(server.handle_request({"action": "convert", "unit_group": "length", "user_input": "km m 5"})) == {"result": 5000.0}
+
+def test_handle_request_convert_message(server):
+    assert asyncio.run(server.handle_request({"action": "convert", "unit_group": "length", "user_input": "km m 5", "print_message": True})) == {"result": "5.0 kilometers = 5,000.0 meters"}
+
+def test_handle_request_groups(server):
+    assert asyncio.run(server.handle_request({"action": "groups"})) == {"result": "Groups: length, time, mass, temperature, volume, area, speed"}
+
+def test_handle_request_types(server):
+    assert asyncio.run(server.handle_request({"action": "types", "unit_group": "invalid"})) == {"error": "'invalid' is not a valid group!"}
+
+def test_handle_request_history(server):
+    server.converter.conversion_log = [{"date": "2025-09-20T18:39:27.743896", "unit_group": "length", "from_type": "meters", "to_type": "yards", "amount": 10.0, "result": 10.936132983377078}]
+    response = asyncio.run(server.handle_request({"action": "history", "limit": 1}))
+    assert "10.0 meters = 10.93613 yards (Group: length)" in response["result"]
+
+def test_handle_request_error(server):
+    assert asyncio.run(server.handle_request({"action": "convert", "unit_group": "length", "user_input": "invalid m 5"})) == {"error": "Invalid unit type!"}
+
+def test_handle_request_invalid_action(server):
+    assert asyncio.run(server.handle_request({"action": "invalid"})) == {"error": "Invalid action: 'invalid'!"}
+
+def test_handle_request_invalid_arguments(server):
+    assert asyncio.run(server.handle_request({"action": "groups", "unit_group": "length"})) == {"error": "Invalid arguments for 'groups': unit_group"}
+
+def test_handle_request_missing_arguments(server):
+    assert "missing 1 required positional argument: 'user_input'" in asyncio.run(server.handle_request({"action": "convert", "unit_group": "length"}))["error"]
+
+def test_handle_request_sync_log_writer(server):
+    with patch("unit_converter.server.LOG_WRITER") as mocked_log_writer, patch("unit_converter.server.asyncio.to_thread") as mocked_to_thread:
+        mocked_log_writer.sync = True
+        mocked_to_thread.return_value = 1000.0
+        assert asyncio.run(server.handle_request({"action": "convert", "unit_group": "length", "user_input": "km m 1"})) == {"result": 1000.0}
+        mocked_to_thread.assert_called_once()
+
+
+# Test 'handle_line' method
+def test_handle_line_id(server):
+    assert asyncio.run(server.handle_line(b'{"id": 7, "action": "convert", "unit_group": "mass", "user_input": "kg g 2"}')) == {"id": 7, "result": 2000.0}
+
+def test_handle_line_invalid_json(server):
+    assert asyncio.run(server.handle_line(b"invalid")) == {"error": "Invalid JSON request!"}
+
+def test_handle_line_not_object(server):
+    assert asyncio.run(server.handle_line(b"[1, 2]")) == {"error": "Request must be a JSON object!"}
+
+
+# Test 'start' method
+def test_start_tcp(server):
+    async def run() -> list[list[dict]]:
+        tcp_server = await server.start(port=0)
+        async with tcp_server:
+            port: int = tcp_server.sockets[0].getsockname()[1]
+            # Two clients, sending their requests at the same time
+            clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(2)]
+            responses = await asyncio.gather(
+                send_requests(*clients[0], [{"id": 1, "action": "convert", "unit_group": "length", "user_input": "km m 1"}, b"invalid"]),
+                send_requests(*clients[1], [{"id": 2, "action": "convert", "unit_group": "temperature", "user_input": "c f 100"}])
+            )
+            for _, writer in clients:
+                writer.close()
+                await writer.wait_closed()
+        return list(responses)
+    assert asyncio.run(run()) == [[{"id": 1, "result": 1000.0}, {"error": "Invalid JSON request!"}], [{"id": 2, "result": 212.0}]]
+
+def test_start_line_too_long(server):
+    async def run() -> tuple[dict, bytes]:
+        tcp_server = await server.start(port=0)
+        async with tcp_server:
+            port: int = tcp_server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            # A request line over the 64 KiB reader limit
+            response: list[dict] = await send_requests(reader, writer, [b"x" * 70000])
+            end: bytes = await reader.read()
+            writer.close()
+            await writer.wait_closed()
+        return response[0], end
+    assert asyncio.run(run()) == ({"error": "Request line is too long!"}, b"")
+
+def test_start_unix_socket(server, tmp_path):
+    async def run() -> list[dict]:
+        unix_server = await server.start(path=str(tmp_path / "converter.sock"))
+        async with unix_server:
+            reader, writer = await asyncio.open_unix_connection(str(tmp_path / "converter.sock"))
+            responses = await send_requests(reader, writer, [{"action": "groups"}])
+            writer.close()
+            await writer.wait_closed()
+        return responses
+    assert asyncio.run(run()) == [{"result": "Groups: length, time, mass, temperature, volume, area, speed"}]
@@ -0,0 +1,194 @@
+import io
+import json
+import pytest
+
+from unittest.mock import patch
+
+from unit_converter.data_manager import load_data
+from unit_converter.data_models import DataStore
+from unit_converter.streaming import get_file_format, read_rows, convert_rows, write_rows, convert_file, convert_file_parallel, split_chunks, convert_binary_file
+
+
+# Setup DataStore to be used on all tests that require DataStore
+@pytest.fixture
+def data_store():
+    return DataStore(*load_data())
+
+
+# Test 'get_file_format' function
+def test_get_file_format_extension():
+    assert get_file_format("input.CSV") == "csv"
+    assert get_file_format("input.jsonl") == "jsonl"
+
+def test_get_file_format_option():
+    assert get_file_format("-", "JSONL") == "jsonl"
+
+def test_get_file_format_invalid():
+    with pytest.raises(ValueError, match="Invalid file format!"):
+        get_file_format("input.txt")
+
+
+# Test 'read_rows' function
+def test_read_rows_csv():
+    assert list(read_rows(io.StringIO("group,from,to,amount\nlength,m,ft,5\n"), "csv")) == [{"group": "length", "from": "m", "to": "ft", "amount": "5"}]
+
+def test_read_rows_jsonl():
+    assert list(read_rows(io.StringIO('{"amount": 5}\n\n{"amount": 6}\n'), "jsonl")) == [{"amount": 5}, {"amount": 6}]
+
+def test_read_rows_jsonl_invalid():
+    rows = list(read_rows(io.StringIO('{"amount": 5\n{"amount": 6}\n'), "jsonl"))
+    assert isinstance(rows[0], json.JSONDecodeError)
+    assert rows[1] == {"amount": 6}
+
+
+# Test 'convert_rows' function
+def test_convert_rows(data_store):
+    rows = convert_rows(data_store, [{"group": "length", "from": "m", "to": "ft", "amount": "5"}, {"group": "Temperature", "from": "c", "to": "f", "amount": 100}])
+    assert [row["result"] for row in rows] == [pytest.approx(16.4041994), pytest.approx(212.0)]
+
+def test_convert_rows_fixed_pair(data_store):
+    rows = convert_rows(data_store, [{"value": 1}, {"value": 2}], unit_group="length", from_type="km", to_type="m", column="value")
+    assert [row["result"] for row in rows] == [1000.0, 2000.0]
+
+def test_convert_rows_is_lazy(data_store):
+    def rows():
+        yield {"amount": 1}
+        raise AssertionError("Rows should be read one at a time")
+    assert next(convert_rows(data_store, rows(), unit_group="length", from_type="km", to_type="m"))["result"] == 1000.0
+
+def test_convert_rows_errors(data_store):
+    rows = list(convert_rows(data_store, [
+        {"group": "invalid", "from": "m", "to": "ft", "amount": 5},
+        {"group": "length", "from": "m", "amount": 5},
+        {"group": "length", "from": "m", "to": "ft", "amount": "five"},
+        {"group": "temperature", "from": "kelvin", "to": "celsius", "amount": -1},
+        {"group": "length", "from": "m", "to": "ft"},
+        {"group": "length", "from": "m", "to": "ft", "amount": 1}
+    ]))
+    assert [row.get("error") for row in rows] == [
+        "'invalid' is not a valid group!",
+        "Missing unit types! Use 'from' and 'to' columns, or '--from' and '--to' options",
+        "could not convert string to float: 'five'",
+        "Kelvin temperature cannot be negative!",
+        "Missing 'amount' column!",
+        None
+    ]
+    assert [row["result"] for row in rows[:5]] == [None] * 5
+
+def test_convert_rows_not_objects(data_store):
+    rows = list(convert_rows(data_store, [[1, 2], json.JSONDecodeError("Expecting value", "x", 0), {"amount": 1}], unit_group="length", from_type="km", to_type="m"))
+    assert rows == [
+        {"row": [1, 2], "result": None, "error": "Row must be a JSON object!"},
+        {"result": None, "error": "Invalid JSON row! (Expecting value)"},
+        {"amount": 1, "result": 1000.0}
+    ]
+
+
+# Test 'write_rows' function
+def test_write_rows_csv():
+    file = io.StringIO()
+    assert write_rows([{"amount": "1", "result": 2.0}, {"amount": "x", "result": None, "error": "Invalid"}], file, "csv") == (2, 1)
+    assert file.getvalue().splitlines() == ["amount,result,error", "1,2.0,", "x,,Invalid"]
+
+def test_write_rows_jsonl():
+    file = io.StringIO()
+    assert write_rows([{"amount": 1, "result": 2.0}], file, "jsonl") == (1, 0)
+    assert file.getvalue() == '{"amount": 1, "result": 2.0}\n'
+
+
+# Test 'convert_file' function
+def test_convert_file(data_store, tmp_path):
+    (tmp_path / "input.csv").write_text("group,from,to,amount\nlength,m,ft,5\nmass,kg,g,2\n")
+    assert convert_file(data_store, str(tmp_path / "input.csv"), str(tmp_path / "output.jsonl")) == (2, 0)
+    assert [json.loads(line)["result"] for line in (tmp_path / "output.jsonl").read_text().splitlines()] == [pytest.approx(16.4041994), 2000.0]
+
+def test_convert_file_stdout(data_store, tmp_path, capsys):
+    (tmp_path / "input.jsonl").write_text('{"amount": 1}\n')
+    assert convert_file(data_store, str(tmp_path / "input.jsonl"), unit_group="length", from_type="m", to_type="cm") == (1, 0)
+    assert capsys.readouterr().out == '{"amount": 1, "result": 100.0}\n'
+
+def test_convert_file_invalid_jsonl(data_store, tmp_path):
+    (tmp_path / "input.jsonl").write_text('{"amount": 1}\nnot json\n[1, 2]\n{"amount": 2}\n')
+    assert convert_file(data_store, str(tmp_path / "input.jsonl"), str(tmp_path / "output.jsonl"), unit_group="length", from_type="m", to_type="cm") == (4, 2)
+    assert [json.loads(line)["result"] for line in (tmp_path / "output.jsonl").read_text().splitlines()] == [100.0, None, None, 200.0]
+
+
+# Test 'split_chunks' function
+def test_split_chunks(tmp_path):
+    (tmp_path / "input.csv").write_text("amount\n1\n22\n333\n4444\n")
+    chunks = list(split_chunks(str(tmp_path / "input.csv"), 7, 3))
+    assert chunks == [(7, 12), (12, 16), (16, 21)]
+    assert [(tmp_path / "input.csv").read_bytes()[start:end] for start, end in chunks] == [b"1\n22\n", b"333\n", b"4444\n"]
+
+
+# Test 'convert_file_parallel' function
+def test_convert_file_parallel(data_store, tmp_path):
+    lines = ["group,from,to,amount"] + [f"length,m,ft,{amount}" for amount in range(200)] + ["mass,kg,invalid,1"]
+    (tmp_path / "input.csv").write_text("\n".join(lines) + "\n")
+    convert_file(data_store, str(tmp_path / "input.csv"), str(tmp_path / "expected.csv"))
+    assert convert_file_parallel(str(tmp_path / "input.csv"), str(tmp_path / "output.csv"), workers=2, chunk_size=256) == (201, 1)
+    assert (tmp_path / "output.csv").read_text() == (tmp_path / "expected.csv").read_text()
+
+def test_convert_file_parallel_jsonl(tmp_path):
+    (tmp_path / "input.jsonl").write_text("".join(f'{{"amount": {amount}}}\n' for amount in range(50)))
+    assert convert_file_parallel(str(tmp_path / "input.jsonl"), str(tmp_path / "output.jsonl"), workers=2, unit_group="length", from_type="km", to_type="m", chunk_size=64) == (50, 0)
+    assert [json.loads(line)["result"] for line in (tmp_path / "output.jsonl").read_text().splitlines()] == [amount * 1000.0 for amount in range(50)]
+
+def test_convert_file_parallel_stdin():
+    with pytest.raises(ValueError, match="Input file can't be stdin when using many workers!"):
+        convert_file_parallel("-", workers=2, file_format="csv")
+
+def test_convert_file_parallel_formats(tmp_path):
+    with pytest.raises(ValueError, match="Input and output files must have the same format when using many workers!"):
+        convert_file_parallel(str(tmp_path / "input.csv"), str(tmp_path / "output.jsonl"), workers=2)
+
+def test_convert_file_parallel_invalid_workers(tmp_path):
+    with pytest.raises(ValueError, match="'workers' must be a positive number!"):
+        convert_file_parallel(str(tmp_path / "input.csv"), workers=0)
+
+
+# Test 'convert_binary_file' function
+def test_convert_binary_file_raw(data_store, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.arange(4, dtype="float32").tofile(tmp_path / "input.f32")
+    assert convert_binary_file(data_store, str(tmp_path / "input.f32"), "length", "km", "m", str(tmp_path / "output.f32"), dtype="float32") == 4
+    assert np.fromfile(tmp_path / "output.f32", dtype="float32").tolist() == [0.0, 1000.0, 2000.0, 3000.0]
+    assert np.fromfile(tmp_path / "input.f32", dtype="float32").tolist() == [0.0, 1.0, 2.0, 3.0]
+
+def test_convert_binary_file_in_place(data_store, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.array([0.0, 100.0]).tofile(tmp_path / "input.f64")
+    assert convert_binary_file(data_store, str(tmp_path / "input.f64"), "temperature", "c", "f") == 2
+    assert np.fromfile(tmp_path / "input.f64").tolist() == [32.0, 212.0]
+
+def test_convert_binary_file_npy(data_store, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.save(tmp_path / "input.npy", np.array([[0.0, 100.0], [37.0, -40.0]], order="F"))
+    assert convert_binary_file(data_store, str(tmp_path / "input.npy"), "temperature", "celsius", "fahrenheit", str(tmp_path / "output.npy")) == 4
+    assert np.load(tmp_path / "output.npy") == pytest.approx(np.array([[32.0, 212.0], [98.6, -40.0]]))
+
+def test_convert_binary_file_chunks(data_store, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.arange(10.0).tofile(tmp_path / "input.f64")
+    with patch("unit_converter.streaming.BINARY_CHUNK_SIZE", 3):
+        convert_binary_file(data_store, str(tmp_path / "input.f64"), "mass", "kg", "g")
+    assert np.fromfile(tmp_path / "input.f64").tolist() == [value * 1000.0 for value in range(10)]
+
+def test_convert_binary_file_negative_kelvin(data_store, tmp_path):
+    np = pytest.importorskip("numpy")
+    np.array([1.0, -1.0]).tofile(tmp_path / "input.f64")
+    with pytest.raises(ValueError, match="Kelvin temperature cannot be negative!"):
+        convert_binary_file(data_store, str(tmp_path / "input.f64"), "temperature", "kelvin", "celsius")
+    assert np.fromfile(tmp_path / "input.f64").tolist() == [1.0, -1.0]
+
+def test_convert_binary_file_invalid_dtype(data_store, tmp_path):
+    pytest.importorskip("numpy")
+    (tmp_path / "input.bin").write_bytes(b"\x00" * 8)
+    with pytest.raises(ValueError, match="Invalid value type: 'int64'!"):
+        convert_binary_file(data_store, str(tmp_path / "input.bin"), "length", "m", "ft", dtype="int64")
+
+def test_convert_binary_file_invalid_size(data_store, tmp_path):
+    pytest.importorskip("numpy")
+    (tmp_path / "input.bin").write_bytes(b"\x00" * 7)
+    with pytest.raises(ValueError, match="File size isn't a multiple of a 'float64' value size!"):
+        convert_binary_file(data_store, str(tmp_path / "input.bin"), "length", "m", "ft")
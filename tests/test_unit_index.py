@@ -0,0 +1,85 @@
+import pytest
+
+from unit_converter.unit_index import UnitIndex
+
+
+# Setup UnitIndex to be used on all tests
+@pytest.fixture
+def unit_index():
+    units = {"length": {"meters": 1.0, "miles": 1609.344}, "mass": {"grams": 1.0, "meters": 2.0}, "temperature": {"celsius": [1.0, 0.0]}}
+    unit_aliases = {"length": {"m": "meters", "mi": "miles"}, "mass": {"g": "grams", "m": "meters"}, "temperature": {"c": "celsius", "miles": "celsius"}}
+    return UnitIndex(units, unit_aliases)
+
+
+# Test 'UnitIndex' class methods
+def test_init(unit_index):
+    assert unit_index.names["m"] == {"length": "meters", "mass": "meters"}
+    assert unit_index.names["g"] == {"mass": "grams"}
+
+def test_init_unit_type_over_alias(unit_index):
+    assert unit_index.names["miles"] == {"length": "miles", "temperature": "celsius"}
+
+def test_build_group(unit_index):
+    unit_index.units["length"]["feet"] = 0.3048
+    unit_index.unit_aliases["length"].pop("mi")
+    unit_index.build_group("length")
+    assert unit_index.names["feet"] == {"length": "feet"}
+    assert "mi" not in unit_index
+
+def test_remove_group(unit_index):
+    unit_index.remove_group("length")
+    assert unit_index.names["m"] == {"mass": "meters"}
+    assert "mi" not in unit_index
+    assert "length" not in unit_index.aliases
+
+def test_add(unit_index):
+    unit_index.add("mtr", "length", "meters")
+    assert unit_index.infer_group("mtr", "mi") == "length"
+
+def test_remove(unit_index):
+    unit_index.remove("m", "mass")
+    assert unit_index.names["m"] == {"length": "meters"}
+    unit_index.remove("m", "length")
+    assert "m" not in unit_index
+
+def test_remove_missing(unit_index):
+    unit_index.remove("invalid", "length")
+    assert "invalid" not in unit_index
+
+def test_add_alias(unit_index):
+    unit_index.add_alias("mtr", "length", "meters")
+    assert unit_index.names["mtr"] == {"length": "meters"}
+    assert unit_index.aliases_of("length", "meters") == ["m", "mtr"]
+
+def test_remove_alias(unit_index):
+    unit_index.remove_alias("m", "length", "meters")
+    assert unit_index.names["m"] == {"mass": "meters"}
+    assert unit_index.aliases_of("length", "meters") == []
+
+def test_remove_type(unit_index):
+    assert unit_index.remove_type("length", "meters") == ["m"]
+    assert unit_index.names["meters"] == {"mass": "meters"}
+    assert unit_index.names["m"] == {"mass": "meters"}
+    assert unit_index.aliases_of("length", "meters") == []
+
+def test_aliases_of(unit_index):
+    assert unit_index.aliases_of("temperature", "celsius") == ["c", "miles"]
+    assert unit_index.aliases_of("length", "invalid") == []
+    assert unit_index.aliases_of("invalid", "meters") == []
+
+def test_infer_group(unit_index):
+    assert unit_index.infer_group("m", "mi") == "length"
+    assert unit_index.infer_group("g", "m") == "mass"
+
+def test_infer_group_not_found(unit_index):
+    with pytest.raises(KeyError) as e:
+        unit_index.infer_group("m", "invalid")
+    assert e.value.args[0] == "Unit type 'invalid' not found in any group!"
+
+def test_infer_group_different_groups(unit_index):
+    with pytest.raises(ValueError, match="'g' and 'c' don't belong to the same unit group!"):
+        unit_index.infer_group("g", "c")
+
+def test_infer_group_ambiguous(unit_index):
+    with pytest.raises(ValueError, match=r"'m' and 'meters' belong to many unit groups \(length, mass\)! Enter a unit group"):
+        unit_index.infer_group("m", "meters")
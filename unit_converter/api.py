@@ -1,21 +1,20 @@
-import json
+from concurrent.futures import Future
+from typing import Any, Iterable, Iterator, Optional
 
-from .data_manager import load_data
-from .data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, validate_args_number
-from .utils import validate_unit_group
-from project import print_groups, print_history, print_types, conversion_logic, manage_group, manage_type, manage_aliases, change_base_unit
+from .batcher import ConversionBatcher, validate_amount
+from .data_manager import CatalogLoader, batch_changes
+from .data_models import DataStore, ConversionData, ManageGroupData, ManageTypeData, AliasesData, ChangeBaseData, HistoryData, validate_args_number
+from .streaming import convert_rows, convert_binary_file
+from .utils import validate_unit_group, resolve_aliases
+from project import print_groups, print_history, print_types, convert_value, log_conversion, format_conversion, manage_group, manage_type, manage_aliases, change_base_unit
 
 
 class Converter(DataStore):
     def __init__(self):
-        try:
-            # Initiates data variables related to all '.json' files
-            units, base_units, conversion_log, unit_aliases, month_days, original_units, month_aliases = load_data()
-            # Used to call the constructor from the parent class
-            super().__init__(units, base_units,conversion_log,unit_aliases, month_days, original_units, month_aliases)
-        except (ValueError, FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-            print(f"Error: {str(e)}")
-            raise
+        # Each dataset is only loaded (and validated) the first time a method uses it
+        super().__init__(loader=CatalogLoader())
+        # Dispatcher of 'submit' method, only started the first time it's used
+        self.batcher = ConversionBatcher(self)
     
     # 'groups' action
     def groups(self) -> str:
@@ -24,11 +23,17 @@ class Converter(DataStore):
         return message
 
     # 'history' action
-    def history(self, limit: int=10, *args, **kwargs) -> str:
-        """Prints the last conversion entries (default = 10)"""
+    def history(self, limit: int=10, *args, unit_group: Optional[str]=None, since: Optional[str]=None, until: Optional[str]=None, unit_type: Optional[str]=None, **kwargs) -> str:
+        """Prints the last conversion entries (default = 10), optionally filtered by group, dates and unit type"""
         try:
             validate_args_number(*args, command="history", **kwargs)
-            message = print_history(self, limit)
+            history_data = HistoryData(
+                unit_group = unit_group.lower() if unit_group else None,
+                since = since,
+                until = until,
+                unit_type = unit_type.lower() if unit_type else None
+            )
+            message = print_history(self, limit, history_data)
             return message
         except (ValueError, TypeError) as e:
             return f"Error: {str(e)}"
@@ -44,8 +49,8 @@ class Converter(DataStore):
             return f"Error: {e.args[0] if e.args else str(e)}"
 
     # 'convert' action
-    def convert(self, unit_group: str, user_input: str, *args, print_message: bool=False, **kwargs):
-        """Handles all conversion logic"""
+    def convert(self, unit_group: str, user_input: str, *args, print_message: bool=False, log: bool=True, **kwargs):
+        """Handles all conversion logic (set 'log' to False to skip the conversion history)"""
         try:
             validate_args_number(*args, command="convert", **kwargs)
             conversion_data = ConversionData(
@@ -58,12 +63,101 @@ class Converter(DataStore):
                 if len(input_args) != 3:
                     raise ValueError("Incorrect format! Usage: <unit_group> <from_type> <to_type> <amount>")
                 conversion_data.from_type, conversion_data.to_type, conversion_data.amount = input_args
-            message = conversion_logic(self, conversion_data)
+            result = convert_value(self, conversion_data)
+            # Logging and message formatting are only done when requested
+            if log:
+                log_conversion(self, conversion_data)
             if print_message:
-                return message
-            return conversion_data.new_time if unit_group == "time" else conversion_data.new_value
+                return format_conversion(conversion_data)
+            return result
+        except (ValueError, KeyError, ZeroDivisionError, AttributeError, TypeError) as e:
+            return f"Error: {e.args[0] if e.args else str(e)}"
+
+    # 'convert' action with typed arguments
+    def convert_amount(self, unit_group: str, from_type: str, to_type: str, amount: float, *args, log: bool=True, **kwargs):
+        """Converts a number between two unit types, without building nor parsing any string (set 'log' to False to skip the conversion history)"""
+        try:
+            validate_args_number(*args, command="convert", **kwargs)
+            unit_group = unit_group.lower()
+            validate_unit_group(unit_group, self)
+            from_type = resolve_aliases(self, unit_group, from_type.lower())
+            to_type = resolve_aliases(self, unit_group, to_type.lower())
+            amount = validate_amount(unit_group, from_type, amount)
+            result: float = self.engine.convert(unit_group, from_type, to_type, amount)
         except (ValueError, KeyError, ZeroDivisionError, AttributeError, TypeError) as e:
             return f"Error: {e.args[0] if e.args else str(e)}"
+        # Conversion data is only built when it's logged
+        if log:
+            if unit_group == "time":
+                log_conversion(self, ConversionData(unit_group=unit_group, from_time=from_type, to_time=to_type, factor_time=amount, new_time=result))
+            else:
+                log_conversion(self, ConversionData(unit_group=unit_group, from_type=from_type, to_type=to_type, amount=amount, new_value=result))
+        return result
+
+    # 'convert' action for arrays of amounts
+    def convert_many(self, unit_group: str, from_type: str, to_type: str, amounts, *args, **kwargs):
+        """Converts a NumPy array (or buffer) of amounts at once, without logging each value"""
+        try:
+            validate_args_number(*args, command="convert", **kwargs)
+            unit_group = unit_group.lower()
+            validate_unit_group(unit_group, self)
+            from_type = resolve_aliases(self, unit_group, from_type.lower())
+            to_type = resolve_aliases(self, unit_group, to_type.lower())
+            return self.engine.convert_many(unit_group, from_type, to_type, amounts)
+        except (ValueError, KeyError, ZeroDivisionError, TypeError, ImportError) as e:
+            return f"Error: {e.args[0] if e.args else str(e)}"
+
+    # 'convert' action compiled for a single unit pair
+    def converter_for(self, unit_group: str, from_type: str, to_type: str, *args, **kwargs):
+        """Validates a unit pair once, returning a function that converts amounts with no further lookups nor logging"""
+        try:
+            validate_args_number(*args, command="convert", **kwargs)
+            unit_group = unit_group.lower()
+            validate_unit_group(unit_group, self)
+            from_type = resolve_aliases(self, unit_group, from_type.lower())
+            to_type = resolve_aliases(self, unit_group, to_type.lower())
+            return self.engine.compile_pair(unit_group, from_type, to_type)
+        except (ValueError, KeyError, ZeroDivisionError, TypeError) as e:
+            return f"Error: {e.args[0] if e.args else str(e)}"
+
+    # Unit group of a unit pair
+    def infer_group(self, from_type: str, to_type: str) -> str:
+        """Finds the only unit group with both unit types (or their aliases)"""
+        try:
+            return self.unit_index.infer_group(from_type.lower(), to_type.lower())
+        except (ValueError, KeyError) as e:
+            return f"Error: {e.args[0] if e.args else str(e)}"
+
+    # 'convert' action for many concurrent callers
+    def submit(self, unit_group: str, from_type: str, to_type: str, amount) -> Future:
+        """Queues a single conversion, returning a future resolved together with all other conversions of that unit pair"""
+        return self.batcher.submit(unit_group, from_type, to_type, amount)
+
+    def configure_batcher(self, batch_size: int=256, batch_window: float=0.001) -> None:
+        """Changes the largest batch of 'submit' method and how long (in seconds) it waits for more conversions"""
+        self.batcher.configure(batch_size, batch_window)
+
+    # Cache of 'convert' results
+    def configure_cache(self, max_size: int=0) -> None:
+        """Keeps up to 'max_size' results of 'convert' method, dropping the least recently used ones ('0' disables it)"""
+        self.result_cache.configure(max_size)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Gets size and hit, miss and eviction counters of 'convert' results cache"""
+        return self.result_cache.stats()
+
+    # Streaming conversion
+    def convert_stream(self, rows: Iterable[Any], unit_group: Optional[str]=None, from_type: Optional[str]=None, to_type: Optional[str]=None, column: str="amount") -> Iterator[dict]:
+        """Converts rows one at a time, as they are read (rows are dicts, or plain amounts when a unit pair is given)"""
+        rows = (row if isinstance(row, dict) else {column: row} for row in rows)
+        return convert_rows(self, rows, unit_group, from_type, to_type, column)
+
+    def convert_binary(self, input_path: str, unit_group: str, from_type: str, to_type: str, output_path: Optional[str]=None, dtype: str="float64"):
+        """Converts a raw float file or '.npy' array through memory maps, in place or into another file"""
+        try:
+            return convert_binary_file(self, input_path, unit_group, from_type, to_type, output_path, dtype)
+        except (ValueError, KeyError, ZeroDivisionError, TypeError, ImportError, OSError) as e:
+            return f"Error: {e.args[0] if e.args and isinstance(e.args[0], str) else str(e)}"
 
     # 'manage-group' action
     def manage_group(self, unit_group: str, user_input: str, *args, print_message: bool=False, **kwargs):
@@ -82,6 +176,9 @@ class Converter(DataStore):
             )
             return self._check_for_print(manage_group, manage_group_data, print_message)
         except (ValueError, KeyError, TypeError) as e:
+            # Inside a batch, errors are raised so that all its changes are rolled back
+            if self.batching:
+                raise
             return f"Error: {e.args[0] if e.args else str(e)}"
 
     # 'manage-type' action
@@ -111,6 +208,9 @@ class Converter(DataStore):
             )
             return self._check_for_print(manage_type, manage_type_data, print_message)
         except (ValueError, KeyError, TypeError) as e:
+            # Inside a batch, errors are raised so that all its changes are rolled back
+            if self.batching:
+                raise
             return f"Error: {e.args[0] if e.args else str(e)}"
 
     # 'aliases' action
@@ -131,6 +231,9 @@ class Converter(DataStore):
             )
             return self._check_for_print(manage_aliases, aliases_data, print_message)
         except (ValueError, KeyError, TypeError) as e:
+            # Inside a batch, errors are raised so that all its changes are rolled back
+            if self.batching:
+                raise
             return f"Error: {e.args[0] if e.args else str(e)}"
 
     # 'change-base' action
@@ -148,8 +251,16 @@ class Converter(DataStore):
             )
             return self._check_for_print(change_base_unit, change_base_data, print_message)
         except (ValueError, KeyError, TypeError) as e:
+            # Inside a batch, errors are raised so that all its changes are rolled back
+            if self.batching:
+                raise
             return f"Error: {e.args[0] if e.args else str(e)}"
 
+    # Bulk changes
+    def batch(self):
+        """Applies many changes at once, validating and saving them when the 'with' block ends (or rolling all of them back on error)"""
+        return batch_changes(self)
+
     def _check_for_print(self, function, data, print_message: bool=False):
         """Checks if user wants to print the output message"""
         message = function(self, data)
@@ -0,0 +1,123 @@
+import threading
+
+from concurrent.futures import Future
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Any, Optional
+
+from .data_models import DataStore
+from .engine import np
+from .utils import validate_unit_group, resolve_aliases
+
+
+class ConversionBatcher:
+    """Collects single conversions from many callers, converting all amounts of each unit pair at once"""
+    def __init__(self, data: DataStore, batch_size: int=256, batch_window: float=0.001):
+        self.data = data
+        self.configure(batch_size, batch_window)
+        # Each request is a '(unit_group, from_type, to_type, amount, future)' tuple
+        self.pending: SimpleQueue = SimpleQueue()
+        # Prevents two dispatcher threads from being started at the same time
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def configure(self, batch_size: int=256, batch_window: float=0.001) -> None:
+        """Changes the largest batch and how long (in seconds) a batch waits for more requests"""
+        if batch_size < 1:
+            raise ValueError("'batch_size' must be a positive number!")
+        if batch_window < 0:
+            raise ValueError("'batch_window' can't be a negative number!")
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+
+    def submit(self, unit_group: str, from_type: str, to_type: str, amount: Any) -> Future:
+        """Queues a single conversion, returning a future with its result"""
+        future: Future = Future()
+        self.pending.put((unit_group, from_type, to_type, amount, future))
+        self.start()
+        return future
+
+    def flush(self) -> None:
+        """Converts all queued requests right away"""
+        requests: list[tuple] = []
+        while True:
+            try:
+                requests.append(self.pending.get_nowait())
+            except Empty:
+                break
+        if requests:
+            self.convert_batch(requests)
+
+    def convert_batch(self, requests: list[tuple]) -> None:
+        """Resolves each unit pair once and converts all of its amounts in one vectorized step"""
+        pairs: dict[tuple, list[tuple[Any, Future]]] = {}
+        for unit_group, from_type, to_type, amount, future in requests:
+            # Cancelled futures are skipped, and all other ones can no longer be cancelled
+            if future.set_running_or_notify_cancel():
+                pairs.setdefault((unit_group, from_type, to_type), []).append((amount, future))
+        for key, pair_requests in pairs.items():
+            try:
+                unit_group, from_type, to_type = self.resolve_pair(*key)
+            except (ValueError, KeyError, TypeError, ZeroDivisionError, AttributeError) as e:
+                for _, future in pair_requests:
+                    future.set_exception(e)
+                continue
+            amounts: list[float] = []
+            futures: list[Future] = []
+            for amount, future in pair_requests:
+                try:
+                    amounts.append(validate_amount(unit_group, from_type, amount))
+                    futures.append(future)
+                except ValueError as e:
+                    future.set_exception(e)
+            if not futures:
+                continue
+            try:
+                if np is not None:
+                    results: list[float] = self.data.engine.convert_many(unit_group, from_type, to_type, amounts).tolist()
+                else:
+                    results = [self.data.engine.convert(unit_group, from_type, to_type, amount) for amount in amounts]
+            except (ValueError, KeyError, ZeroDivisionError) as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+    def resolve_pair(self, unit_group: str, from_type: str, to_type: str) -> tuple[str, str, str]:
+        """Validates unit group and resolves aliases of both unit types"""
+        unit_group = unit_group.lower()
+        validate_unit_group(unit_group, self.data)
+        return unit_group, resolve_aliases(self.data, unit_group, from_type.lower()), resolve_aliases(self.data, unit_group, to_type.lower())
+
+    def start(self) -> None:
+        """Starts dispatcher thread, if it's not already running"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="conversion-batcher", daemon=True)
+                self.thread.start()
+
+    def _run(self) -> None:
+        """Waits for a request, collects more of them for 'batch_window' seconds (or until a batch is full) and converts them"""
+        while True:
+            requests: list[tuple] = [self.pending.get()]
+            deadline: float = monotonic() + self.batch_window
+            while len(requests) < self.batch_size:
+                try:
+                    requests.append(self.pending.get(timeout=max(deadline - monotonic(), 0)))
+                except Empty:
+                    break
+            self.convert_batch(requests)
+
+
+def validate_amount(unit_group: str, from_type: str, amount: Any) -> float:
+    """Converts an amount to float, preventing negative values for 'kelvin' unit type"""
+    try:
+        value: float = float(amount)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid amount!")
+    if value < 0 and unit_group == "temperature" and from_type == "kelvin":
+        raise ValueError("Kelvin temperature cannot be negative!")
+    return value
@@ -1,107 +1,290 @@
+import atexit
+import copy
 import json
+import marshal
+import os
 
 from datetime import datetime, timedelta
+from contextlib import contextmanager
 from pathlib import Path
 
-from typing import Any, Union
+from typing import Any, Iterator, Optional
 
-from .data_models import DataStore, ConversionData
+from .data_models import DataStore, ConversionData, HistoryData
+from .history_db import HistoryDatabase
+from .log_writer import LogWriter
 
 
 # Creates path to "final-project" directory
 BASE_DIR = Path(__file__).parent.parent
+# Conversion history, split into one append-only segment file per day ('YYYY-MM-DD.jsonl')
+LOG_DIR = BASE_DIR / "data" / "history"
+# Segments older than that number of days are removed from history
+HISTORY_RETENTION_DAYS = 3
+# Number of bytes read at a time when reading history backwards
+BLOCK_SIZE = 8192
+# Where conversion history is stored: daily segment files ("files") or an indexed SQLite table ("sqlite")
+HISTORY_BACKEND = os.environ.get("UNIT_CONVERTER_HISTORY", "files")
+DATABASE_PATH = BASE_DIR / "data" / "history.sqlite3"
+HISTORY_DATABASE: Optional[HistoryDatabase] = None
+# Expired history is only deleted once per run, the first time history is read or written
+HISTORY_CLEANED = False
+# Unit catalog files, which can be replaced by a single versioned snapshot file:
+# all units available, base unit for each group, all aliases for each unit_type, days in each month,
+# original conversion factor for all unit_types and all aliases for each month
+DATA_FILES = ["units", "base_units", "unit_aliases", "month_days", "original_units", "month_aliases"]
+SNAPSHOT_FILE = "catalog.json"
+SNAPSHOT_VERSION = 1
+# Already validated unit catalog, reused while none of its source files change
+CACHE_FILE = "catalog.cache"
+CACHE_VERSION = 1
 
-def load_data() -> tuple[dict, dict, list, dict, dict, dict, dict]:
-    """Imports all '.json' files which handles data management"""
-    # Dictionary with all units available
-    with open(BASE_DIR / "data" / "units.json", "r") as file:
-        units = json.load(file)
-    # Dictionary with base units for each group
-    with open(BASE_DIR / "data" / "base_units.json", "r") as file:
-        base_units = json.load(file)
-    # Dictionary with all conversions history
-    with open(BASE_DIR / "data" / "conversion_log.json", "r") as file:
-        conversion_log = json.load(file)
-    # Dictionary with all aliases for each unit_type
-    with open(BASE_DIR / "data" / "unit_aliases.json", "r") as file:
-        unit_aliases = json.load(file)
-    # Dictionary that relates a month with the number of days in that month
-    with open(BASE_DIR / "data" / "month_days.json", "r") as file:
-        month_days = json.load(file)
-    # Dictionary with the original conversion factor for all unit_types
-    with open(BASE_DIR / "data" / "original_units.json", "r") as file:
-        original_units = json.load(file)
-    with open(BASE_DIR / "data" / "month_aliases.json", "r") as file:
-        month_aliases = json.load(file)
-    # Validates all those files
-    validate_data(units, base_units, conversion_log, unit_aliases, month_days, original_units, month_aliases)
+def load_data() -> tuple[dict, dict, None, dict, dict, dict, dict]:
+    """Imports unit catalog, from its cache, its snapshot file (if migrated) or from all '.json' files"""
+    catalog: dict = load_catalog(get_source_stats())
+    # Conversion history isn't loaded, it's only read from disk when needed (see 'get_history')
+    clean_history()
+    conversion_log = None
+    units, base_units, unit_aliases, month_days, original_units, month_aliases = (catalog[file_name] for file_name in DATA_FILES)
     return units, base_units, conversion_log, unit_aliases, month_days, original_units, month_aliases 
 
 
-def validate_data(units: dict, base_units: dict, conversion_log: list, unit_aliases: dict, month_days: dict, original_units: dict, month_aliases: dict) -> None:
+def load_catalog(sources: Optional[list]) -> dict:
+    """Imports and validates the whole unit catalog, or gets it from its cache"""
+    # A valid cache was already validated when it was written, so it skips parsing and validation
+    catalog: Optional[dict] = load_cache(sources)
+    if catalog is None:
+        if (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+            catalog = load_snapshot()
+        else:
+            catalog = load_catalog_files()
+        # Validates all those files
+        validate_data(catalog["units"], catalog["base_units"], None, catalog["unit_aliases"], catalog["month_days"], catalog["original_units"], catalog["month_aliases"])
+        write_cache(sources, catalog)
+    return catalog
+
+
+class CatalogLoader:
+    """Loads each dataset of the unit catalog only when it's first used (see 'DataStore')"""
+    def __init__(self):
+        self.sources: Optional[list] = None
+        # Whole unit catalog, when it's read at once (from its cache or snapshot file)
+        self.catalog: Optional[dict] = None
+        # Datasets read from their own '.json' file, exactly as they were read (unaffected by later changes)
+        self.datasets: dict[str, Any] = {}
+
+    def __call__(self, file_name: str) -> Any:
+        """Gets a single dataset, validating it against all other datasets already loaded, as they were read from disk"""
+        if self.sources is None:
+            self.sources = get_source_stats()
+            self.catalog = load_cache(self.sources)
+            # Snapshot file holds all datasets, so it's read and validated at once
+            if self.catalog is None and (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+                self.catalog = load_catalog(self.sources)
+        if self.catalog is not None:
+            return self.catalog[file_name]
+        dataset: Any = load_catalog_file(file_name)
+        # Datasets returned earlier may have been changed since then, so only a copy is validated and cached
+        self.datasets[file_name] = copy.deepcopy(dataset)
+        validate_dataset(file_name, self.datasets)
+        # Once all datasets are loaded and validated, later startups can use the cache
+        if len(self.datasets) == len(DATA_FILES):
+            write_cache(self.sources, self.datasets)
+        return dataset
+
+
+def get_source_stats() -> Optional[list]:
+    """Gets name, modification time and size of every file the unit catalog is loaded from"""
+    if (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+        file_names: list[str] = [SNAPSHOT_FILE]
+    else:
+        file_names = [f"{file_name}.json" for file_name in DATA_FILES]
+    try:
+        return [(file_name, (stat := (BASE_DIR / "data" / file_name).stat()).st_mtime_ns, stat.st_size) for file_name in file_names]
+    except FileNotFoundError:
+        # Missing files are reported by the regular loading
+        return None
+
+
+def load_cache(sources: Optional[list]) -> Optional[dict]:
+    """Gets the cached unit catalog, if it was written from the exact same source files"""
+    if sources is None:
+        return None
+    try:
+        with open(BASE_DIR / "data" / CACHE_FILE, "rb") as file:
+            cache = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION or cache.get("sources") != sources:
+        return None
+    return cache["catalog"]
+
+
+def write_cache(sources: Optional[list], catalog: dict) -> None:
+    """Writes an already validated unit catalog to its cache file"""
+    if sources is None:
+        return
+    cache: dict = {"version": CACHE_VERSION, "sources": sources, "catalog": {file_name: catalog[file_name] for file_name in DATA_FILES}}
+    try:
+        with open(BASE_DIR / "data" / CACHE_FILE, "wb") as file:
+            marshal.dump(cache, file)
+    except OSError:
+        # Cache is only an optimization, so the program works without it
+        pass
+
+
+def clear_cache() -> None:
+    """Deletes cached unit catalog"""
+    (BASE_DIR / "data" / CACHE_FILE).unlink(missing_ok=True)
+
+
+def load_catalog_files() -> dict:
+    """Imports all '.json' files which handles data management"""
+    return {file_name: load_catalog_file(file_name) for file_name in DATA_FILES}
+
+
+def load_catalog_file(file_name: str) -> Any:
+    """Imports a single '.json' file of the unit catalog"""
+    with open(BASE_DIR / "data" / f"{file_name}.json", "r") as file:
+        return json.load(file)
+
+
+def load_snapshot() -> dict:
+    """Imports the whole unit catalog from its snapshot file, with a single read"""
+    with open(BASE_DIR / "data" / SNAPSHOT_FILE, "r") as file:
+        snapshot = json.load(file)
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"'{SNAPSHOT_FILE}' version is not supported! Expected version {SNAPSHOT_VERSION}")
+    for file_name in DATA_FILES:
+        if file_name not in snapshot:
+            raise KeyError(f"'{SNAPSHOT_FILE}' is corrupted! It's missing '{file_name}' key!")
+    return snapshot
+
+
+def write_snapshot(catalog: dict) -> None:
+    """Writes the whole unit catalog to its snapshot file, atomically"""
+    snapshot: dict = {"version": SNAPSHOT_VERSION}
+    snapshot.update({file_name: catalog[file_name] for file_name in DATA_FILES})
+    os.replace(write_temp_file(BASE_DIR / "data" / SNAPSHOT_FILE, json.dumps(snapshot, separators=(",", ":"))), BASE_DIR / "data" / SNAPSHOT_FILE)
+
+
+def migrate_to_snapshot(remove_sources: bool=False) -> None:
+    """Copies the unit catalog from all '.json' files into a single snapshot file"""
+    if (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+        raise ValueError("Unit catalog is already stored in a snapshot file!")
+    catalog: dict = load_catalog_files()
+    validate_data(catalog["units"], catalog["base_units"], None, catalog["unit_aliases"], catalog["month_days"], catalog["original_units"], catalog["month_aliases"])
+    write_snapshot(catalog)
+    # Snapshot is loaded instead of '.json' files, which are only deleted when asked to
+    if remove_sources:
+        for file_name in DATA_FILES:
+            (BASE_DIR / "data" / f"{file_name}.json").unlink()
+
+
+def export_snapshot() -> None:
+    """Moves the unit catalog from its snapshot file back into all '.json' files"""
+    if not (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+        raise ValueError("There's no snapshot file to export!")
+    catalog: dict = load_snapshot()
+    # Each file is replaced atomically, so a crash never leaves a half-written one
+    for file_name in DATA_FILES:
+        path: Path = BASE_DIR / "data" / f"{file_name}.json"
+        os.replace(write_temp_file(path, json.dumps(catalog[file_name], indent=4)), path)
+    (BASE_DIR / "data" / SNAPSHOT_FILE).unlink()
+
+
+def validate_data(units: dict, base_units: dict, conversion_log: Optional[list], unit_aliases: dict, month_days: dict, original_units: dict, month_aliases: dict) -> None:
     """Validates dictionaries before entering the program"""
-    # Ensures 'units.json' is a dictionary and it's not empty
-    if not isinstance(units, dict) or not units:
-        raise ValueError("'units.json' structure is corrupted!")
-    # Ensures 'base_units.json' is a dictionary and it's not empty
-    if not isinstance(base_units, dict) or not base_units:
-        raise ValueError("'base_units.json' structure is corrupted!")
-    for unit_group in units:
-        # Ensures every unit_group in 'units.json' is also a dictionary
-        if not isinstance(units[unit_group], dict):
-            raise ValueError(f"'units.json' is corrupted! Its '{units[unit_group]}' key should also be a dictionary!")
-        # Ensures every group in 'units.json' is also a group in 'base_units.json'
-        if unit_group not in base_units:
-            raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'base_units.json'!")
-        # Ensures base unit for each group is correctly define in 'units.json'
-        if base_units[unit_group] not in units[unit_group]:
-            raise KeyError(f"The base unit '{base_units[unit_group]}' for {unit_group} group is not present on 'units.json'!")
-    # Ensures 'conversion_log' is a list
-    if not isinstance(conversion_log, list):
+    # Ensures 'conversion_log' is a list, when it's loaded
+    if conversion_log is not None and not isinstance(conversion_log, list):
         raise ValueError("'convert_history' structure is corrupted!")
-    # Ensures 'month_days' is a dictionary and it's not empty
-    if not isinstance(month_days, dict) or not month_days:
-        raise ValueError("'month_days' structure is corrupted!")
-    # Ensures 'unit_aliases' is a dictionary and it's not empty
-    if not isinstance(unit_aliases, dict) or not unit_aliases:
-        raise ValueError("'unit_aliases.json' structure is corrupted!")
-    for unit_group in unit_aliases:
-        # Ensures every unit+grou in 'unit_aliases.json' is also a unit_group in 'units.json'
-        if unit_group not in units:
-            raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'units.json' dictionary!")
-        # Ensures every unit_group in 'unit_aliases.json' is also a dictionary
-        if not isinstance(unit_aliases[unit_group], dict):
-            raise ValueError(f"'unit_aliases.json' is corrupted! Its '{unit_aliases[unit_group]}' key should also be a dictionary!")
-        # Ensures no duplicate aliases in the same unit group
-        seen_aliases = set()
-        for alias in unit_aliases[unit_group]:
-            if alias in seen_aliases:
-                raise ValueError(f"'unit_aliases.json' is corrupted! There are duplicate aliases in '{unit_aliases[unit_group]}' group!")
-            seen_aliases.add(alias)
-    # Ensures 'original_units.json' is a dictionary and it's not empty
-    if not isinstance(original_units, dict) or not original_units:
-        raise ValueError("'original_units.json' structure is corrupted!")
-    for unit_group in original_units:
-        # Ensures every unit_group in 'original_units.json' is also a dictionary
-        if not isinstance(original_units[unit_group], dict):
-            raise ValueError(f"'units.json' is corrupted! Its '{original_units[unit_group]}' key should also be a dictionary!")
-        # Ensures every group in 'original_units.json' is also a group in 'base_units.json'
-        if unit_group not in base_units:
-            raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'base_units.json'!")
-        # Ensures base unit for each group is correctly define in 'original_units.json'
-        if base_units[unit_group] not in original_units[unit_group]:
-            raise KeyError(f"The base unit '{base_units[unit_group]}' for '{unit_group}' group is not present on 'units.json'!")
-        # Ensures every unit_type in 'original_units.json' is also an unit-type in 'units.json'
-        for unit_type in original_units[unit_group]:
-            if unit_type not in units[unit_group]:
-                raise KeyError(f"The unit_type '{unit_type}' should also be an unit_type in 'units.json'!")
-    # Ensures 'month_aliases' is a dictionary and it's not empty
-    if not isinstance(month_aliases, dict) or not month_aliases:
-        raise ValueError("'month_aliases.json' structure is corrupted!")
+    datasets: dict[str, Any] = {}
+    for file_name, dataset in zip(DATA_FILES, (units, base_units, unit_aliases, month_days, original_units, month_aliases)):
+        datasets[file_name] = dataset
+        validate_dataset(file_name, datasets)
+
+
+def validate_dataset(file_name: str, datasets: dict[str, Any]) -> None:
+    """Validates a single dataset, and its relationship with every other dataset already loaded"""
+    units: Optional[dict] = datasets.get("units")
+    base_units: Optional[dict] = datasets.get("base_units")
+    unit_aliases: Optional[dict] = datasets.get("unit_aliases")
+    original_units: Optional[dict] = datasets.get("original_units")
+    if file_name == "units":
+        # Ensures 'units.json' is a dictionary and it's not empty
+        if not isinstance(units, dict) or not units:
+            raise ValueError("'units.json' structure is corrupted!")
+        for unit_group in units:
+            # Ensures every unit_group in 'units.json' is also a dictionary
+            if not isinstance(units[unit_group], dict):
+                raise ValueError(f"'units.json' is corrupted! Its '{units[unit_group]}' key should also be a dictionary!")
+    elif file_name == "base_units":
+        # Ensures 'base_units.json' is a dictionary and it's not empty
+        if not isinstance(base_units, dict) or not base_units:
+            raise ValueError("'base_units.json' structure is corrupted!")
+    elif file_name == "month_days":
+        # Ensures 'month_days' is a dictionary and it's not empty
+        if not isinstance(datasets["month_days"], dict) or not datasets["month_days"]:
+            raise ValueError("'month_days' structure is corrupted!")
+    elif file_name == "unit_aliases":
+        # Ensures 'unit_aliases' is a dictionary and it's not empty
+        if not isinstance(unit_aliases, dict) or not unit_aliases:
+            raise ValueError("'unit_aliases.json' structure is corrupted!")
+        for unit_group in unit_aliases:
+            # Ensures every unit_group in 'unit_aliases.json' is also a dictionary
+            if not isinstance(unit_aliases[unit_group], dict):
+                raise ValueError(f"'unit_aliases.json' is corrupted! Its '{unit_aliases[unit_group]}' key should also be a dictionary!")
+            # Ensures no duplicate aliases in the same unit group
+            seen_aliases = set()
+            for alias in unit_aliases[unit_group]:
+                if alias in seen_aliases:
+                    raise ValueError(f"'unit_aliases.json' is corrupted! There are duplicate aliases in '{unit_aliases[unit_group]}' group!")
+                seen_aliases.add(alias)
+    elif file_name == "original_units":
+        # Ensures 'original_units.json' is a dictionary and it's not empty
+        if not isinstance(original_units, dict) or not original_units:
+            raise ValueError("'original_units.json' structure is corrupted!")
+        for unit_group in original_units:
+            # Ensures every unit_group in 'original_units.json' is also a dictionary
+            if not isinstance(original_units[unit_group], dict):
+                raise ValueError(f"'units.json' is corrupted! Its '{original_units[unit_group]}' key should also be a dictionary!")
+    elif file_name == "month_aliases":
+        # Ensures 'month_aliases' is a dictionary and it's not empty
+        if not isinstance(datasets["month_aliases"], dict) or not datasets["month_aliases"]:
+            raise ValueError("'month_aliases.json' structure is corrupted!")
+
+    # Relationships are checked once both datasets are loaded, whichever is loaded last
+    if file_name in ["units", "base_units"] and units is not None and base_units is not None:
+        for unit_group in units:
+            # Ensures every group in 'units.json' is also a group in 'base_units.json'
+            if unit_group not in base_units:
+                raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'base_units.json'!")
+            # Ensures base unit for each group is correctly define in 'units.json'
+            if base_units[unit_group] not in units[unit_group]:
+                raise KeyError(f"The base unit '{base_units[unit_group]}' for {unit_group} group is not present on 'units.json'!")
+    if file_name in ["units", "unit_aliases"] and units is not None and unit_aliases is not None:
+        for unit_group in unit_aliases:
+            # Ensures every unit+grou in 'unit_aliases.json' is also a unit_group in 'units.json'
+            if unit_group not in units:
+                raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'units.json' dictionary!")
+    if file_name in ["base_units", "original_units"] and base_units is not None and original_units is not None:
+        for unit_group in original_units:
+            # Ensures every group in 'original_units.json' is also a group in 'base_units.json'
+            if unit_group not in base_units:
+                raise KeyError(f"Dictionaries don't match! '{unit_group}' should also be a key in 'base_units.json'!")
+            # Ensures base unit for each group is correctly define in 'original_units.json'
+            if base_units[unit_group] not in original_units[unit_group]:
+                raise KeyError(f"The base unit '{base_units[unit_group]}' for '{unit_group}' group is not present on 'units.json'!")
+    if file_name in ["units", "original_units"] and units is not None and original_units is not None:
+        for unit_group in original_units:
+            # Ensures every unit_type in 'original_units.json' is also an unit-type in 'units.json'
+            for unit_type in original_units[unit_group]:
+                if unit_type not in units.get(unit_group, {}):
+                    raise KeyError(f"The unit_type '{unit_type}' should also be an unit_type in 'units.json'!")
  
 
 def add_to_log(data: DataStore, conversion_data: ConversionData, is_time_convertion: bool=False) -> None:
-    """Adds successfully converted value to log file (conversion_log.json)"""
+    """Adds successfully converted value to conversion history (data/history/)"""
     unit_group: str = conversion_data.unit_group
 
     if is_time_convertion:
@@ -112,7 +295,7 @@ def add_to_log(data: DataStore, conversion_data: ConversionData, is_time_convert
         if all(x is None for x in (from_time, to_time, factor_time, new_time)):
             raise ValueError("Missing required arguments!")
         entry = {
-            "date": datetime.now().isoformat(),
+            "date": datetime.now().isoformat(timespec="microseconds"),
             "unit_group": unit_group,
             "from_time": from_time,
             "to_time": to_time,
@@ -127,7 +310,7 @@ def add_to_log(data: DataStore, conversion_data: ConversionData, is_time_convert
         if all(x is None for x in (from_type, to_type, amount, new_value)):
             raise ValueError("Missing required arguments!")
         entry = {
-            "date": datetime.now().isoformat(),
+            "date": datetime.now().isoformat(timespec="microseconds"),
             "unit_group": unit_group,
             "from_type": from_type,
             "to_type": to_type,
@@ -135,29 +318,251 @@ def add_to_log(data: DataStore, conversion_data: ConversionData, is_time_convert
             "result": float(new_value)
         }
 
-    # Cleans 'conversion_log.json' file, preventing big files
-    data.conversion_log = clean_history(data)
-    # Appends new entry
-    data.conversion_log.append(entry)
+    # Appends new entry, without rewriting previous ones (written to disk by 'LOG_WRITER')
+    if data.conversion_log is not None:
+        data.conversion_log.append(entry)
+    LOG_WRITER.write(entry)
+
+
+def get_history(data: DataStore, limit: int, history_data: Optional[HistoryData]=None) -> list[dict]:
+    """Gets the last 'limit' conversion entries matching all filters, reading them from disk if they aren't in memory"""
+    if history_data is None:
+        history_data = HistoryData()
+    if data.conversion_log is not None:
+        entries: list[dict] = [entry for entry in data.conversion_log if history_data.matches(entry)]
+        return entries[max(len(entries) - limit, 0):]
+    clean_history_once()
+    if HISTORY_BACKEND == "sqlite":
+        # Filters are handled by indexed queries
+        flush_log()
+        return get_history_database().query(limit, history_data.unit_group, history_data.since, history_data.until, history_data.unit_type)
+    if history_data.is_empty():
+        return load_log(limit)
+    return search_log(limit, history_data)
 
-    save_data(data.conversion_log, "conversion_log")
 
+def search_log(limit: int, history_data: HistoryData) -> list[dict]:
+    """Reads segments, starting by the newest ones, until 'limit' entries matching all filters are found"""
+    migrate_legacy_log()
+    flush_log()
+    entries: list[dict] = []
+    for segment in reversed(list_segments()):
+        # Skips whole segments outside 'since' and 'until' dates
+        if history_data.until and segment.stem > history_data.until[:10]:
+            continue
+        if history_data.since and segment.stem < history_data.since[:10]:
+            break
+        with open(segment, "r") as file:
+            segment_entries: list[dict] = [json.loads(line) for line in file if line.strip()]
+        entries = [entry for entry in segment_entries if history_data.matches(entry)] + entries
+        if len(entries) >= limit:
+            break
+    return entries[max(len(entries) - limit, 0):]
 
-def clean_history(data: DataStore) -> list[dict]:
-    """Cleans 'conversion_log.json' file keeping only entries not older than 3 days"""
-    return [entry for entry in data.conversion_log if "date" in entry and datetime.now() - datetime.fromisoformat(entry["date"]) <= timedelta(days=3)]
 
+def load_log(limit: Optional[int]=None) -> list[dict]:
+    """Reads entries from history segments, starting by the newest ones, until 'limit' entries are read"""
+    migrate_legacy_log()
+    # Makes sure entries still queued in memory are also read
+    flush_log()
+    entries: list[dict] = []
+    for segment in reversed(list_segments()):
+        if limit is None:
+            with open(segment, "r") as file:
+                lines = [line for line in file if line.strip()]
+        else:
+            lines = read_last_lines(segment, limit - len(entries))
+        entries = [json.loads(line) for line in lines] + entries
+        if limit is not None and len(entries) >= limit:
+            break
+    return entries
 
-def save_data(data: Union[dict[Any, Any], list[dict[str, Any]]], file_name: str) -> Union[dict[Any, Any], list[dict[str, Any]]]:
-    """Tries saving the modifications in the '.json' file, or return its backup"""
+
+def read_last_lines(path: Path, count: int) -> list[str]:
+    """Reads the last 'count' lines of a file, seeking backwards from its end"""
+    if count <= 0:
+        return []
+    with open(path, "rb") as file:
+        position: int = file.seek(0, os.SEEK_END)
+        buffer: bytes = b""
+        # One extra line break ensures the first of those lines is complete
+        while position > 0 and buffer.count(b"\n") <= count:
+            read_size: int = min(BLOCK_SIZE, position)
+            position -= read_size
+            file.seek(position)
+            buffer = file.read(read_size) + buffer
+    lines: list[bytes] = [line for line in buffer.split(b"\n") if line.strip()]
+    return [line.decode() for line in lines[-count:]]
+
+
+def list_segments() -> list[Path]:
+    """Lists all history segments, from the oldest to the newest"""
+    if not LOG_DIR.exists():
+        return []
+    # Segments are named after their date, so sorting by name also sorts by date
+    return sorted(LOG_DIR.glob("*.jsonl"))
+
+
+def append_to_log(entries: list[dict]) -> None:
+    """Appends a batch of entries to their respective daily segment"""
+    segments: dict[str, list[dict]] = {}
+    for entry in entries:
+        segments.setdefault(entry["date"][:10], []).append(entry)
     try:
-        backup = data.copy()  # Backup is used in case of error
-        with open(BASE_DIR / "data" / f"{file_name}.json", "w") as file:
-            json.dump(data, file, indent=4)
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        for day, day_entries in segments.items():
+            with open(LOG_DIR / f"{day}.jsonl", "a") as file:
+                file.writelines(json.dumps(entry) + "\n" for entry in day_entries)
     except PermissionError:
-        print(f"Error! You don't have permission to write to {file_name}!")
-        return backup
-    return data
+        print("Error! You don't have permission to write to conversion history!")
+
+
+def migrate_legacy_log() -> None:
+    """Moves entries from former 'conversion_log.json' and 'conversion_log.jsonl' files into daily segments"""
+    for legacy_path in (BASE_DIR / "data" / "conversion_log.json", BASE_DIR / "data" / "conversion_log.jsonl"):
+        if not legacy_path.exists():
+            continue
+        with open(legacy_path, "r") as file:
+            if legacy_path.suffix == ".json":
+                entries = json.load(file)
+            else:
+                entries = [json.loads(line) for line in file if line.strip()]
+        append_to_log([entry for entry in entries if "date" in entry])
+        legacy_path.unlink()
+
+
+def get_history_database() -> HistoryDatabase:
+    """Opens SQLite history database, only once"""
+    global HISTORY_DATABASE
+    if HISTORY_DATABASE is None or HISTORY_DATABASE.path != DATABASE_PATH:
+        HISTORY_DATABASE = HistoryDatabase(DATABASE_PATH)
+    return HISTORY_DATABASE
+
+
+def close_history_database() -> None:
+    """Closes SQLite history database, if it's open (it's opened again when needed)"""
+    global HISTORY_DATABASE
+    if HISTORY_DATABASE is not None:
+        HISTORY_DATABASE.close()
+        HISTORY_DATABASE = None
+
+
+def write_history(entries: list[dict]) -> None:
+    """Writes a batch of entries to the selected history backend"""
+    clean_history_once()
+    if HISTORY_BACKEND == "sqlite":
+        get_history_database().append(entries)
+    else:
+        append_to_log(entries)
+
+
+def configure_history(backend: str="files") -> None:
+    """Selects where conversion history is stored ("files" or "sqlite")"""
+    global HISTORY_BACKEND
+    if backend not in ["files", "sqlite"]:
+        raise ValueError(f"Invalid history backend: '{backend}'")
+    # Entries already queued are written to the previous backend
+    flush_log()
+    HISTORY_BACKEND = backend
+
+
+def configure_log_writer(batch_size: int=100, flush_interval: float=1.0, sync: bool=False) -> None:
+    """Changes how conversion entries are written ('sync' writes every entry before returning)"""
+    LOG_WRITER.configure(batch_size, flush_interval, sync)
+
+
+def flush_log() -> None:
+    """Writes all conversion entries still queued in memory"""
+    LOG_WRITER.flush()
+
+
+# Conversion entries are queued and written in batches, and all of them are written when the program exits
+LOG_WRITER = LogWriter(write_history)
+atexit.register(flush_log)
+
+
+def clean_history_once() -> None:
+    """Deletes expired history, unless it was already deleted in this run"""
+    if not HISTORY_CLEANED:
+        clean_history()
+
+
+def clean_history(retention_days: int=HISTORY_RETENTION_DAYS) -> None:
+    """Deletes whole history segments (or database entries) older than 'retention_days' days"""
+    global HISTORY_CLEANED
+    HISTORY_CLEANED = True
+    oldest_day: str = (datetime.now() - timedelta(days=retention_days)).date().isoformat()
+    if HISTORY_BACKEND == "sqlite":
+        # A single indexed 'DELETE' query
+        get_history_database().clean(oldest_day)
+        return
+    migrate_legacy_log()
+    for segment in list_segments():
+        if segment.stem >= oldest_day:
+            break
+        segment.unlink()
+
+
+def save_data(data: DataStore) -> None:
+    """Saves every dataset changed since the last save, keeping them marked as changed in case of error"""
+    # Changes made inside a batch are only saved when it's committed
+    if data.batching or not data.dirty:
+        return
+    try:
+        # Changes made within the same clock tick wouldn't change the files' modification time
+        clear_cache()
+        if (BASE_DIR / "data" / SNAPSHOT_FILE).exists():
+            catalog: dict = load_snapshot()
+            catalog.update({file_name: getattr(data, file_name) for file_name in data.dirty})
+            write_snapshot(catalog)
+        else:
+            # All files are fully written before any of them replaces its previous version
+            temp_paths: dict[Path, Path] = {}
+            for file_name in sorted(data.dirty):
+                path: Path = BASE_DIR / "data" / f"{file_name}.json"
+                temp_paths[path] = write_temp_file(path, json.dumps(getattr(data, file_name), indent=4))
+            for path, temp_path in temp_paths.items():
+                os.replace(temp_path, path)
+    except PermissionError:
+        print(f"Error! You don't have permission to write to {', '.join(sorted(data.dirty))}!")
+        return
+    data.dirty.clear()
+
+
+@contextmanager
+def batch_changes(data: DataStore) -> Iterator[DataStore]:
+    """Applies many changes in memory, validating and saving them once at the end, or rolling all of them back on error"""
+    # Nested batches are part of the outer one
+    if data.batching:
+        yield data
+        return
+    backup: dict[str, Any] = {file_name: copy.deepcopy(getattr(data, file_name)) for file_name in DATA_FILES}
+    dirty: set[str] = set(data.dirty)
+    data.batching = True
+    try:
+        yield data
+        validate_data(data.units, data.base_units, None, data.unit_aliases, data.month_days, data.original_units, data.month_aliases)
+    except BaseException:
+        data.restore(backup)
+        data.dirty = dirty
+        raise
+    finally:
+        data.batching = False
+    data.rebuild_stale_groups()
+    save_data(data)
+
+
+def write_temp_file(path: Path, content: str) -> Path:
+    """Writes content to a temporary file next to 'path', so that it can be atomically renamed into place"""
+    temp_path: Path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, "w") as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    # Keeps permissions of the file being replaced
+    if path.exists():
+        os.chmod(temp_path, path.stat().st_mode)
+    return temp_path
 
 
 def refactor_value(data: DataStore, unit_group: str, new_base_unit: str|None) -> None:
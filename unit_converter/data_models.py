@@ -1,18 +1,110 @@
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
 
+from .engine import ConversionEngine
+from .result_cache import ResultCache
+from .unit_index import UnitIndex
 from .utils import validate_unit_group, resolve_aliases, parse_date_input, validate_date
 
 
+class LazyDataset:
+    """'DataStore' attribute that is only loaded the first time it's used"""
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, data: Optional["DataStore"], owner: type) -> Any:
+        if data is None:
+            return self
+        if self.name not in data.datasets:
+            if data.loader is None:
+                raise AttributeError(f"'{self.name}' was not loaded!")
+            data.datasets[self.name] = data.loader(self.name)
+        return data.datasets[self.name]
+
+    def __set__(self, data: "DataStore", value: Any) -> None:
+        data.datasets[self.name] = value
+
+
 class DataStore:
     """Holds data from all '.json' files"""
-    def __init__(self, units: dict, base_units: dict, conversion_log: list, unit_aliases: dict, month_days: dict, original_units: dict, month_aliases: dict):
-        self.units = units
-        self.base_units = base_units
+    units = LazyDataset()
+    base_units = LazyDataset()
+    unit_aliases = LazyDataset()
+    month_days = LazyDataset()
+    original_units = LazyDataset()
+    month_aliases = LazyDataset()
+
+    def __init__(self, units: Optional[dict]=None, base_units: Optional[dict]=None, conversion_log: Optional[list]=None, unit_aliases: Optional[dict]=None, month_days: Optional[dict]=None, original_units: Optional[dict]=None, month_aliases: Optional[dict]=None, loader: Optional[Callable[[str], Any]]=None):
+        # Datasets already in memory, while 'loader' gets all other ones on first use
+        self.datasets: dict[str, Any] = {}
+        self.loader = loader
+        for name, dataset in (("units", units), ("base_units", base_units), ("unit_aliases", unit_aliases), ("month_days", month_days), ("original_units", original_units), ("month_aliases", month_aliases)):
+            if dataset is not None:
+                self.datasets[name] = dataset
+        # 'None' means history wasn't loaded, so it's read from disk when needed
         self.conversion_log = conversion_log
-        self.unit_aliases = unit_aliases
-        self.month_days = month_days
-        self.original_units = original_units
-        self.month_aliases = month_aliases
+        self._engine: Optional[ConversionEngine] = None
+        self._unit_index: Optional[UnitIndex] = None
+        # Datasets changed since they were last saved
+        self.dirty: set[str] = set()
+        # While 'True', changes are only saved when the whole batch is committed (see 'batch_changes')
+        self.batching = False
+        # Unit groups changed inside a batch, whose conversion tables are only rebuilt when it's committed
+        self.stale_groups: set[str] = set()
+        # Results of already converted values, disabled until it's given a maximum size
+        self.result_cache = ResultCache()
+
+    def mark_dirty(self, *file_names: str) -> None:
+        """Marks datasets as changed, so that the next 'save_data' writes them"""
+        self.dirty.update(file_names)
+        # Any catalog change can change cached results
+        self.result_cache.clear()
+
+    def restore(self, datasets: dict[str, Any]) -> None:
+        """Replaces datasets with previous copies of them, rebuilding the conversion engine"""
+        self.datasets.update(datasets)
+        self._engine = None
+        self._unit_index = None
+        self.stale_groups.clear()
+        self.result_cache.clear()
+
+    @property
+    def engine(self) -> ConversionEngine:
+        """Scale factor of every unit type, updated whenever 'units' changes"""
+        if self._engine is None:
+            self._engine = ConversionEngine(self.units)
+        return self._engine
+
+    def refresh_engine(self, unit_group: str, unit_type: Optional[str]=None) -> None:
+        """Updates the conversion engine after a unit group (or a single unit type of it) changed"""
+        # An engine that wasn't built yet is built from current 'units' when it's first used
+        if self._engine is None:
+            return
+        # Inside a batch, each changed group is rebuilt only once, when the batch is committed
+        if self.batching:
+            self.stale_groups.add(unit_group)
+            return
+        if unit_group not in self.units:
+            self._engine.remove_group(unit_group)
+        elif unit_type is None:
+            self._engine.build_group(unit_group)
+        elif unit_type in self.units[unit_group]:
+            self._engine.add_type(unit_group, unit_type)
+        else:
+            self._engine.remove_type(unit_group, unit_type)
+
+    def rebuild_stale_groups(self) -> None:
+        """Rebuilds the conversion table of every unit group changed inside a batch"""
+        for unit_group in sorted(self.stale_groups):
+            self.refresh_engine(unit_group)
+        self.stale_groups.clear()
+
+    @property
+    def unit_index(self) -> UnitIndex:
+        """Unit types and aliases of all groups, updated whenever a unit type or alias changes"""
+        if self._unit_index is None:
+            self._unit_index = UnitIndex(self.units, self.unit_aliases)
+        return self._unit_index
 
 
 class ConversionData:
@@ -28,6 +120,9 @@ class ConversionData:
         self.to_time = to_time
         self.factor_time = factor_time
         self.new_time = new_time
+        # Filled by time conversions, so that messages can be built apart from the conversion itself
+        self.time_parts: Optional[list[tuple[float, str]]] = None
+        self.time_format: Optional[str] = None
 
     def validate_from_type(self, data: DataStore) -> None:
         if not self.from_type:
@@ -290,7 +385,7 @@ class AliasesData:
     def validate_alias(self, data: DataStore) -> None:
         if not self.alias:
             raise ValueError("'alias' cannot be empty!")
-        all_group_aliases: list[str] = [alias for alias in data.unit_aliases[self.unit_group]]
+        all_group_aliases: dict[str, str] = data.unit_aliases[self.unit_group]
         if self.action == "add":
             if self.alias in all_group_aliases:
                 raise ValueError(f"'{self.alias}' is already being used as an alias in '{self.unit_group}'!")
@@ -329,16 +424,88 @@ class ChangeBaseData:
             raise ValueError(f"'{self.new_base_unit}' is already the current base unit for '{self.unit_group}' group")   
 
 
+def parse_history_date(date: str) -> datetime:
+    """Parses a 'since' or 'until' filter, which must be in local time, just like history entries"""
+    try:
+        parsed_date: datetime = datetime.fromisoformat(date)
+    except ValueError:
+        raise ValueError(f"Invalid date: '{date}'! Usage: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS")
+    if parsed_date.tzinfo is not None:
+        raise ValueError(f"Invalid date: '{date}'! Time zones aren't supported, since history dates are in local time")
+    return parsed_date
+
+
+class HistoryData:
+    """Holds filters related to conversion history"""
+    def __init__(self, unit_group: Optional[str]=None, since: Optional[str]=None, until: Optional[str]=None, unit_type: Optional[str]=None):
+        self.unit_group = unit_group
+        self.since = since
+        self.until = until
+        self.unit_type = unit_type
+
+    def validate_since(self) -> None:
+        if not self.since:
+            return
+        # Converts to the same format of history entries, so that dates can be compared as strings
+        self.since = parse_history_date(self.since).isoformat(timespec="microseconds")
+
+    def validate_until(self) -> None:
+        if not self.until:
+            return
+        until: datetime = parse_history_date(self.until)
+        # Stores the first moment after 'until', so that a single day includes all its entries
+        if "T" not in self.until and " " not in self.until:
+            until += timedelta(days=1)
+        else:
+            until += timedelta(microseconds=1)
+        self.until = until.isoformat(timespec="microseconds")
+
+    def validate_unit_type(self, data: DataStore) -> None:
+        if not self.unit_type:
+            return
+        if self.unit_group and self.unit_group in data.unit_aliases and self.unit_type in data.unit_aliases[self.unit_group]:
+            self.unit_type = resolve_aliases(data, self.unit_group, self.unit_type)
+        # Without a unit group, aliases are resolved from every group, as long as they all mean the same unit type
+        elif not self.unit_group and self.unit_type in data.unit_index:
+            unit_types: list[str] = sorted(set(data.unit_index.names[self.unit_type].values()))
+            if len(unit_types) > 1:
+                raise ValueError(f"'{self.unit_type}' is an alias of many unit types ({', '.join(unit_types)})! Use '--group' to choose one")
+            self.unit_type = unit_types[0]
+
+    def validate_for_history(self, data: DataStore) -> None:
+        self.validate_since()
+        self.validate_until()
+        if self.since and self.until and self.since >= self.until:
+            raise ValueError("'since' must be before 'until'!")
+        self.validate_unit_type(data)
+
+    def is_empty(self) -> bool:
+        return not (self.unit_group or self.since or self.until or self.unit_type)
+
+    def matches(self, entry: dict) -> bool:
+        """Checks if a conversion entry matches all filters"""
+        if self.unit_group and entry.get("unit_group") != self.unit_group:
+            return False
+        if self.since and entry.get("date", "") < self.since:
+            return False
+        if self.until and entry.get("date", "") >= self.until:
+            return False
+        if self.unit_type and self.unit_type not in (entry.get("from_type", entry.get("from_time")), entry.get("to_type", entry.get("to_time"))):
+            return False
+        return True
+
+
 def validate_for_history(data: DataStore, limit):
-    """Validate 'conversion_log.json' data, and 'limit' value"""
-    if not data.conversion_log:
-        raise ValueError("Conversion history is empty!")
+    """Validate conversion history data, and 'limit' value"""
     try:
         limit = int(limit)        
     except:
         raise ValueError("'limit' must be a number!")
     if limit < 0:
             raise ValueError("'limit' must be a positive number!")
+    # History that isn't loaded is only checked after being read from disk
+    if data.conversion_log is not None and not data.conversion_log:
+        raise ValueError("Conversion history is empty!")
     
 
 
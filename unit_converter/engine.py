@@ -0,0 +1,119 @@
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only required for batch conversions
+    np = None  # type: ignore[assignment]
+
+
+class ConversionEngine:
+    """Holds the scale factor (or factor and offset, for temperature) of every unit type, converting pairs at lookup"""
+    def __init__(self, units: dict):
+        self.units = units
+        # Maps each unit group to a 'unit_type' -> scale factor table (ratios are 'factors[from_type] / factors[to_type]')
+        self.factors: dict[str, dict[str, float]] = {}
+        # Maps 'temperature' group to a 'unit_type' -> (factor, offset) table
+        self.affine: dict[str, dict[str, tuple[float, float]]] = {}
+        for unit_group in units:
+            self.build_group(unit_group)
+
+    def build_group(self, unit_group: str) -> None:
+        """(Re)builds the table of a single unit group (used when all its values change, e.g. a new base unit)"""
+        group_units: dict = self.units[unit_group]
+        # New table is swapped in with a single assignment, so that conversions running on other threads
+        # (see 'ConversionBatcher') always find either the old or the new table, never a missing group
+        if unit_group == "temperature":
+            self.affine[unit_group] = {unit_type: (value[0], value[1]) for unit_type, value in group_units.items()}
+        else:
+            self.factors[unit_group] = dict(group_units)
+
+    def remove_group(self, unit_group: str) -> None:
+        """Drops the table of a single unit group"""
+        self.factors.pop(unit_group, None)
+        self.affine.pop(unit_group, None)
+
+    def add_type(self, unit_group: str, unit_type: str) -> None:
+        """Adds (or updates) a single unit type, leaving all other unit types of its group untouched"""
+        value = self.units[unit_group][unit_type]
+        if unit_group in self.affine:
+            self.affine[unit_group][unit_type] = (value[0], value[1])
+        else:
+            self.factors[unit_group][unit_type] = value
+
+    def remove_type(self, unit_group: str, unit_type: str) -> None:
+        """Drops a single unit type"""
+        table: dict = self.affine[unit_group] if unit_group in self.affine else self.factors.get(unit_group, {})
+        table.pop(unit_type, None)
+
+    def convert(self, unit_group: str, from_type: str, to_type: str, amount: float) -> float:
+        """Converts an amount between two canonical unit types of the same group"""
+        if unit_group in self.affine:
+            scale, offset = self.coefficients(unit_group, from_type, to_type)
+            return (amount * scale) + offset
+        factors: dict[str, float] = self.factors[unit_group]
+        from_factor: float = factors[from_type]
+        to_factor: float = factors[to_type]
+        if to_factor == 0:
+            raise ZeroDivisionError("Can't Divide by zero")
+        return amount * (from_factor / to_factor)
+
+    def convert_many(self, unit_group: str, from_type: str, to_type: str, amounts: Any) -> Any:
+        """Converts a whole array (or buffer) of amounts in one vectorized step"""
+        if np is None:
+            raise ImportError("Batch conversions require NumPy! Install it with 'pip install numpy'")
+        values = np.asarray(amounts, dtype=np.float64)
+        # Prevents negative value for "Kelvin"
+        if unit_group == "temperature" and from_type == "kelvin" and (values < 0).any():
+            raise ValueError("Kelvin temperature cannot be negative!")
+        scale, offset = self.coefficients(unit_group, from_type, to_type)
+        if unit_group in self.affine:
+            return (values * scale) + offset
+        return values * scale
+
+    def coefficients(self, unit_group: str, from_type: str, to_type: str) -> tuple[float, float]:
+        """Gets '(scale, offset)' pair of a conversion ('offset' is always 0.0 outside 'temperature' group)"""
+        if unit_group in self.affine:
+            values: dict[str, tuple[float, float]] = self.affine[unit_group]
+            pair: Optional[tuple[float, float]] = temperature_pair(from_type, values[from_type], to_type, values[to_type])
+            if pair is None:
+                raise ZeroDivisionError("Can't Divide by zero")
+            return pair
+        factors: dict[str, float] = self.factors[unit_group]
+        from_factor: float = factors[from_type]
+        to_factor: float = factors[to_type]
+        if to_factor == 0:
+            raise ZeroDivisionError("Can't Divide by zero")
+        return from_factor / to_factor, 0.0
+
+    def compile_pair(self, unit_group: str, from_type: str, to_type: str) -> Callable[[float], float]:
+        """Builds a function converting amounts of a single pair, with its ratio (or scale and offset) already looked up"""
+        scale, offset = self.coefficients(unit_group, from_type, to_type)
+        # Prevents negative value for "Kelvin", the only check left for each amount
+        if unit_group == "temperature" and from_type == "kelvin":
+            def convert_kelvin(amount: float) -> float:
+                if amount < 0:
+                    raise ValueError("Kelvin temperature cannot be negative!")
+                return (amount * scale) + offset
+            return convert_kelvin
+        if unit_group in self.affine:
+            def convert_affine(amount: float) -> float:
+                return (amount * scale) + offset
+            return convert_affine
+        def convert_ratio(amount: float) -> float:
+            return amount * scale
+        return convert_ratio
+
+
+def temperature_pair(from_type: str, from_value: Sequence[float], to_type: str, to_value: Sequence[float]) -> Optional[tuple[float, float]]:
+    """Collapses a temperature conversion into a single '(scale, offset)' pair"""
+    factor_from, offset_from = from_value
+    factor_to, offset_to = to_value
+    if factor_from == 0:
+        return None
+    # Same shortcuts used by 'converter_temp', keeping its results unchanged
+    if from_type == "celsius":
+        return factor_to, offset_to
+    if to_type == "celsius":
+        return 1 / factor_from, -offset_from / factor_from
+    scale: float = factor_to / factor_from
+    return scale, offset_to - (offset_from * scale)
@@ -0,0 +1,68 @@
+import json
+import sqlite3
+import threading
+
+from pathlib import Path
+from typing import Optional
+
+
+class HistoryDatabase:
+    """Stores conversion history in an indexed SQLite table"""
+    def __init__(self, path: Path):
+        self.path = path
+        # Connection is shared with the background log writer, so every access is locked
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS conversion_log (
+                    id INTEGER PRIMARY KEY,
+                    date TEXT NOT NULL,
+                    unit_group TEXT NOT NULL,
+                    from_type TEXT,
+                    to_type TEXT,
+                    entry TEXT NOT NULL
+                )
+            """)
+            self.connection.execute("CREATE INDEX IF NOT EXISTS conversion_log_date ON conversion_log (date)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS conversion_log_group ON conversion_log (unit_group, date)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS conversion_log_from_type ON conversion_log (from_type, date)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS conversion_log_to_type ON conversion_log (to_type, date)")
+
+    def append(self, entries: list[dict]) -> None:
+        """Inserts a batch of entries in a single transaction"""
+        # Time conversions store 'from_time' and 'to_time' as their types
+        rows = [(entry["date"], entry["unit_group"], entry.get("from_type", entry.get("from_time")), entry.get("to_type", entry.get("to_time")), json.dumps(entry)) for entry in entries]
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT INTO conversion_log (date, unit_group, from_type, to_type, entry) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def query(self, limit: int, unit_group: Optional[str]=None, since: Optional[str]=None, until: Optional[str]=None, unit_type: Optional[str]=None) -> list[dict]:
+        """Gets the last 'limit' entries matching all given filters, from the oldest to the newest"""
+        conditions: list[str] = []
+        parameters: list = []
+        if unit_group:
+            conditions.append("unit_group = ?")
+            parameters.append(unit_group)
+        if since:
+            conditions.append("date >= ?")
+            parameters.append(since)
+        if until:
+            conditions.append("date < ?")
+            parameters.append(until)
+        if unit_type:
+            conditions.append("(from_type = ? OR to_type = ?)")
+            parameters.extend([unit_type, unit_type])
+        where: str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.lock:
+            rows = self.connection.execute(f"SELECT entry FROM conversion_log {where} ORDER BY date DESC, id DESC LIMIT ?", [*parameters, limit]).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def clean(self, oldest_date: str) -> None:
+        """Deletes every entry older than 'oldest_date'"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM conversion_log WHERE date < ?", (oldest_date,))
+
+    def close(self) -> None:
+        """Closes database connection"""
+        with self.lock:
+            self.connection.close()
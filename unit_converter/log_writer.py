@@ -0,0 +1,67 @@
+import threading
+
+from queue import Empty, SimpleQueue
+from typing import Callable, Optional
+
+
+class LogWriter:
+    """Queues log entries in memory and writes them in batches from a background thread"""
+    def __init__(self, write_entries: Callable[[list[dict]], None], batch_size: int=100, flush_interval: float=1.0, sync: bool=False):
+        self.write_entries = write_entries
+        self.configure(batch_size, flush_interval, sync)
+        self.pending: SimpleQueue = SimpleQueue()
+        # Prevents two flushes (background thread and caller) from writing at the same time
+        self.lock = threading.Lock()
+        self.wake_up = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def configure(self, batch_size: int=100, flush_interval: float=1.0, sync: bool=False) -> None:
+        """Changes batch size, flush interval (in seconds) and durability mode"""
+        if batch_size < 1:
+            raise ValueError("'batch_size' must be a positive number!")
+        if flush_interval <= 0:
+            raise ValueError("'flush_interval' must be a positive number!")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # In durability mode, every entry is written before 'write' returns
+        self.sync = sync
+
+    def write(self, entry: dict) -> None:
+        """Queues a single entry, or writes it right away in durability mode"""
+        if self.sync:
+            self.flush()
+            with self.lock:
+                self.write_entries([entry])
+            return
+        self.pending.put(entry)
+        self.start()
+        if self.pending.qsize() >= self.batch_size:
+            self.wake_up.set()
+
+    def flush(self) -> None:
+        """Writes all queued entries at once"""
+        with self.lock:
+            entries: list[dict] = []
+            while True:
+                try:
+                    entries.append(self.pending.get_nowait())
+                except Empty:
+                    break
+            if entries:
+                self.write_entries(entries)
+
+    def start(self) -> None:
+        """Starts background thread, if it's not already running"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self.thread.start()
+
+    def _run(self) -> None:
+        """Flushes queued entries every 'flush_interval' seconds, or as soon as a batch is full"""
+        while True:
+            self.wake_up.wait(self.flush_interval)
+            self.wake_up.clear()
+            self.flush()
@@ -0,0 +1,196 @@
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+# Unix socket of the resident process, which can be changed with 'UNIT_CONVERTER_SOCKET' environment variable
+SOCKET_PATH = Path(os.environ.get("UNIT_CONVERTER_SOCKET", Path(__file__).parent.parent / "data" / "resident.sock"))
+# Size of the header with the request's length, sent together with the client's stdin, stdout and stderr
+HEADER_SIZE = 8
+EXIT_CODE_SIZE = 4
+
+
+def forward(args: list[str], path: Optional[Path]=None) -> Optional[int]:
+    """Runs a CLI command on the resident process, returning its exit code (or 'None', when it isn't running)"""
+    path = path or SOCKET_PATH
+    # Passing file descriptors requires Unix sockets (not available on Windows)
+    if not hasattr(socket, "send_fds") or not path.exists():
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with client:
+        try:
+            client.connect(str(path))
+            request: bytes = json.dumps({"args": args, "cwd": os.getcwd(), "environ": dict(os.environ)}).encode()
+            # Command runs with the client's own stdin, stdout and stderr, so its output is written straight to them
+            socket.send_fds(client, [len(request).to_bytes(HEADER_SIZE, "big")], [0, 1, 2])
+            client.sendall(request)
+        except OSError:
+            # Stale socket, or a resident process that can't take requests, so the command runs in this process
+            return None
+        response: bytes = receive_exactly(client, EXIT_CODE_SIZE)
+    if len(response) < EXIT_CODE_SIZE:
+        print("Error: Resident process stopped before finishing the command!", file=sys.stderr)
+        return 1
+    return int.from_bytes(response, "big", signed=True)
+
+
+def receive_exactly(connection: socket.socket, size: int) -> bytes:
+    """Reads 'size' bytes from a socket, or less of them if it's closed before that"""
+    chunks: list[bytes] = []
+    while size > 0:
+        chunk: bytes = connection.recv(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class ResidentServer:
+    """Keeps the unit catalog loaded, forking a copy of this process for each forwarded CLI command"""
+    def __init__(self, run: Callable[[Any, list[str]], int], path: Optional[Path]=None):
+        self.run = run
+        self.path = path or SOCKET_PATH
+        self.data: Any = None
+        self.sources: Optional[list] = None
+        self.reload()
+
+    def reload(self) -> None:
+        """Loads the unit catalog and its conversion ratios, unless none of its files changed since they were last loaded"""
+        # Imported here, so that forwarding commands doesn't import anything but the standard library
+        from .data_manager import load_data, get_source_stats, close_history_database
+        from .data_models import DataStore
+        sources: Optional[list] = get_source_stats()
+        if self.data is not None and sources is not None and sources == self.sources:
+            return
+        try:
+            self.data = DataStore(*load_data())
+            self.data.engine
+            self.sources = sources
+        except Exception:
+            # An invalid catalog is reported by each command, which loads it just like 'project.py' does (see 'run_child')
+            self.data = None
+            self.sources = None
+        finally:
+            # SQLite connections can't be shared across 'fork', so each forked process opens its own
+            close_history_database()
+
+    def serve_forever(self) -> None:
+        """Takes forwarded commands until it's interrupted (Ctrl+C)"""
+        if not hasattr(os, "fork") or not hasattr(socket, "recv_fds"):
+            raise OSError("Resident process requires 'fork' and Unix sockets, which aren't available on this system!")
+        if forward_ready(self.path):
+            raise OSError(f"Resident process is already running on '{self.path}'!")
+        self.path.unlink(missing_ok=True)
+        # Stopping it with 'kill' also removes its socket
+        signal.signal(signal.SIGTERM, stop)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(self.path))
+            server.listen()
+            try:
+                while True:
+                    connection, _ = server.accept()
+                    with connection:
+                        try:
+                            self.handle_connection(server, connection)
+                        except OSError:
+                            # A client that disconnects too early (or a failed 'fork') never stops the resident process
+                            pass
+                    self.reap_children()
+            except (KeyboardInterrupt, SystemExit):
+                pass
+            finally:
+                self.path.unlink(missing_ok=True)
+
+    def handle_connection(self, server: socket.socket, connection: socket.socket) -> None:
+        """Receives a forwarded command and runs it in a forked process"""
+        header, fds, _, _ = socket.recv_fds(connection, HEADER_SIZE, 3)
+        try:
+            if len(header) < HEADER_SIZE or len(fds) != 3:
+                return
+            try:
+                request: Any = json.loads(receive_exactly(connection, int.from_bytes(header, "big")))
+            except ValueError:
+                return
+            # Malformed requests are dropped, just like incomplete ones
+            if not isinstance(request, dict) or any(key not in request for key in ["args", "cwd", "environ"]):
+                return
+            # Catalog changes made by earlier commands are loaded before forking
+            self.reload()
+            # Nothing buffered in this process can be written to the client's output
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                server.close()
+                self.run_child(connection, request, fds)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def run_child(self, connection: socket.socket, request: dict, fds: list[int]) -> None:
+        """Runs a command just like 'project.py' would, with the client's directory, environment and standard streams"""
+        exit_code: int = 1
+        try:
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["environ"])
+            from .data_manager import CatalogLoader, configure_history, flush_log
+            from .data_models import DataStore
+            configure_history(os.environ.get("UNIT_CONVERTER_HISTORY", "files"))
+            # Without a valid catalog, each dataset is loaded when it's first used, so errors are the same of 'project.py'
+            data: Any = self.data if self.data is not None else DataStore(loader=CatalogLoader())
+            try:
+                exit_code = self.run(data, ["project.py", *request["args"]])
+            except SystemExit as e:
+                # Same exit codes used by Python ('argparse' errors exit with code 2)
+                if e.code is None or isinstance(e.code, int):
+                    exit_code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+            flush_log()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            connection.sendall(exit_code.to_bytes(EXIT_CODE_SIZE, "big", signed=True))
+        finally:
+            # Forked process never returns to the server's loop
+            os._exit(exit_code)
+
+    def reap_children(self) -> None:
+        """Collects exit status of every forked process that already finished"""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+
+def forward_ready(path: Path) -> bool:
+    """Checks whether a resident process is accepting connections on that socket"""
+    if not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+
+def stop(signal_number: int, frame: Any) -> None:
+    """Stops the resident process, just like Ctrl+C does"""
+    raise KeyboardInterrupt
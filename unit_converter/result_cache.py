@@ -0,0 +1,60 @@
+import threading
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResultCache:
+    """Keeps the most recently used conversion results, counting hits, misses and evictions"""
+    def __init__(self, max_size: int=0):
+        # Entries are kept from the least to the most recently used
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        # Requests from many threads can share the same cache
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.configure(max_size)
+
+    def configure(self, max_size: int=0) -> None:
+        """Changes the maximum number of results kept ('0' disables the cache)"""
+        if max_size < 0:
+            raise ValueError("'max_size' can't be a negative number!")
+        self.max_size = max_size
+        with self.lock:
+            self._evict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Gets a cached result (or 'None'), marking it as the most recently used"""
+        with self.lock:
+            value: Optional[Any] = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches a result, evicting the least recently used ones when the cache is full"""
+        if not self.max_size:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """Drops all cached results (counters are kept)"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Gets current size, maximum size and all counters"""
+        return {"size": len(self.entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def _evict(self) -> None:
+        """Drops least recently used results until the cache fits its maximum size"""
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+from typing import Any, Optional
+
+from .api import Converter
+from .data_manager import LOG_WRITER
+
+
+# Actions available to clients, and the 'Converter' arguments each one accepts
+SERVER_ACTIONS = {
+    "convert": ["unit_group", "user_input", "print_message", "log"],
+    "types": ["unit_group"],
+    "groups": [],
+    "history": ["limit", "unit_group", "since", "until", "unit_type"]
+}
+# Actions that read from disk, so they run on a worker thread instead of blocking the event loop
+BLOCKING_ACTIONS = ["history"]
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class ConversionServer:
+    """Answers JSON requests from many clients at once, keeping a single 'Converter' loaded in memory"""
+    def __init__(self, converter: Optional[Converter]=None):
+        self.converter = converter if converter is not None else Converter()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def warm_up(self) -> None:
+        """Loads every dataset, conversion ratios and the log writer thread before the first request"""
+        for name in ["units", "base_units", "unit_aliases", "month_days", "original_units", "month_aliases"]:
+            getattr(self.converter, name)
+        self.converter.engine
+        LOG_WRITER.start()
+
+    async def start(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, path: Optional[str]=None) -> asyncio.AbstractServer:
+        """Starts listening on a Unix socket ('path') or on a TCP port"""
+        self.warm_up()
+        if path:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host=host, port=port)
+        return self.server
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answers each request line of a client with one response line, in the same order"""
+        try:
+            while True:
+                try:
+                    line: bytes = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Lines over the reader's limit can't be told apart from the next request, so the connection is closed
+                    writer.write(json.dumps({"error": "Request line is too long!"}).encode() + b"\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response: dict = await self.handle_line(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            # Waits for the transport to close, so no connection is left half-open
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_line(self, line: bytes) -> dict:
+        """Decodes a single JSON request and runs it"""
+        try:
+            request: Any = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {"error": "Invalid JSON request!"}
+        if not isinstance(request, dict):
+            return {"error": "Request must be a JSON object!"}
+        response: dict = await self.handle_request(request)
+        # Echoes request's 'id', so that clients can match responses to requests
+        if "id" in request:
+            response = {"id": request["id"], **response}
+        return response
+
+    async def handle_request(self, request: dict) -> dict:
+        """Runs a request's action, returning either its 'result' or an 'error'"""
+        action = request.get("action")
+        if action not in SERVER_ACTIONS:
+            return {"error": f"Invalid action: '{action}'!"}
+        arguments: dict = {key: value for key, value in request.items() if key not in ["id", "action"]}
+        invalid: list[str] = [key for key in arguments if key not in SERVER_ACTIONS[action]]
+        if invalid:
+            return {"error": f"Invalid arguments for '{action}': {', '.join(invalid)}"}
+        method = getattr(self.converter, action)
+        try:
+            # Conversions only queue their log entries, unless the log writer was set to write them right away
+            if action in BLOCKING_ACTIONS or (action == "convert" and LOG_WRITER.sync):
+                result = await asyncio.to_thread(method, **arguments)
+            else:
+                result = method(**arguments)
+        except TypeError as e:
+            return {"error": str(e)}
+        # 'Converter' methods return their errors as messages
+        if isinstance(result, str) and result.startswith("Error: "):
+            return {"error": result.removeprefix("Error: ")}
+        return {"result": result}
+
+    async def serve_forever(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, path: Optional[str]=None) -> None:
+        """Starts the server and keeps it running until it's cancelled"""
+        server: asyncio.AbstractServer = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+
+def serve(host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, path: Optional[str]=None, cache_size: int=0) -> None:
+    """Runs a conversion server until it's interrupted (Ctrl+C)"""
+    server: ConversionServer = ConversionServer()
+    server.converter.configure_cache(cache_size)
+    try:
+        asyncio.run(server.serve_forever(host, port, path))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,265 @@
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Optional, TextIO
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only required for binary conversions
+    np = None  # type: ignore[assignment]
+
+from .data_manager import CatalogLoader
+from .data_models import DataStore
+from .utils import validate_unit_group, resolve_aliases
+
+
+# File formats supported by 'convert-file' command
+FILE_FORMATS = ["csv", "jsonl"]
+# Number of bytes converted by each task, when converting a file with many workers
+CHUNK_SIZE = 16 * 1024 * 1024
+# Binary value types supported by 'convert-binary' command
+BINARY_TYPES = ["float64", "float32"]
+# Number of values converted at a time in binary files
+BINARY_CHUNK_SIZE = 1024 * 1024
+# Unit catalog of each worker process, loaded once by 'init_worker'
+WORKER_DATA: Optional[DataStore] = None
+
+
+def get_file_format(path: Optional[str], file_format: Optional[str]=None) -> str:
+    """Gets file format, from 'file_format' or from the file's extension"""
+    if file_format is None and path not in [None, "-"]:
+        file_format = Path(path).suffix.lstrip(".")  # type: ignore[arg-type]
+    if file_format is None or file_format.lower() not in FILE_FORMATS:
+        raise ValueError(f"Invalid file format! Usage: {' or '.join(FILE_FORMATS)} (use '--format' for other extensions or for stdin)")
+    return file_format.lower()
+
+
+def read_rows(file: TextIO, file_format: str) -> Iterator[Any]:
+    """Reads rows from a CSV or JSONL file, one at a time"""
+    if file_format == "csv":
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        if line.strip():
+            # Lines that can't be decoded are passed on as their error, so 'convert_rows' reports them in place
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield e
+
+
+def convert_rows(data: DataStore, rows: Iterable[Any], unit_group: Optional[str]=None, from_type: Optional[str]=None, to_type: Optional[str]=None, column: str="amount") -> Iterator[dict]:
+    """Converts rows one at a time, adding their 'result' (or 'error') to each of them"""
+    # Resolved unit types for each '(unit_group, from_type, to_type)' already seen
+    resolved: dict[tuple, tuple[str, str, str]] = {}
+    for row in rows:
+        # Rows that aren't objects can't be converted, so they are reported without stopping the stream
+        if isinstance(row, json.JSONDecodeError):
+            yield {"result": None, "error": f"Invalid JSON row! ({row.msg})"}
+            continue
+        if not isinstance(row, dict):
+            yield {"row": row, "result": None, "error": "Row must be a JSON object!"}
+            continue
+        try:
+            key: tuple = (unit_group or row.get("group"), from_type or row.get("from"), to_type or row.get("to"))
+            if key not in resolved:
+                resolved[key] = resolve_pair(data, *key)
+            row_group, row_from, row_to = resolved[key]
+            if row.get(column) is None:
+                raise KeyError(f"Missing '{column}' column!")
+            amount: float = float(row[column])
+            # Prevents negative value for "Kelvin"
+            if row_group == "temperature" and row_from == "kelvin" and amount < 0:
+                raise ValueError("Kelvin temperature cannot be negative!")
+            row["result"] = data.engine.convert(row_group, row_from, row_to, amount)
+        except (ValueError, KeyError, TypeError, ZeroDivisionError) as e:
+            row["result"] = None
+            row["error"] = e.args[0] if e.args else str(e)
+        yield row
+
+
+def resolve_pair(data: DataStore, unit_group: Optional[str], from_type: Optional[str], to_type: Optional[str]) -> tuple[str, str, str]:
+    """Validates unit group and resolves aliases of both unit types"""
+    if not from_type or not to_type:
+        raise ValueError("Missing unit types! Use 'from' and 'to' columns, or '--from' and '--to' options")
+    unit_group = unit_group.lower() if unit_group else None
+    validate_unit_group(unit_group, data)
+    return unit_group, resolve_aliases(data, unit_group, from_type.lower()), resolve_aliases(data, unit_group, to_type.lower())  # type: ignore[arg-type, return-value]
+
+
+def write_rows(rows: Iterable[dict], file: TextIO, file_format: str, fieldnames: Optional[list[str]]=None, write_header: bool=True) -> tuple[int, int]:
+    """Writes each row as soon as it's converted, returning how many rows were written and how many failed"""
+    count: int = 0
+    errors: int = 0
+    writer: Optional[csv.DictWriter] = None
+    for row in rows:
+        if file_format == "csv":
+            # Unless they are given, columns are taken from the first row
+            if writer is None:
+                writer = csv.DictWriter(file, fieldnames=fieldnames or get_fieldnames(list(row)), restval="", extrasaction="ignore")
+                if write_header:
+                    writer.writeheader()
+            writer.writerow(row)
+        else:
+            file.write(json.dumps(row) + "\n")
+        count += 1
+        if row.get("error"):
+            errors += 1
+    return count, errors
+
+
+def get_fieldnames(columns: list[str]) -> list[str]:
+    """Gets output columns: all input columns, then 'result' and 'error'"""
+    return [column for column in columns if column not in ["result", "error"]] + ["result", "error"]
+
+
+def convert_file(data: DataStore, input_path: str, output_path: Optional[str]=None, file_format: Optional[str]=None, unit_group: Optional[str]=None, from_type: Optional[str]=None, to_type: Optional[str]=None, column: str="amount") -> tuple[int, int]:
+    """Converts a whole CSV or JSONL file ('-' for stdin) row by row, writing results to another file (or stdout)"""
+    input_format: str = get_file_format(input_path, file_format)
+    output_format: str = get_file_format(output_path, file_format) if output_path not in [None, "-"] else input_format
+    input_file: TextIO = sys.stdin if input_path == "-" else open(input_path, "r", newline="")
+    try:
+        output_file: TextIO = sys.stdout if output_path in [None, "-"] else open(output_path, "w", newline="")  # type: ignore[arg-type]
+        try:
+            rows: Iterator[dict] = convert_rows(data, read_rows(input_file, input_format), unit_group, from_type, to_type, column)
+            return write_rows(rows, output_file, output_format)
+        finally:
+            if output_file is not sys.stdout:
+                output_file.close()
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+
+def convert_file_parallel(input_path: str, output_path: Optional[str]=None, workers: int=2, file_format: Optional[str]=None, unit_group: Optional[str]=None, from_type: Optional[str]=None, to_type: Optional[str]=None, column: str="amount", chunk_size: int=CHUNK_SIZE) -> tuple[int, int]:
+    """Converts a whole CSV or JSONL file in byte-range chunks, using many worker processes, keeping rows in order"""
+    if workers < 1:
+        raise ValueError("'workers' must be a positive number!")
+    if input_path == "-":
+        raise ValueError("Input file can't be stdin when using many workers!")
+    input_format: str = get_file_format(input_path, file_format)
+    output_format: str = get_file_format(output_path, file_format) if output_path not in [None, "-"] else input_format
+    if output_format != input_format:
+        raise ValueError("Input and output files must have the same format when using many workers!")
+    # CSV header is read once, and sent to every worker
+    header: Optional[list[str]] = None
+    start: int = 0
+    if input_format == "csv":
+        with open(input_path, "rb") as file:
+            header = next(csv.reader([file.readline().decode()]), None)
+            start = file.tell()
+    output_file: TextIO = sys.stdout if output_path in [None, "-"] else open(output_path, "w", newline="")  # type: ignore[arg-type]
+    count: int = 0
+    errors: int = 0
+    try:
+        if header is not None:
+            csv.DictWriter(output_file, fieldnames=get_fieldnames(header)).writeheader()
+        # Workers are started fresh ('spawn'), since forking while the log writer thread runs may deadlock them
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker) as executor:
+            # Chunks are written in the same order they were read, keeping only a few of them in memory
+            pending: deque[Future] = deque()
+            for chunk_start, chunk_end in split_chunks(input_path, start, chunk_size):
+                pending.append(executor.submit(convert_chunk, input_path, chunk_start, chunk_end, input_format, output_format, header, unit_group, from_type, to_type, column))
+                if len(pending) >= workers * 2:
+                    text, chunk_count, chunk_errors = pending.popleft().result()
+                    output_file.write(text)
+                    count, errors = count + chunk_count, errors + chunk_errors
+            while pending:
+                text, chunk_count, chunk_errors = pending.popleft().result()
+                output_file.write(text)
+                count, errors = count + chunk_count, errors + chunk_errors
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+    return count, errors
+
+
+def split_chunks(path: str, start: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Splits a file into '(start, end)' byte ranges of about 'chunk_size' bytes, always ending at a line break"""
+    size: int = os.path.getsize(path)
+    with open(path, "rb") as file:
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            # Moves to the end of the current line, so that no row is split
+            file.readline()
+            end: int = file.tell()
+            yield start, end
+            start = end
+
+
+def init_worker() -> None:
+    """Loads unit catalog once in each worker process"""
+    global WORKER_DATA
+    WORKER_DATA = DataStore(loader=CatalogLoader())
+
+
+def convert_chunk(path: str, start: int, end: int, input_format: str, output_format: str, header: Optional[list[str]], unit_group: Optional[str], from_type: Optional[str], to_type: Optional[str], column: str) -> tuple[str, int, int]:
+    """Converts all rows in a byte range of a file, returning them already formatted"""
+    with open(path, "rb") as file:
+        file.seek(start)
+        text: str = file.read(end - start).decode()
+    rows: Iterator[dict] = csv.DictReader(io.StringIO(text, newline=""), fieldnames=header) if input_format == "csv" else read_rows(io.StringIO(text), input_format)
+    output = io.StringIO(newline="")
+    count, errors = write_rows(convert_rows(WORKER_DATA, rows, unit_group, from_type, to_type, column), output, output_format, get_fieldnames(header) if header else None, write_header=False)  # type: ignore[arg-type]
+    return output.getvalue(), count, errors
+
+
+def convert_binary_file(data: DataStore, input_path: str, unit_group: str, from_type: str, to_type: str, output_path: Optional[str]=None, dtype: str="float64") -> int:
+    """Converts a raw float file or '.npy' array through memory maps, in place or into another file, returning how many values were converted"""
+    if np is None:
+        raise ImportError("Binary conversions require NumPy! Install it with 'pip install numpy'")
+    unit_group, from_type, to_type = resolve_pair(data, unit_group, from_type, to_type)
+    scale, offset = data.engine.coefficients(unit_group, from_type, to_type)
+    source = open_binary(input_path, dtype, "r" if output_path else "r+")
+    # Prevents negative value for "Kelvin", before any value is changed
+    if unit_group == "temperature" and from_type == "kelvin":
+        for start in range(0, source.size, BINARY_CHUNK_SIZE):
+            if (source[start:start + BINARY_CHUNK_SIZE] < 0).any():
+                raise ValueError("Kelvin temperature cannot be negative!")
+    # Empty files can't be mapped
+    if source.size == 0:
+        if output_path is not None:
+            if output_path.endswith(".npy"):
+                np.save(output_path, source)
+            else:
+                open(output_path, "wb").close()
+        return 0
+    if output_path is None:
+        target = source
+    elif output_path.endswith(".npy"):
+        target = np.lib.format.open_memmap(output_path, mode="w+", dtype=source.dtype, shape=source.shape, fortran_order=not source.flags.c_contiguous)
+    else:
+        target = np.memmap(output_path, dtype=source.dtype, mode="w+", shape=source.shape)
+    # Values are converted a chunk at a time, straight from one map into the other (order "A" keeps both of them as views)
+    flat_source, flat_target = source.reshape(-1, order="A"), target.reshape(-1, order="A")
+    for start in range(0, flat_source.size, BINARY_CHUNK_SIZE):
+        chunk = flat_target[start:start + BINARY_CHUNK_SIZE]
+        np.multiply(flat_source[start:start + BINARY_CHUNK_SIZE], scale, out=chunk)
+        if offset:
+            np.add(chunk, offset, out=chunk)
+    if isinstance(target, np.memmap):
+        target.flush()
+    return int(flat_source.size)
+
+
+def open_binary(path: str, dtype: str, mode: Literal["r", "r+"]):
+    """Maps a '.npy' array, or a raw file of 'dtype' values, into memory"""
+    if path.endswith(".npy"):
+        array = np.load(path, mmap_mode=mode)
+        if array.dtype.kind != "f":
+            raise ValueError(f"Invalid array type: '{array.dtype}'! Only float arrays can be converted")
+        return array
+    if dtype not in BINARY_TYPES:
+        raise ValueError(f"Invalid value type: '{dtype}'! Usage: {' or '.join(BINARY_TYPES)}")
+    if os.path.getsize(path) % np.dtype(dtype).itemsize != 0:
+        raise ValueError(f"File size isn't a multiple of a '{dtype}' value size!")
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode)
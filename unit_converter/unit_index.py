@@ -0,0 +1,78 @@
+class UnitIndex:
+    """Maps every unit type and alias of all groups to its canonical unit type in each group, and every unit type to its aliases"""
+    def __init__(self, units: dict, unit_aliases: dict):
+        self.units = units
+        self.unit_aliases = unit_aliases
+        # Maps each unit type or alias to a 'unit_group' -> canonical unit type table
+        self.names: dict[str, dict[str, str]] = {}
+        # Maps each unit group's unit types to their aliases (dict keys keep aliases in insertion order)
+        self.aliases: dict[str, dict[str, dict[str, None]]] = {}
+        for unit_group in units:
+            self._add_group(unit_group)
+
+    def build_group(self, unit_group: str) -> None:
+        """(Re)indexes all unit types and aliases of a single unit group"""
+        self.remove_group(unit_group)
+        self._add_group(unit_group)
+
+    def _add_group(self, unit_group: str) -> None:
+        """Indexes all unit types and aliases of a unit group that isn't indexed yet"""
+        for alias, unit_type in self.unit_aliases.get(unit_group, {}).items():
+            self.add_alias(alias, unit_group, unit_type)
+        # Literal unit types take precedence over aliases, just like 'resolve_aliases'
+        for unit_type in self.units[unit_group]:
+            self.add(unit_type, unit_group, unit_type)
+
+    def remove_group(self, unit_group: str) -> None:
+        """Drops all unit types and aliases of a single unit group"""
+        for name in [name for name, groups in self.names.items() if unit_group in groups]:
+            self.remove(name, unit_group)
+        self.aliases.pop(unit_group, None)
+
+    def add(self, name: str, unit_group: str, unit_type: str) -> None:
+        """Indexes a unit type or alias of a unit group"""
+        self.names.setdefault(name, {})[unit_group] = unit_type
+
+    def remove(self, name: str, unit_group: str) -> None:
+        """Drops a unit type or alias of a unit group"""
+        groups: dict[str, str] = self.names.get(name, {})
+        groups.pop(unit_group, None)
+        if not groups:
+            self.names.pop(name, None)
+
+    def add_alias(self, alias: str, unit_group: str, unit_type: str) -> None:
+        """Indexes an alias of a unit type, both by its name and by its unit type"""
+        self.add(alias, unit_group, unit_type)
+        self.aliases.setdefault(unit_group, {}).setdefault(unit_type, {})[alias] = None
+
+    def remove_alias(self, alias: str, unit_group: str, unit_type: str) -> None:
+        """Drops an alias of a unit type"""
+        self.remove(alias, unit_group)
+        self.aliases.get(unit_group, {}).get(unit_type, {}).pop(alias, None)
+
+    def remove_type(self, unit_group: str, unit_type: str) -> list[str]:
+        """Drops a unit type and all its aliases, returning those aliases"""
+        aliases: list[str] = list(self.aliases.get(unit_group, {}).pop(unit_type, {}))
+        for name in [unit_type, *aliases]:
+            self.remove(name, unit_group)
+        return aliases
+
+    def aliases_of(self, unit_group: str, unit_type: str) -> list[str]:
+        """Gets all aliases of a unit type, in the order they were added"""
+        return list(self.aliases.get(unit_group, {}).get(unit_type, {}))
+
+    def infer_group(self, from_type: str, to_type: str) -> str:
+        """Finds the only unit group with both unit types (or their aliases)"""
+        for unit_type in (from_type, to_type):
+            if unit_type not in self.names:
+                raise KeyError(f"Unit type '{unit_type}' not found in any group!")
+        to_groups: dict[str, str] = self.names[to_type]
+        unit_groups: list[str] = [unit_group for unit_group in self.names[from_type] if unit_group in to_groups]
+        if not unit_groups:
+            raise ValueError(f"'{from_type}' and '{to_type}' don't belong to the same unit group!")
+        if len(unit_groups) > 1:
+            raise ValueError(f"'{from_type}' and '{to_type}' belong to many unit groups ({', '.join(unit_groups)})! Enter a unit group")
+        return unit_groups[0]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names